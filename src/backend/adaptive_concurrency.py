@@ -0,0 +1,166 @@
+"""
+Polka-Trinity Adaptive Concurrency
+AIMD concurrency limits for flagship model admission.
+
+Each model gets its own limit. Every request that completes within the
+model's latency target grows the limit additively (about one slot per
+full window of requests); a slow response, or an error that points at
+an overloaded node (timeouts, connection failures, 5xx, 429), shrinks it
+multiplicatively. Other errors, such as an open circuit or a rejected
+request, leave the limit unchanged. The limit is applied to the model's
+priority admission scheduler, so the coordinator never pushes more work
+at Ollama than it can serve without queueing internally.
+
+Flagship generations run for minutes and their length depends on
+``num_predict``, so whole-request latency says little about load. In
+per-token mode the target is a decode latency per output token, taken
+from the generation metadata the slot body reports.
+"""
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from prometheus_client import Gauge
+
+from .model_endpoints import is_endpoint_failure
+from .priority_scheduler import PriorityAdmissionScheduler
+from .upstream_policy import UpstreamStatusError
+
+logger = logging.getLogger(__name__)
+
+# Adaptive concurrency metrics
+CONCURRENCY_LIMIT = Gauge('trinity_concurrency_limit', 'Current adaptive concurrency limit', ['model'])
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error says the model is overloaded (a 4xx or open circuit does not)"""
+    if isinstance(error, UpstreamStatusError) and error.status == 429:
+        return True
+    return is_endpoint_failure(error)
+
+
+class LatencySample:
+    """Latency reported from inside a limiter slot"""
+
+    __slots__ = ("seconds_per_token",)
+
+    def __init__(self):
+        self.seconds_per_token: Optional[float] = None
+
+    def report(self, seconds_per_token: Optional[float]) -> None:
+        """Record the generation's decode latency per output token"""
+        self.seconds_per_token = seconds_per_token
+
+
+class AIMDConcurrencyLimiter:
+    """Additive-increase / multiplicative-decrease limit over a priority scheduler"""
+
+    def __init__(self,
+                 name: str,
+                 latency_target_seconds: float,
+                 initial_limit: int = 4,
+                 min_limit: int = 1,
+                 max_limit: int = 10,
+                 backoff_ratio: float = 0.7,
+                 decrease_cooldown_seconds: float = 5.0,
+                 aging_seconds: float = 10.0,
+                 per_token: bool = False,
+                 is_overload: Callable[[BaseException], bool] = is_overload_error):
+        """
+        Args:
+            name: Model name used for metrics and logging
+            latency_target_seconds: Generation latency considered healthy
+                (per output token when ``per_token`` is set)
+            initial_limit: Starting concurrency
+            min_limit: Lower bound the limit never drops below
+            max_limit: Upper bound the limit never grows beyond
+            backoff_ratio: Factor applied to the limit on overload
+            decrease_cooldown_seconds: Minimum spacing between decreases, so one
+                burst of slow in-flight responses counts as a single signal
+            aging_seconds: Priority aging passed to the admission scheduler
+            per_token: Judge slots by the decode latency reported to their
+                LatencySample; slots that report none leave the limit unchanged
+            is_overload: Which exceptions raised inside a slot shrink the limit
+        """
+        self.name = name
+        self.latency_target_seconds = latency_target_seconds
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.per_token = per_token
+        self.is_overload = is_overload
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.scheduler = PriorityAdmissionScheduler(int(self.limit), aging_seconds=aging_seconds)
+        self._last_decrease = float("-inf")
+        self.increases = 0
+        self.decreases = 0
+        CONCURRENCY_LIMIT.labels(model=name).set(int(self.limit))
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[LatencySample]:
+        """Admit a request by priority and feed its latency back into the limit"""
+        sample = LatencySample()
+        async with self.scheduler.slot(priority):
+            start = time.monotonic()
+            try:
+                yield sample
+            except Exception as e:
+                if self.is_overload(e):
+                    self.on_error()
+                raise
+            if not self.per_token:
+                self.on_success(time.monotonic() - start)
+            elif sample.seconds_per_token is not None:
+                self.on_success(sample.seconds_per_token)
+
+    def on_success(self, latency_seconds: float) -> None:
+        """Grow the limit for a healthy response, shrink it for a slow one"""
+        if latency_seconds > self.latency_target_seconds:
+            self._decrease(f"latency {latency_seconds:.3f}s over {self.latency_target_seconds:.3f}s target")
+            return
+
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        self.increases += 1
+        self._apply()
+
+    def on_error(self) -> None:
+        """Treat an overloaded generation as a backoff signal"""
+        self._decrease("model error")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown_seconds:
+            return
+
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        self.decreases += 1
+        logger.info(f"📉 {self.name} concurrency limit reduced to {int(self.limit)} ({reason})")
+        self._apply()
+
+    def _apply(self) -> None:
+        limit = int(self.limit)
+        if limit != self.scheduler.max_concurrent:
+            self.scheduler.set_limit(limit)
+            CONCURRENCY_LIMIT.labels(model=self.name).set(limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Limiter and admission state for monitoring"""
+        return {
+            **self.scheduler.stats(),
+            "latency_target_seconds": self.latency_target_seconds,
+            "per_token": self.per_token,
+            "limit_bounds": [self.min_limit, self.max_limit],
+            "increases": self.increases,
+            "decreases": self.decreases
+        }
+
+
+__all__ = [
+    "AIMDConcurrencyLimiter",
+    "LatencySample",
+    "is_overload_error"
+]
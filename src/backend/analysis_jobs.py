@@ -0,0 +1,372 @@
+"""
+Polka-Trinity Analysis Job Queue
+Background execution of Ultimate AI Trinity analyses.
+
+Full Trinity analyses regularly outlive proxy and client timeouts, so
+clients can submit a job, receive its ID immediately and poll for the
+result. Worker tasks drain the queue; the in-process asyncio backend is
+the default and the Redis backend lets several API workers share a queue.
+
+Redis workers move a job ID into their own processing list instead of
+popping it, and remove it only once the job has finished. Each consumer
+keeps a heartbeat key alive; jobs left in the processing lists of a
+consumer whose heartbeat expired (crash, restart) are requeued, or marked
+failed once they have used up their attempts.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # Redis backend is optional
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(Enum):
+    """Lifecycle states of an analysis job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class AnalysisJob:
+    """Queued referendum analysis and its outcome"""
+    job_id: str
+    referendum_id: int
+    request: Dict[str, Any]
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible representation"""
+        data = asdict(self)
+        data["status"] = self.status.value
+        for name in ("created_at", "started_at", "completed_at"):
+            data[name] = data[name].isoformat() if data[name] else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AnalysisJob":
+        """Rebuild a job from its JSON representation"""
+        data = dict(data)
+        data["status"] = JobStatus(data["status"])
+        for name in ("created_at", "started_at", "completed_at"):
+            data[name] = datetime.fromisoformat(data[name]) if data[name] else None
+        return cls(**data)
+
+
+class InMemoryJobBackend:
+    """Single-process job backend built on asyncio.Queue"""
+
+    name = "memory"
+
+    def __init__(self, max_finished_jobs: int = 1000):
+        self.max_finished_jobs = max_finished_jobs
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+
+    async def enqueue(self, job: AnalysisJob) -> None:
+        await self.save(job)
+        await self._queue.put(job.job_id)
+
+    async def dequeue(self, timeout: float, worker: int = 0) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def ack(self, job_id: str, worker: int = 0) -> None:
+        pass
+
+    async def heartbeat(self) -> None:
+        pass
+
+    async def recover(self, max_attempts: int) -> int:
+        # Queue and jobs live and die with this process
+        return 0
+
+    async def save(self, job: AnalysisJob) -> None:
+        self._jobs[job.job_id] = job
+        self._jobs.move_to_end(job.job_id)
+        self._prune()
+
+    async def load(self, job_id: str) -> Optional[AnalysisJob]:
+        return self._jobs.get(job_id)
+
+    async def depth(self) -> int:
+        return self._queue.qsize()
+
+    async def close(self) -> None:
+        pass
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond the retention limit"""
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+        ]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+
+class RedisJobBackend:
+    """Redis list + key backend shared by every API worker"""
+
+    name = "redis"
+
+    def __init__(self,
+                 redis_client: Any,
+                 key_prefix: str = "polka-trinity:jobs:",
+                 job_ttl_seconds: int = 86400,
+                 heartbeat_ttl_seconds: int = 90):
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.queue_key = f"{key_prefix}queue"
+        self.job_ttl_seconds = job_ttl_seconds
+        self.heartbeat_ttl_seconds = heartbeat_ttl_seconds
+        self.consumer_id = uuid.uuid4().hex
+
+    @classmethod
+    def from_url(cls, redis_url: str, **kwargs) -> "RedisJobBackend":
+        if redis_asyncio is None:
+            raise RuntimeError("redis package is required for the Redis job backend")
+        return cls(redis_asyncio.from_url(redis_url), **kwargs)
+
+    async def enqueue(self, job: AnalysisJob) -> None:
+        await self.save(job)
+        await self.redis.lpush(self.queue_key, job.job_id)
+
+    def _processing_key(self, worker: int, consumer_id: Optional[str] = None) -> str:
+        return f"{self.key_prefix}processing:{consumer_id or self.consumer_id}:{worker}"
+
+    def _heartbeat_key(self, consumer_id: str) -> str:
+        return f"{self.key_prefix}consumer:{consumer_id}"
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def dequeue(self, timeout: float, worker: int = 0) -> Optional[str]:
+        # The ID stays in this worker's processing list until ack()
+        job_id = await self.redis.blmove(
+            self.queue_key, self._processing_key(worker), max(1, int(timeout)), "RIGHT", "LEFT"
+        )
+        return self._decode(job_id) if job_id else None
+
+    async def ack(self, job_id: str, worker: int = 0) -> None:
+        await self.redis.lrem(self._processing_key(worker), 1, job_id)
+
+    async def heartbeat(self) -> None:
+        await self.redis.set(self._heartbeat_key(self.consumer_id), 1, ex=self.heartbeat_ttl_seconds)
+
+    async def recover(self, max_attempts: int) -> int:
+        """Requeue jobs held by consumers whose heartbeat expired"""
+        recovered = 0
+        prefix = f"{self.key_prefix}processing:"
+        async for key in self.redis.scan_iter(match=f"{prefix}*"):
+            key = self._decode(key)
+            consumer_id = key[len(prefix):].rsplit(":", 1)[0]
+            if consumer_id == self.consumer_id or await self.redis.exists(self._heartbeat_key(consumer_id)):
+                continue
+            recovered += await self._requeue(key, max_attempts)
+        return recovered
+
+    async def _requeue(self, processing_key: str, max_attempts: Optional[int]) -> int:
+        """Move a processing list's jobs back to the front of the queue
+
+        Jobs that already ran ``max_attempts`` times are marked failed
+        instead; ``None`` always requeues (graceful shutdown).
+        """
+        requeued = 0
+        while True:
+            job_id = await self.redis.lmove(processing_key, self.queue_key, "RIGHT", "RIGHT")
+            if job_id is None:
+                return requeued
+            job_id = self._decode(job_id)
+            job = await self.load(job_id)
+            if job is None:
+                await self.redis.lrem(self.queue_key, 1, job_id)
+                continue
+
+            if max_attempts is not None and job.attempts >= max_attempts:
+                await self.redis.lrem(self.queue_key, 1, job_id)
+                job.status = JobStatus.FAILED
+                job.error = f"Worker lost during {job.attempts} attempts"
+                job.completed_at = datetime.now(timezone.utc)
+                logger.error(f"❌ Analysis job {job_id} abandoned after {job.attempts} lost workers")
+            else:
+                job.status = JobStatus.QUEUED
+                job.started_at = None
+                requeued += 1
+                logger.warning(f"♻️ Analysis job {job_id} requeued after its worker was lost")
+            await self.save(job)
+
+    async def save(self, job: AnalysisJob) -> None:
+        await self.redis.set(
+            f"{self.key_prefix}{job.job_id}",
+            json.dumps(job.to_dict(), default=str),
+            ex=self.job_ttl_seconds
+        )
+
+    async def load(self, job_id: str) -> Optional[AnalysisJob]:
+        data = await self.redis.get(f"{self.key_prefix}{job_id}")
+        if data is None:
+            return None
+        return AnalysisJob.from_dict(json.loads(data))
+
+    async def depth(self) -> int:
+        return await self.redis.llen(self.queue_key)
+
+    async def close(self) -> None:
+        # Hand this consumer's interrupted jobs back before disconnecting
+        async for key in self.redis.scan_iter(match=f"{self.key_prefix}processing:{self.consumer_id}:*"):
+            await self._requeue(self._decode(key), max_attempts=None)
+        await self.redis.delete(self._heartbeat_key(self.consumer_id))
+        await self.redis.close()
+
+
+class AnalysisJobQueue:
+    """Submit analysis jobs and drain them with background workers"""
+
+    def __init__(self,
+                 backend: Any,
+                 handler: Callable[[AnalysisJob], Awaitable[Dict[str, Any]]],
+                 worker_count: int = 2,
+                 poll_timeout: float = 1.0,
+                 recovery_interval: float = 30.0,
+                 max_attempts: int = 3):
+        self.backend = backend
+        self.handler = handler
+        self.worker_count = worker_count
+        self.poll_timeout = poll_timeout
+        self.recovery_interval = recovery_interval  # Heartbeat and orphaned-job sweep period
+        self.max_attempts = max_attempts  # Runs a job may lose to dead workers before it fails
+        self._workers: List[asyncio.Task] = []
+        self._maintenance: Optional[asyncio.Task] = None
+        self.recovered = 0
+        self.completed = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Start worker tasks"""
+        await self.backend.heartbeat()
+        self._maintenance = asyncio.create_task(self._maintain())
+        self._workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(self.worker_count)
+        ]
+        logger.info(f"📬 Analysis job queue started - {self.worker_count} workers ({self.backend.name} backend)")
+
+    async def stop(self) -> None:
+        """Cancel workers and release the backend"""
+        tasks = self._workers + ([self._maintenance] if self._maintenance else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._maintenance = None
+        await self.backend.close()
+
+    async def submit(self, referendum_id: int, request: Dict[str, Any]) -> AnalysisJob:
+        """Queue an analysis and return its job record immediately"""
+        job = AnalysisJob(job_id=uuid.uuid4().hex, referendum_id=referendum_id, request=request)
+        await self.backend.enqueue(job)
+        logger.info(f"📥 Analysis job {job.job_id} queued for referendum #{referendum_id}")
+        return job
+
+    async def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Current state of a job, if known"""
+        return await self.backend.load(job_id)
+
+    async def _maintain(self) -> None:
+        """Keep this consumer's heartbeat alive and requeue jobs of dead consumers"""
+        while True:
+            try:
+                await self.backend.heartbeat()
+                recovered = await self.backend.recover(self.max_attempts)
+                if recovered:
+                    self.recovered += recovered
+                    logger.info(f"♻️ Requeued {recovered} analysis jobs from lost workers")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Analysis job recovery error: {str(e)}")
+            await asyncio.sleep(self.recovery_interval)
+
+    async def _worker(self, index: int) -> None:
+        """Drain the queue, running one analysis at a time"""
+        while True:
+            try:
+                job_id = await self.backend.dequeue(self.poll_timeout, index)
+                if job_id is None:
+                    continue
+
+                job = await self.backend.load(job_id)
+                if job is None:
+                    logger.warning(f"⚠️ Analysis job {job_id} expired before a worker picked it up")
+                else:
+                    await self._run(job)
+                await self.backend.ack(job_id, index)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Analysis job worker {index} error: {str(e)}")
+                await asyncio.sleep(self.poll_timeout)
+
+    async def _run(self, job: AnalysisJob) -> None:
+        """Execute a job and persist its outcome"""
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        job.attempts += 1
+        await self.backend.save(job)
+
+        try:
+            job.result = await self.handler(job)
+            job.status = JobStatus.COMPLETED
+            self.completed += 1
+        except Exception as e:
+            job.error = getattr(e, "detail", None) or str(e)
+            job.status = JobStatus.FAILED
+            self.failed += 1
+            logger.error(f"❌ Analysis job {job.job_id} failed: {job.error}")
+
+        job.completed_at = datetime.now(timezone.utc)
+        await self.backend.save(job)
+
+    async def stats(self) -> Dict[str, Any]:
+        """Queue counters for monitoring"""
+        return {
+            "backend": self.backend.name,
+            "workers": len(self._workers),
+            "queued": await self.backend.depth(),
+            "completed": self.completed,
+            "failed": self.failed,
+            "recovered": self.recovered
+        }
+
+
+__all__ = [
+    "JobStatus",
+    "AnalysisJob",
+    "InMemoryJobBackend",
+    "RedisJobBackend",
+    "AnalysisJobQueue"
+]
@@ -0,0 +1,140 @@
+"""
+Polka-Trinity Analysis Result Store
+Persistent PostgreSQL storage for Ultimate AI Trinity referendum analyses.
+
+Results are keyed by referendum ID plus the content hash of the proposal
+fields fed into the Trinity prompts, so an unchanged referendum is never
+re-analyzed by the flagship models.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import asyncpg
+
+from .polkadot_gateway import AnalysisComplexity, TrinityAnalysis, TrinityModel
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisResultStore:
+    """Lookup-before-compute store for TrinityAnalysis results"""
+
+    table_name = "trinity_analysis_results"
+
+    def __init__(self, db_pool: asyncpg.Pool):
+        self.db_pool = db_pool
+        self.hits = 0
+        self.misses = 0
+
+    async def initialize(self) -> None:
+        """Create the result table if it does not exist yet"""
+        async with self.db_pool.acquire() as conn:
+            await conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table_name} (
+                    referendum_id INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    analysis JSONB NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    PRIMARY KEY (referendum_id, content_hash)
+                )
+                """
+            )
+        logger.info("🗄️ Trinity analysis result store ready")
+
+    async def get(self, referendum_id: int, content_hash: str) -> Optional[TrinityAnalysis]:
+        """
+        Return the stored analysis for this referendum content, if any.
+
+        Store failures and rows that no longer deserialize are logged and
+        treated as a miss so analysis can always fall back to computing a
+        fresh result.
+        """
+        try:
+            async with self.db_pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    f"""
+                    SELECT analysis FROM {self.table_name}
+                    WHERE referendum_id = $1 AND content_hash = $2
+                    """,
+                    referendum_id,
+                    content_hash,
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Analysis store lookup failed for #{referendum_id}: {str(e)}")
+            self.misses += 1
+            return None
+
+        if not row:
+            self.misses += 1
+            return None
+
+        try:
+            analysis = deserialize_analysis(json.loads(row["analysis"]))
+        except Exception as e:
+            logger.warning(f"⚠️ Stored analysis for #{referendum_id} is unreadable: {str(e)}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return analysis
+
+    async def save(self, analysis: TrinityAnalysis, content_hash: str) -> None:
+        """Persist an analysis, replacing any result for the same content"""
+        try:
+            async with self.db_pool.acquire() as conn:
+                await conn.execute(
+                    f"""
+                    INSERT INTO {self.table_name} (referendum_id, content_hash, analysis)
+                    VALUES ($1, $2, $3::jsonb)
+                    ON CONFLICT (referendum_id, content_hash)
+                    DO UPDATE SET analysis = EXCLUDED.analysis, created_at = NOW()
+                    """,
+                    analysis.referendum_id,
+                    content_hash,
+                    json.dumps(serialize_analysis(analysis), default=str),
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to store analysis for #{analysis.referendum_id}: {str(e)}")
+
+    async def clear(self) -> int:
+        """Delete all stored analyses, returning the number removed"""
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute(f"DELETE FROM {self.table_name}")
+        return int(result.split()[-1])
+
+    def stats(self) -> Dict[str, Any]:
+        """Store hit/miss counters for monitoring"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": f"{(self.hits / max(1, self.hits + self.misses)) * 100:.2f}%"
+        }
+
+
+def serialize_analysis(analysis: TrinityAnalysis) -> Dict[str, Any]:
+    """Convert a TrinityAnalysis into a JSON-compatible dict"""
+    data = dict(analysis.__dict__)
+    data["analysis_timestamp"] = analysis.analysis_timestamp.isoformat()
+    data["complexity_level"] = analysis.complexity_level.value
+    data["models_used"] = [model.value for model in analysis.models_used]
+    return data
+
+
+def deserialize_analysis(data: Dict[str, Any]) -> TrinityAnalysis:
+    """Rebuild a TrinityAnalysis from its stored representation"""
+    data = dict(data)
+    data["analysis_timestamp"] = datetime.fromisoformat(data["analysis_timestamp"])
+    data["complexity_level"] = AnalysisComplexity(data["complexity_level"])
+    data["models_used"] = [TrinityModel(value) for value in data["models_used"]]
+    return TrinityAnalysis(**data)
+
+
+__all__ = [
+    "AnalysisResultStore",
+    "serialize_analysis",
+    "deserialize_analysis"
+]
@@ -0,0 +1,201 @@
+"""
+Polka-Trinity Chunked Analysis
+Map-reduce summarization of long proposal content.
+
+Long treasury proposals used to be sliced to a fixed prefix before they
+reached the flagship models. Instead, content over the prompt budget is
+split into token-sized chunks on paragraph and sentence boundaries, the
+chunks are summarized in parallel and the joined summaries replace the
+original text; rounds repeat until the result fits. Summaries are cached
+by chunk hash, so unchanged sections of an edited proposal and repeated
+analyses never summarize the same text twice.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List
+
+from prometheus_client import Counter
+
+from .prompt_builder import CHARS_PER_TOKEN, estimate_tokens, trim_to_sentences
+
+logger = logging.getLogger(__name__)
+
+# Chunk summarization metrics
+CHUNK_SUMMARIES = Counter('trinity_chunk_summaries_total', 'Proposal chunk summaries by source', ['outcome'])
+
+SUMMARY_PROMPT = """Summarize the following section of a Polkadot governance proposal.
+Keep every amount, beneficiary, milestone, deliverable, date and stated risk.
+Respond with the summary only.
+
+{chunk}"""
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_into_chunks(text: str, chunk_tokens: int) -> List[str]:
+    """
+    Split text into chunks of at most ``chunk_tokens`` estimated tokens.
+
+    Paragraphs are packed greedily; oversized paragraphs are split into
+    sentences, and oversized sentences at the character limit.
+    """
+    pieces: List[str] = []
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= chunk_tokens:
+            pieces.append(paragraph)
+            continue
+        for sentence in _SENTENCE_BREAK.split(paragraph):
+            max_chars = chunk_tokens * CHARS_PER_TOKEN
+            pieces.extend(sentence[i:i + max_chars] for i in range(0, len(sentence), max_chars))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        piece_tokens = estimate_tokens(piece) + 1  # Separator
+        if current and current_tokens + piece_tokens > chunk_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += piece_tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+@dataclass
+class ReducedContent:
+    """Content after map-reduce summarization"""
+    text: str
+    original_tokens: int
+    reduced_tokens: int
+    chunks: int = 0
+    rounds: int = 0
+
+    @property
+    def summarized(self) -> bool:
+        return self.rounds > 0
+
+
+class ChunkedSummarizer:
+    """Reduce long content to a token target by summarizing chunks in parallel"""
+
+    def __init__(self,
+                 chunk_tokens: int = 1024,
+                 max_parallel: int = 4,
+                 max_rounds: int = 3,
+                 max_cached_summaries: int = 2048):
+        """
+        Args:
+            chunk_tokens: Estimated tokens per chunk
+            max_parallel: Chunks summarized concurrently
+            max_rounds: Reduction rounds before falling back to trimming
+            max_cached_summaries: Chunk summaries kept in the LRU cache
+        """
+        self.chunk_tokens = chunk_tokens
+        self.max_parallel = max_parallel
+        self.max_rounds = max_rounds
+        self.max_cached_summaries = max_cached_summaries
+        self._summaries: "OrderedDict[str, str]" = OrderedDict()
+        self.cache_hits = 0
+        self.generated = 0
+        self.failures = 0
+
+    @staticmethod
+    def chunk_hash(chunk: str) -> str:
+        return hashlib.sha256(" ".join(chunk.split()).encode("utf-8")).hexdigest()
+
+    async def reduce(self,
+                     text: str,
+                     target_tokens: int,
+                     summarize: Callable[[str], Awaitable[str]]) -> ReducedContent:
+        """
+        Summarize ``text`` until it fits ``target_tokens``.
+
+        ``summarize`` generates the summary for one summarization prompt;
+        callers pass their own so model choice and request priority stay theirs.
+        """
+        original_tokens = estimate_tokens(text)
+        result = ReducedContent(text=text, original_tokens=original_tokens, reduced_tokens=original_tokens)
+        if original_tokens <= target_tokens:
+            return result
+
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        current = text
+        while estimate_tokens(current) > target_tokens and result.rounds < self.max_rounds:
+            chunks = split_into_chunks(current, self.chunk_tokens)
+            # A failed chunk falls back to its share of the budget, trimmed
+            fallback_tokens = max(1, target_tokens // len(chunks))
+            summaries = await asyncio.gather(*(
+                self._summarize_chunk(chunk, fallback_tokens, summarize, semaphore) for chunk in chunks
+            ))
+            current = "\n\n".join(summaries)
+            result.chunks += len(chunks)
+            result.rounds += 1
+
+        if estimate_tokens(current) > target_tokens:
+            current, _ = trim_to_sentences(current, target_tokens)
+
+        result.text = current
+        result.reduced_tokens = estimate_tokens(current)
+        logger.info(
+            f"🧩 Reduced {original_tokens} tokens to {result.reduced_tokens} "
+            f"({result.chunks} chunks, {result.rounds} rounds)"
+        )
+        return result
+
+    async def _summarize_chunk(self,
+                               chunk: str,
+                               fallback_tokens: int,
+                               summarize: Callable[[str], Awaitable[str]],
+                               semaphore: asyncio.Semaphore) -> str:
+        key = self.chunk_hash(chunk)
+        cached = self._summaries.get(key)
+        if cached is not None:
+            self._summaries.move_to_end(key)
+            self.cache_hits += 1
+            CHUNK_SUMMARIES.labels(outcome="cached").inc()
+            return cached
+
+        try:
+            async with semaphore:
+                summary = (await summarize(SUMMARY_PROMPT.format(chunk=chunk))).strip()
+            if not summary:
+                raise ValueError("empty summary")
+        except Exception as e:
+            self.failures += 1
+            CHUNK_SUMMARIES.labels(outcome="failed").inc()
+            logger.warning(f"⚠️ Chunk summarization failed, trimming instead: {str(e)}")
+            return trim_to_sentences(chunk, fallback_tokens)[0]
+
+        self.generated += 1
+        CHUNK_SUMMARIES.labels(outcome="generated").inc()
+        self._summaries[key] = summary
+        while len(self._summaries) > self.max_cached_summaries:
+            self._summaries.popitem(last=False)
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary cache counters for monitoring"""
+        return {
+            "cached_summaries": len(self._summaries),
+            "cache_hits": self.cache_hits,
+            "generated": self.generated,
+            "failures": self.failures
+        }
+
+
+__all__ = [
+    "ChunkedSummarizer",
+    "ReducedContent",
+    "split_into_chunks"
+]
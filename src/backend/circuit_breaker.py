@@ -0,0 +1,242 @@
+"""
+Polka-Trinity Circuit Breakers
+Fail fast on degraded data sources and model endpoints.
+
+With Subscan or Polkassembly degraded, every referendum fetch still waited
+out the source's full timeout (and its retries) before falling back to {}.
+A CircuitBreaker per destination tracks outcomes over a sliding time
+window. Once enough calls fail it opens, and calls are refused immediately
+with CircuitOpenError. After a cool-down it goes half-open and lets a
+limited number of probe calls through: a successful probe closes it, a
+failed one opens it again.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Tuple
+
+from prometheus_client import Counter, Gauge
+
+from .upstream_policy import UpstreamStatusError
+
+logger = logging.getLogger(__name__)
+
+# Circuit breaker metrics
+CIRCUIT_STATE = Gauge('trinity_circuit_state', 'Circuit breaker state (0 closed, 1 half-open, 2 open)', ['breaker'])
+CIRCUIT_SHORT_CIRCUITS = Counter('trinity_circuit_short_circuits_total', 'Calls refused by an open circuit', ['breaker'])
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Call refused because the destination's circuit is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit '{name}' is open (retry in {retry_after:.1f}s)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Whether an error says the destination is unhealthy (a 404 does not)"""
+    if isinstance(error, UpstreamStatusError):
+        return error.status >= 500 or error.status == 429
+    return True
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker over a failure-rate window"""
+
+    def __init__(self,
+                 name: str,
+                 window_seconds: float = 60.0,
+                 min_requests: int = 5,
+                 failure_rate_threshold: float = 0.5,
+                 open_seconds: float = 30.0,
+                 half_open_max_calls: int = 1,
+                 is_failure: Callable[[BaseException], bool] = is_upstream_failure):
+        """
+        Args:
+            name: Destination label for metrics and stats
+            window_seconds: Age of the outcomes the failure rate is computed over
+            min_requests: Calls in the window before the breaker may open
+            failure_rate_threshold: Failure fraction (0-1) that opens the breaker
+            open_seconds: Cool-down before an open breaker admits probe calls
+            half_open_max_calls: Concurrent probe calls while half-open
+            is_failure: Which exceptions count against the destination
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_requests = min_requests
+        self.failure_rate_threshold = failure_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._state = CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()  # (timestamp, failed)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.times_opened = 0
+        self.short_circuited = 0
+        CIRCUIT_STATE.labels(breaker=name).set(0)
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker past its cool-down reports half-open"""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        self._probes_in_flight = 0
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
+            logger.warning(f"🔌 Circuit '{self.name}' opened for {self.open_seconds:.0f}s")
+        elif state == CLOSED:
+            self._outcomes.clear()
+            logger.info(f"✅ Circuit '{self.name}' closed")
+        CIRCUIT_STATE.labels(breaker=self.name).set(STATE_VALUES[state])
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def failure_rate(self) -> float:
+        """Failure fraction over the current window"""
+        self._trim(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for _, failed in self._outcomes if failed) / len(self._outcomes)
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker admits probe calls"""
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def allows_traffic(self) -> bool:
+        """Whether a call would currently be admitted (reserves nothing)"""
+        state = self.state
+        return state == CLOSED or (state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls)
+
+    def acquire(self) -> None:
+        """Admit one call or raise CircuitOpenError"""
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+            self._probes_in_flight += 1
+            return
+        self.short_circuited += 1
+        CIRCUIT_SHORT_CIRCUITS.labels(breaker=self.name).inc()
+        raise CircuitOpenError(self.name, self.retry_after())
+
+    def record_success(self) -> None:
+        if self._state == HALF_OPEN:
+            self._transition(CLOSED)
+            return
+        self._record(False)
+
+    def record_failure(self) -> None:
+        if self._state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        self._record(True)
+
+    def release(self) -> None:
+        """Return a probe slot for a call that ended without an outcome (cancelled)"""
+        if self._state == HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def _record(self, failed: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, failed))
+        self._trim(now)
+        if (self._state == CLOSED
+                and len(self._outcomes) >= self.min_requests
+                and self.failure_rate() >= self.failure_rate_threshold):
+            self._transition(OPEN)
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator["CircuitBreaker"]:
+        """Admit one call and record its outcome"""
+        self.acquire()
+        try:
+            yield self
+        except Exception as e:
+            if self.is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        else:
+            self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and window counters for monitoring"""
+        self._trim(time.monotonic())
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate(), 3),
+            "window_requests": len(self._outcomes),
+            "times_opened": self.times_opened,
+            "short_circuited": self.short_circuited,
+            "retry_after_seconds": round(self.retry_after(), 1)
+        }
+
+
+class CircuitBreakers:
+    """Breakers keyed by destination, created on first use with shared settings"""
+
+    def __init__(self, **settings: Any):
+        """
+        Args:
+            settings: CircuitBreaker keyword arguments applied to every breaker
+        """
+        self.settings = settings
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreakers":
+        """Build from TRINITY_BREAKER_* environment settings"""
+        return cls(
+            window_seconds=float(os.getenv("TRINITY_BREAKER_WINDOW_SECONDS", "60")),
+            min_requests=int(os.getenv("TRINITY_BREAKER_MIN_REQUESTS", "5")),
+            failure_rate_threshold=float(os.getenv("TRINITY_BREAKER_FAILURE_RATE", "0.5")),
+            open_seconds=float(os.getenv("TRINITY_BREAKER_OPEN_SECONDS", "30"))
+        )
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        if name not in self._breakers:
+            self._breakers[name] = CircuitBreaker(name, **self.settings)
+        return self._breakers[name]
+
+    def state(self, name: str) -> str:
+        """State of a destination's breaker (closed if it has never been used)"""
+        return self._breakers[name].state if name in self._breakers else CLOSED
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-destination breaker stats for monitoring"""
+        return {name: breaker.stats() for name, breaker in self._breakers.items()}
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "CircuitOpenError",
+    "is_upstream_failure"
+]
@@ -0,0 +1,127 @@
+"""
+Polka-Trinity CPU Offload
+Run CPU-bound response parsing, scoring and synthesis off the event loop.
+
+Scanning and synthesizing a 2k-token model response is pure Python work.
+Run inline, every concurrent request on the same event loop waits for it.
+A CPUOffloader runs steps whose input is above a size threshold in a
+worker pool and awaits the result, so large responses no longer stall
+unrelated requests; small inputs stay inline where a pool hop would cost
+more than the work itself.
+
+Thread pools accept any callable. Process pools sidestep the GIL but need
+picklable callables and arguments (module-level functions or
+staticmethods), so only use ``mode="process"`` for such call sites.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Offload metrics
+OFFLOAD_QUEUE_DEPTH = Gauge('trinity_offload_queue_depth', 'CPU offload tasks submitted and not yet finished', ['pool'])
+OFFLOAD_TASKS = Counter('trinity_offload_tasks_total', 'CPU-bound steps by execution path', ['pool', 'path'])
+OFFLOAD_WAIT = Histogram(
+    'trinity_offload_wait_seconds', 'Time offloaded tasks waited for a worker', ['pool'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+T = TypeVar("T")
+
+MODES = ("thread", "process")
+
+
+def _call_with_start_time(fn: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[float, T]:
+    """Worker-side wrapper reporting when the task actually started"""
+    return time.time(), fn(*args)
+
+
+class CPUOffloader:
+    """Size-gated offload of synchronous steps to a thread or process pool"""
+
+    def __init__(self,
+                 name: str,
+                 max_workers: int = 4,
+                 mode: str = "thread",
+                 min_offload_size: int = 8192,
+                 executor: Optional[Executor] = None):
+        """
+        Args:
+            name: Pool label for metrics and stats
+            max_workers: Pool size; 0 runs every step inline
+            mode: "thread" or "process"
+            min_offload_size: Input size (characters) from which steps are offloaded
+            executor: Existing executor to use instead of creating one
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown offload mode {mode!r}, expected one of {MODES}")
+        self.name = name
+        self.max_workers = max_workers
+        self.mode = mode
+        self.min_offload_size = min_offload_size
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.in_flight = 0
+        self.offloaded = 0
+        self.inline = 0
+
+    def _get_executor(self) -> Executor:
+        # Created on first use so idle offloaders never spawn workers
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"trinity-{self.name}"
+                )
+        return self._executor
+
+    async def run(self, size: int, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)``, in the pool when ``size`` reaches the threshold"""
+        if size < self.min_offload_size or self.max_workers <= 0:
+            self.inline += 1
+            OFFLOAD_TASKS.labels(pool=self.name, path="inline").inc()
+            return fn(*args)
+
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        self.in_flight += 1
+        OFFLOAD_QUEUE_DEPTH.labels(pool=self.name).set(self.in_flight)
+        try:
+            started, result = await loop.run_in_executor(self._get_executor(), _call_with_start_time, fn, args)
+        finally:
+            self.in_flight -= 1
+            OFFLOAD_QUEUE_DEPTH.labels(pool=self.name).set(self.in_flight)
+
+        self.offloaded += 1
+        OFFLOAD_TASKS.labels(pool=self.name, path="offloaded").inc()
+        OFFLOAD_WAIT.labels(pool=self.name).observe(max(0.0, started - submitted))
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool if this offloader created it"""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Offload counters for monitoring"""
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "min_offload_size": self.min_offload_size,
+            "in_flight": self.in_flight,
+            "offloaded": self.offloaded,
+            "inline": self.inline
+        }
+
+
+__all__ = [
+    "CPUOffloader"
+]
@@ -0,0 +1,182 @@
+"""
+Polka-Trinity HTTP Client
+Shared aiohttp connection pool for the gateway, coordinator and warm-up.
+
+The gateway and the coordinator each used to open their own
+ClientSession against the same Performance Xnode, so neither
+connector's limits bounded the real number of connections to it. The
+HTTPClientManager owns one session with per-host connection limits, DNS
+caching and tuned keep-alive, and traces connection acquisition so pool
+saturation (acquired connections, time queued for a free connection,
+new vs reused connections) is visible next to request latency.
+"""
+
+import logging
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import aiohttp
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Connection pool metrics
+HTTP_CONNECTIONS_ACQUIRED = Gauge('trinity_http_connections_acquired', 'Connections currently in use', ['pool'])
+HTTP_REQUESTS_IN_FLIGHT = Gauge('trinity_http_requests_in_flight', 'HTTP requests in flight', ['pool'])
+HTTP_CONNECTIONS = Counter('trinity_http_connections_total', 'Connections handed to requests by source', ['pool', 'source'])
+HTTP_CONNECTION_WAIT = Histogram(
+    'trinity_http_connection_wait_seconds', 'Time requests queued for a free pooled connection', ['pool'],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Polka-Trinity/1.0 (Ultimate AI Governance Intelligence)",
+    "Accept": "application/json",
+    "Cache-Control": "no-cache"
+}
+
+
+class HTTPClientManager:
+    """One shared, instrumented aiohttp session"""
+
+    def __init__(self,
+                 name: str = "shared",
+                 limit: int = 100,
+                 limit_per_host: int = 32,
+                 keepalive_timeout: float = 60.0,
+                 dns_cache_ttl: int = 300,
+                 total_timeout: float = 30.0,
+                 connect_timeout: float = 10.0,
+                 headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            name: Pool label for metrics
+            limit: Total simultaneous connections
+            limit_per_host: Simultaneous connections to one host (e.g. the Performance Xnode)
+            keepalive_timeout: Seconds an idle connection stays pooled
+            dns_cache_ttl: Seconds resolved addresses are cached
+            total_timeout: Default request timeout; callers may override per request
+            connect_timeout: Connection establishment timeout
+            headers: Default request headers
+        """
+        self.name = name
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.in_flight = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.wait_seconds_total = 0.0
+
+    @classmethod
+    def from_env(cls, name: str = "shared") -> "HTTPClientManager":
+        """Build from TRINITY_HTTP_* environment settings"""
+        return cls(
+            name=name,
+            limit=int(os.getenv("TRINITY_HTTP_LIMIT", "100")),
+            limit_per_host=int(os.getenv("TRINITY_HTTP_LIMIT_PER_HOST", "32")),
+            keepalive_timeout=float(os.getenv("TRINITY_HTTP_KEEPALIVE_SECONDS", "60")),
+            dns_cache_ttl=int(os.getenv("TRINITY_HTTP_DNS_TTL", "300"))
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session, opened on first use (requires a running event loop)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers=self.headers,
+                trace_configs=[self._trace_config()]
+            )
+            logger.info(
+                f"🔌 HTTP pool '{self.name}' opened (limit {self.limit}, {self.limit_per_host} per host)"
+            )
+        return self._session
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+
+        async def on_request_start(session, ctx, params):
+            self.in_flight += 1
+            HTTP_REQUESTS_IN_FLIGHT.labels(pool=self.name).set(self.in_flight)
+
+        async def on_request_done(session, ctx, params):
+            self.in_flight -= 1
+            HTTP_REQUESTS_IN_FLIGHT.labels(pool=self.name).set(self.in_flight)
+            HTTP_CONNECTIONS_ACQUIRED.labels(pool=self.name).set(self.acquired_connections)
+
+        async def on_connection_queued_start(session, ctx, params):
+            ctx.queued_at = time.monotonic()
+
+        async def on_connection_queued_end(session, ctx, params):
+            waited = time.monotonic() - ctx.queued_at
+            self.wait_seconds_total += waited
+            HTTP_CONNECTION_WAIT.labels(pool=self.name).observe(waited)
+
+        async def on_connection_create_end(session, ctx, params):
+            self.connections_created += 1
+            HTTP_CONNECTIONS.labels(pool=self.name, source="created").inc()
+            HTTP_CONNECTIONS_ACQUIRED.labels(pool=self.name).set(self.acquired_connections)
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.connections_reused += 1
+            HTTP_CONNECTIONS.labels(pool=self.name, source="reused").inc()
+            HTTP_CONNECTIONS_ACQUIRED.labels(pool=self.name).set(self.acquired_connections)
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_done)
+        trace_config.on_request_exception.append(on_request_done)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    @property
+    def acquired_connections(self) -> int:
+        """Connections currently checked out of the pool"""
+        if self._session is None or self._session.closed:
+            return 0
+        # aiohttp does not expose pool occupancy publicly
+        return len(getattr(self._session.connector, "_acquired", ()))
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        HTTP_CONNECTIONS_ACQUIRED.labels(pool=self.name).set(0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool configuration and utilization for monitoring"""
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "dns_cache_ttl": self.dns_cache_ttl,
+            "open": self._session is not None and not self._session.closed,
+            "acquired_connections": self.acquired_connections,
+            "requests_in_flight": self.in_flight,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connection_wait_seconds_total": round(self.wait_seconds_total, 3)
+        }
+
+
+__all__ = [
+    "HTTPClientManager"
+]
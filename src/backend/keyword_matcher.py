@@ -0,0 +1,61 @@
+"""
+Polka-Trinity Keyword Matcher
+Multi-pattern keyword presence matching for response scoring.
+
+Coordinator confidence and reasoning-quality scores count which indicator
+keywords appear in a model response. Checking each keyword against a fresh
+``content.lower()`` costs one full copy and scan of the response per
+keyword, on the event loop, for every model response. A KeywordMatcher is
+built once per keyword set and finds all keywords present in a single
+linear pass over one lowercased copy, using a pyahocorasick automaton when
+the package is installed and substring checks otherwise.
+"""
+
+import logging
+from typing import FrozenSet, Iterable, Set
+
+try:
+    import ahocorasick
+except ImportError:  # Aho-Corasick automaton is optional
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordMatcher:
+    """Case-insensitive substring presence matching for a fixed keyword set"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: FrozenSet[str] = frozenset(keyword.lower() for keyword in keywords if keyword)
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @property
+    def uses_automaton(self) -> bool:
+        return self._automaton is not None
+
+    def find(self, text: str) -> Set[str]:
+        """Keywords occurring anywhere in ``text`` (overlaps included)"""
+        if not text or not self.keywords:
+            return set()
+        lowered = text.lower()
+
+        if self._automaton is None:
+            return {keyword for keyword in self.keywords if keyword in lowered}
+
+        found: Set[str] = set()
+        for _, keyword in self._automaton.iter(lowered):
+            found.add(keyword)
+            if len(found) == len(self.keywords):
+                break
+        return found
+
+
+__all__ = [
+    "KeywordMatcher"
+]
@@ -0,0 +1,208 @@
+"""
+Polka-Trinity Model Endpoint Pool
+Horizontal scale-out of flagship model inference across Ollama nodes.
+
+Each Trinity model maps to one or more inference endpoints. Requests go
+to the healthy endpoint with the fewest outstanding requests; endpoints
+that fail repeatedly are ejected for a cool-down period and then
+re-admitted on probation. Only errors that point at the node itself
+(connection errors, timeouts, 5xx) count as failures; a bad request or
+an unknown model says nothing about the node's health. With circuit breakers attached, a model whose
+endpoints all have open circuits is refused immediately instead of
+routed to a node that is known to be failing.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+from prometheus_client import Gauge
+
+from .circuit_breaker import CircuitBreaker, CircuitBreakers
+from .ollama_protocol import OllamaStreamError
+from .upstream_policy import UpstreamStatusError
+
+logger = logging.getLogger(__name__)
+
+# Endpoint pool metrics
+ENDPOINT_IN_FLIGHT = Gauge('trinity_endpoint_in_flight', 'Outstanding requests per model endpoint', ['model', 'endpoint'])
+ENDPOINT_HEALTHY = Gauge('trinity_endpoint_healthy', 'Whether a model endpoint is accepting traffic', ['model', 'endpoint'])
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """Whether an error counts against the endpoint that served the request"""
+    if isinstance(error, UpstreamStatusError):
+        return error.status >= 500
+    return isinstance(error, (
+        asyncio.TimeoutError, ConnectionError, aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError, OllamaStreamError
+    ))
+
+
+@dataclass
+class ModelEndpoint:
+    """One inference node serving a Trinity model"""
+    model: str
+    base_url: str
+    in_flight: int = 0
+    total_requests: int = 0
+    total_failures: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+
+    @property
+    def generate_url(self) -> str:
+        return f"{self.base_url}/api/generate"
+
+    def is_healthy(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+
+class ModelEndpointPool:
+    """Least-outstanding-requests balancer with failure-based ejection"""
+
+    def __init__(self,
+                 endpoints: Dict[str, List[str]],
+                 default_endpoints: Optional[List[str]] = None,
+                 failure_threshold: int = 3,
+                 ejection_seconds: float = 30.0,
+                 circuit_breakers: Optional[CircuitBreakers] = None):
+        """
+        Args:
+            endpoints: Base URLs per model name (e.g. "deepseek-r1:671b")
+            default_endpoints: Base URLs for models without an explicit entry
+            failure_threshold: Consecutive failures before an endpoint is ejected
+            ejection_seconds: How long an ejected endpoint receives no traffic
+            circuit_breakers: Per-endpoint breakers; open circuits short-circuit requests
+        """
+        self.failure_threshold = failure_threshold
+        self.ejection_seconds = ejection_seconds
+        self.circuit_breakers = circuit_breakers
+        self.default_endpoints = [url.rstrip("/") for url in default_endpoints or []]
+        self._pools: Dict[str, List[ModelEndpoint]] = {
+            model: [ModelEndpoint(model, url.rstrip("/")) for url in urls]
+            for model, urls in endpoints.items()
+        }
+
+    @classmethod
+    def from_config(cls, endpoints_json: Optional[str], default_endpoint: str, **kwargs) -> "ModelEndpointPool":
+        """
+        Build a pool from a JSON mapping of model name to base URLs.
+
+        Example: {"deepseek-r1:671b": ["http://10.0.0.1:11434", "http://10.0.0.2:11434"]}
+        Models missing from the mapping use ``default_endpoint``.
+        """
+        endpoints = json.loads(endpoints_json) if endpoints_json else {}
+        return cls(endpoints, default_endpoints=[default_endpoint], **kwargs)
+
+    def endpoints_for(self, model: str) -> List[ModelEndpoint]:
+        """All endpoints serving a model (created lazily from the defaults)"""
+        if model not in self._pools:
+            if not self.default_endpoints:
+                raise KeyError(f"No inference endpoints configured for {model}")
+            self._pools[model] = [ModelEndpoint(model, url) for url in self.default_endpoints]
+        return self._pools[model]
+
+    def breaker_for(self, endpoint: ModelEndpoint) -> Optional[CircuitBreaker]:
+        """The endpoint's circuit breaker, if breakers are attached"""
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.breaker(f"{endpoint.model}@{endpoint.base_url}")
+
+    def select(self, model: str) -> ModelEndpoint:
+        """Pick the healthy endpoint with the fewest outstanding requests"""
+        endpoints = self.endpoints_for(model)
+        if self.circuit_breakers is not None:
+            # Prefer endpoints whose circuit admits traffic; if none do, the
+            # lease short-circuits on the selected endpoint's open breaker
+            admitting = [endpoint for endpoint in endpoints if self.breaker_for(endpoint).allows_traffic()]
+            endpoints = admitting or endpoints
+        now = time.monotonic()
+        healthy = [endpoint for endpoint in endpoints if endpoint.is_healthy(now)]
+
+        if not healthy:
+            # Fail open: try the endpoint closest to re-admission
+            return min(endpoints, key=lambda endpoint: endpoint.ejected_until)
+
+        return min(healthy, key=lambda endpoint: (endpoint.in_flight, endpoint.total_requests))
+
+    @asynccontextmanager
+    async def lease(self, model: str) -> AsyncIterator[ModelEndpoint]:
+        """Route one request, tracking in-flight load and its outcome
+
+        Raises CircuitOpenError without sending anything when the selected
+        endpoint's circuit is open.
+        """
+        endpoint = self.select(model)
+        breaker = self.breaker_for(endpoint)
+        if breaker is not None:
+            breaker.acquire()
+        endpoint.in_flight += 1
+        endpoint.total_requests += 1
+        ENDPOINT_IN_FLIGHT.labels(model=model, endpoint=endpoint.base_url).inc()
+
+        try:
+            yield endpoint
+        except BaseException as e:
+            # Cancellations and request errors (4xx) leave health tracking untouched
+            if isinstance(e, Exception) and is_endpoint_failure(e):
+                self.record_failure(endpoint)
+                if breaker is not None:
+                    breaker.record_failure()
+            elif breaker is not None:
+                breaker.release()
+            raise
+        else:
+            self.record_success(endpoint)
+            if breaker is not None:
+                breaker.record_success()
+        finally:
+            endpoint.in_flight -= 1
+            ENDPOINT_IN_FLIGHT.labels(model=model, endpoint=endpoint.base_url).dec()
+
+    def record_success(self, endpoint: ModelEndpoint) -> None:
+        """Reset failure tracking after a successful request"""
+        endpoint.consecutive_failures = 0
+        ENDPOINT_HEALTHY.labels(model=endpoint.model, endpoint=endpoint.base_url).set(1)
+
+    def record_failure(self, endpoint: ModelEndpoint) -> None:
+        """Count a failure and eject the endpoint once the threshold is reached"""
+        endpoint.total_failures += 1
+        endpoint.consecutive_failures += 1
+
+        if endpoint.consecutive_failures >= self.failure_threshold:
+            endpoint.ejected_until = time.monotonic() + self.ejection_seconds
+            # One more failure after re-admission ejects it again
+            endpoint.consecutive_failures = self.failure_threshold - 1
+            ENDPOINT_HEALTHY.labels(model=endpoint.model, endpoint=endpoint.base_url).set(0)
+            logger.warning(f"⚠️ Ejected {endpoint.model} endpoint {endpoint.base_url} for {self.ejection_seconds:.0f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-endpoint load and health for monitoring"""
+        now = time.monotonic()
+        return {
+            model: [
+                {
+                    "endpoint": endpoint.base_url,
+                    "healthy": endpoint.is_healthy(now),
+                    "in_flight": endpoint.in_flight,
+                    "requests": endpoint.total_requests,
+                    "failures": endpoint.total_failures,
+                    "circuit": self.breaker_for(endpoint).state if self.circuit_breakers is not None else None
+                }
+                for endpoint in endpoints
+            ]
+            for model, endpoints in self._pools.items()
+        }
+
+
+__all__ = [
+    "ModelEndpoint",
+    "ModelEndpointPool",
+    "is_endpoint_failure"
+]
@@ -0,0 +1,219 @@
+"""
+Polka-Trinity Model Output Schemas
+Structured JSON output for the gateway's flagship model analyses.
+
+Each Trinity model is asked to answer with a JSON object matching its
+schema (sent as Ollama's ``format``), so generations stop at the closing
+brace instead of running on as prose. Responses are parsed with orjson
+when available into typed, range-checked result objects; anything that
+does not conform returns None and the caller falls back to its text
+extractors.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from prometheus_client import Counter
+
+try:
+    import orjson
+except ImportError:  # Fast JSON parsing is optional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Structured parsing metrics
+STRUCTURED_PARSE = Counter('trinity_structured_parse_total', 'Model responses by parse path', ['model', 'outcome'])
+
+T = TypeVar("T", bound="StructuredAnalysis")
+
+RECOMMENDATIONS = ["STRONG_APPROVE", "APPROVE", "APPROVE_WITH_CAUTION", "NEUTRAL", "REJECT"]
+IMPACT_LEVELS = ["HIGH", "MODERATE", "LOW"]
+ADVANTAGES = ["STRONG_POSITIVE", "POSITIVE", "NEUTRAL", "NEGATIVE"]
+STRATEGIES = ["PHASED_ROLLOUT", "IMMEDIATE_IMPLEMENTATION", "STANDARD_IMPLEMENTATION", "DELAYED_IMPLEMENTATION"]
+SENTIMENTS = ["VERY_POSITIVE", "POSITIVE", "MIXED", "NEUTRAL", "NEGATIVE"]
+
+
+def loads_json(text: str) -> Any:
+    """Parse JSON with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _score(minimum: float, maximum: float) -> Dict[str, Any]:
+    return {"type": "number", "minimum": minimum, "maximum": maximum}
+
+
+def _enum(values: list) -> Dict[str, Any]:
+    return {"type": "string", "enum": values}
+
+
+def _object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+def _number(data: Dict[str, Any], name: str, minimum: float, maximum: float) -> float:
+    value = data[name]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{name} must be a number")
+    return min(maximum, max(minimum, float(value)))
+
+
+def _choice(data: Dict[str, Any], name: str, values: list) -> str:
+    value = str(data[name]).strip().upper().replace(" ", "_")
+    if value not in values:
+        raise ValueError(f"{name} must be one of {values}")
+    return value
+
+
+def _text(data: Dict[str, Any], name: str) -> str:
+    value = data[name]
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    return value
+
+
+class StructuredAnalysis:
+    """Base for typed model results; subclasses define SCHEMA, MODEL and SPECIALIZATION"""
+    SCHEMA: Dict[str, Any] = {}
+    MODEL = ""
+    SPECIALIZATION = ""
+
+    @classmethod
+    def from_json(cls: Type[T], data: Dict[str, Any]) -> T:
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Result dict in the same shape as the text-extraction fallback"""
+        return {**asdict(self), "model": self.MODEL, "specialization": self.SPECIALIZATION}
+
+
+@dataclass
+class DeepSeekAnalysis(StructuredAnalysis):
+    """DeepSeek-R1 mathematical analysis"""
+    mathematical_soundness: float
+    economic_viability: float
+    risk_score: float
+    implementation_complexity: float
+    recommendation: str
+    chain_of_thought: str
+
+    SCHEMA = _object({
+        "mathematical_soundness": _score(0, 10),
+        "economic_viability": _score(0, 100),
+        "risk_score": _score(0, 10),
+        "implementation_complexity": _score(0, 10),
+        "recommendation": _enum(RECOMMENDATIONS),
+        "chain_of_thought": {"type": "string"}
+    })
+    MODEL = "DeepSeek-R1:671b"
+    SPECIALIZATION = "Mathematical reasoning and economic modeling"
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "DeepSeekAnalysis":
+        return cls(
+            mathematical_soundness=_number(data, "mathematical_soundness", 0, 10),
+            economic_viability=_number(data, "economic_viability", 0, 100),
+            risk_score=_number(data, "risk_score", 0, 10),
+            implementation_complexity=_number(data, "implementation_complexity", 0, 10),
+            recommendation=_choice(data, "recommendation", RECOMMENDATIONS),
+            chain_of_thought=_text(data, "chain_of_thought")
+        )
+
+
+@dataclass
+class LlamaStrategicAnalysis(StructuredAnalysis):
+    """Llama4:maverick strategic analysis"""
+    strategic_recommendation: str
+    long_term_impact: str
+    ecosystem_health: float
+    competitive_advantage: str
+    implementation_strategy: str
+    strategic_reasoning: str
+
+    SCHEMA = _object({
+        "strategic_recommendation": _enum(RECOMMENDATIONS),
+        "long_term_impact": _enum(IMPACT_LEVELS),
+        "ecosystem_health": _score(0, 10),
+        "competitive_advantage": _enum(ADVANTAGES),
+        "implementation_strategy": _enum(STRATEGIES),
+        "strategic_reasoning": {"type": "string"}
+    })
+    MODEL = "Llama4:maverick"
+    SPECIALIZATION = "Strategic intelligence and long-term planning"
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "LlamaStrategicAnalysis":
+        return cls(
+            strategic_recommendation=_choice(data, "strategic_recommendation", RECOMMENDATIONS),
+            long_term_impact=_choice(data, "long_term_impact", IMPACT_LEVELS),
+            ecosystem_health=_number(data, "ecosystem_health", 0, 10),
+            competitive_advantage=_choice(data, "competitive_advantage", ADVANTAGES),
+            implementation_strategy=_choice(data, "implementation_strategy", STRATEGIES),
+            strategic_reasoning=_text(data, "strategic_reasoning")
+        )
+
+
+@dataclass
+class QwenGlobalAnalysis(StructuredAnalysis):
+    """Qwen3 global perspective analysis"""
+    global_sentiment: str
+    regulatory_compliance: float
+    cultural_impact: float
+    international_support: float
+    global_reasoning: str
+    regional_analysis: Dict[str, str] = field(default_factory=dict)
+
+    SCHEMA = _object({
+        "global_sentiment": _enum(SENTIMENTS),
+        "regulatory_compliance": _score(0, 10),
+        "cultural_impact": _score(0, 10),
+        "international_support": _score(0, 100),
+        "regional_analysis": {"type": "object", "additionalProperties": {"type": "string"}},
+        "global_reasoning": {"type": "string"}
+    })
+    MODEL = "Qwen3:235b"
+    SPECIALIZATION = "Global perspective and multilingual analysis"
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "QwenGlobalAnalysis":
+        regional = data.get("regional_analysis") or {}
+        if not isinstance(regional, dict):
+            raise ValueError("regional_analysis must be an object")
+        return cls(
+            global_sentiment=_choice(data, "global_sentiment", SENTIMENTS),
+            regulatory_compliance=_number(data, "regulatory_compliance", 0, 10),
+            cultural_impact=_number(data, "cultural_impact", 0, 10),
+            international_support=_number(data, "international_support", 0, 100),
+            global_reasoning=_text(data, "global_reasoning"),
+            regional_analysis={str(region): str(sentiment) for region, sentiment in regional.items()}
+        )
+
+
+def parse_structured_response(response: str, result_type: Type[T]) -> Optional[T]:
+    """Parse a schema-conforming response, or return None for the text fallback"""
+    try:
+        data = loads_json(response)
+        if not isinstance(data, dict):
+            raise ValueError("response is not a JSON object")
+        result = result_type.from_json(data)
+    except (KeyError, TypeError, ValueError) as e:  # orjson.JSONDecodeError is a ValueError
+        STRUCTURED_PARSE.labels(model=result_type.MODEL, outcome="fallback").inc()
+        logger.debug(f"{result_type.MODEL} response did not match its schema: {str(e)}")
+        return None
+
+    STRUCTURED_PARSE.labels(model=result_type.MODEL, outcome="structured").inc()
+    return result
+
+
+__all__ = [
+    "StructuredAnalysis",
+    "DeepSeekAnalysis",
+    "LlamaStrategicAnalysis",
+    "QwenGlobalAnalysis",
+    "loads_json",
+    "parse_structured_response"
+]
@@ -0,0 +1,268 @@
+"""
+Polka-Trinity Model Warm-up
+Keeps the flagship models resident on the Performance Xnode.
+
+Loading a 235B-671B model takes minutes, so the first request after an
+idle period used to pay the full cold load. The warm-up manager preloads
+the Trinity models on every inference endpoint, picks a ``keep_alive`` per
+model from recent traffic (long while the model is busy or inside the
+configured active hours, short otherwise) and polls ``/api/ps`` to re-warm
+models that were evicted while they are still expected to serve traffic.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+from prometheus_client import Counter, Gauge
+
+from .http_client import HTTPClientManager
+from .model_endpoints import ModelEndpointPool
+
+logger = logging.getLogger(__name__)
+
+# Warm-up metrics
+MODEL_LOADED = Gauge('trinity_model_loaded', 'Whether a model is resident on an inference endpoint', ['model', 'endpoint'])
+MODEL_PRELOADS = Counter('trinity_model_preloads_total', 'Model preload requests sent to inference endpoints', ['model', 'outcome'])
+
+
+class ModelWarmupManager:
+    """Background preloading and traffic-based keep_alive for flagship models"""
+
+    def __init__(self,
+                 endpoint_pool: ModelEndpointPool,
+                 models: List[str],
+                 busy_keep_alive: str = "60m",
+                 idle_keep_alive: str = "10m",
+                 busy_threshold: int = 3,
+                 traffic_window_seconds: float = 3600.0,
+                 active_hours: Optional[Tuple[int, int]] = None,
+                 refresh_interval_seconds: float = 60.0,
+                 preload_timeout_seconds: float = 900.0,
+                 http_client: Optional[HTTPClientManager] = None):
+        """
+        Args:
+            endpoint_pool: Inference endpoints to warm for each model
+            models: Ollama model names to keep resident
+            busy_keep_alive: keep_alive for models with recent traffic or inside active hours
+            idle_keep_alive: keep_alive for models without recent traffic
+            busy_threshold: Requests within the traffic window that mark a model busy
+            traffic_window_seconds: How far back request traffic is counted
+            active_hours: UTC [start, end) hours during which every model stays resident
+            refresh_interval_seconds: Spacing between /api/ps checks
+            preload_timeout_seconds: Upper bound for a single cold model load
+            http_client: Shared connection pool (a private session is opened otherwise)
+        """
+        self.endpoint_pool = endpoint_pool
+        self.models = list(models)
+        self.busy_keep_alive = busy_keep_alive
+        self.idle_keep_alive = idle_keep_alive
+        self.busy_threshold = busy_threshold
+        self.traffic_window_seconds = traffic_window_seconds
+        self.active_hours = active_hours
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.preload_timeout_seconds = preload_timeout_seconds
+
+        self._traffic: Dict[str, Deque[float]] = {model: deque() for model in self.models}
+        self._loaded: Dict[str, Dict[str, bool]] = {}
+        self.http_client = http_client
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self.preloads = 0
+        self.preload_failures = 0
+        self.last_refresh: Optional[datetime] = None
+
+    @staticmethod
+    def parse_active_hours(value: Optional[str]) -> Optional[Tuple[int, int]]:
+        """Parse an "8-20" style UTC hour range"""
+        if not value:
+            return None
+        start, end = (int(hour) for hour in value.split("-", 1))
+        if not (0 <= start <= 23 and 0 <= end <= 24):
+            raise ValueError(f"Invalid active hours: {value}")
+        return start, end
+
+    async def start(self) -> None:
+        """Open the warm-up session and start the refresh loop"""
+        if self.http_client is not None:
+            self._session = self.http_client.session
+        else:
+            self._session = aiohttp.ClientSession(headers={"User-Agent": "Polka-Trinity-Ultimate-AI/1.0.0"})
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"🔥 Model warm-up started for {len(self.models)} models")
+
+    async def stop(self) -> None:
+        """Stop the refresh loop and close the session"""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._session and self.http_client is None:
+            await self._session.close()
+        self._session = None
+
+    def record_request(self, model: str) -> None:
+        """Count an inference request towards the model's recent traffic"""
+        traffic = self._traffic.setdefault(model, deque())
+        now = time.monotonic()
+        traffic.append(now)
+        self._expire(traffic, now)
+
+    def recent_requests(self, model: str) -> int:
+        traffic = self._traffic.get(model)
+        if not traffic:
+            return 0
+        self._expire(traffic, time.monotonic())
+        return len(traffic)
+
+    def in_active_hours(self, now: Optional[datetime] = None) -> bool:
+        if self.active_hours is None:
+            return False
+        hour = (now or datetime.now(timezone.utc)).hour
+        start, end = self.active_hours
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end  # Range wraps past midnight
+
+    def should_stay_resident(self, model: str) -> bool:
+        """Whether a model should be kept loaded right now"""
+        return self.in_active_hours() or self.recent_requests(model) >= self.busy_threshold
+
+    def keep_alive_for(self, model: str) -> str:
+        """keep_alive to send with a generate request for this model"""
+        return self.busy_keep_alive if self.should_stay_resident(model) else self.idle_keep_alive
+
+    async def refresh(self) -> None:
+        """Check /api/ps on every endpoint and preload models that should be resident"""
+        for base_url, models in self._endpoint_models().items():
+            loaded = await self._loaded_models(base_url)
+            if loaded is None:
+                # Endpoint unreachable; leave its state for the next refresh
+                continue
+            for model in models:
+                resident = model in loaded
+                if not resident and self.should_stay_resident(model):
+                    resident = await self.preload(base_url, model)
+                self._set_loaded(model, base_url, resident)
+
+    async def preload(self, base_url: str, model: str) -> bool:
+        """Load a model on an endpoint with an empty generate request"""
+        payload = {"model": model, "prompt": "", "stream": False, "keep_alive": self.keep_alive_for(model)}
+        started = time.monotonic()
+        try:
+            async with self._session.post(
+                f"{base_url}/api/generate", json=payload, timeout=self._preload_timeout()
+            ) as response:
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}: {await response.text()}")
+                await response.read()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.preload_failures += 1
+            MODEL_PRELOADS.labels(model=model, outcome="failure").inc()
+            logger.warning(f"⚠️ Preloading {model} on {base_url} failed: {str(e)}")
+            return False
+
+        self.preloads += 1
+        MODEL_PRELOADS.labels(model=model, outcome="success").inc()
+        logger.info(f"🔥 Preloaded {model} on {base_url} in {time.monotonic() - started:.1f}s")
+        return True
+
+    def _preload_timeout(self) -> aiohttp.ClientTimeout:
+        # Cold loads of the flagship models far exceed the pool's default timeout
+        return aiohttp.ClientTimeout(total=self.preload_timeout_seconds, connect=10)
+
+    async def _run(self) -> None:
+        # The first pass preloads every model so the first request is never cold
+        refresh = self._preload_all
+        while True:
+            try:
+                await refresh()
+                self.last_refresh = datetime.now(timezone.utc)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Model warm-up refresh failed: {str(e)}")
+            refresh = self.refresh
+            await asyncio.sleep(self.refresh_interval_seconds)
+
+    async def _preload_all(self) -> None:
+        for base_url, models in self._endpoint_models().items():
+            loaded = await self._loaded_models(base_url)
+            if loaded is None:
+                continue
+            for model in models:
+                # Sequential loads avoid several models competing for memory at once
+                resident = model in loaded or await self.preload(base_url, model)
+                self._set_loaded(model, base_url, resident)
+
+    async def _loaded_models(self, base_url: str) -> Optional[Set[str]]:
+        """Models currently resident on an endpoint, or None if it cannot be queried"""
+        try:
+            async with self._session.get(
+                f"{base_url}/api/ps", timeout=aiohttp.ClientTimeout(total=30, connect=10)
+            ) as response:
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
+                data = await response.json()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ Could not list loaded models on {base_url}: {str(e)}")
+            return None
+        return {entry.get("model") or entry.get("name") for entry in data.get("models", [])}
+
+    def _endpoint_models(self) -> Dict[str, List[str]]:
+        """Group the managed models by the endpoint URLs that serve them"""
+        grouped: Dict[str, List[str]] = {}
+        for model in self.models:
+            for endpoint in self.endpoint_pool.endpoints_for(model):
+                grouped.setdefault(endpoint.base_url, []).append(model)
+        return grouped
+
+    def _set_loaded(self, model: str, base_url: str, loaded: bool) -> None:
+        self._loaded.setdefault(model, {})[base_url] = loaded
+        MODEL_LOADED.labels(model=model, endpoint=base_url).set(1 if loaded else 0)
+
+    def _expire(self, traffic: Deque[float], now: float) -> None:
+        while traffic and now - traffic[0] > self.traffic_window_seconds:
+            traffic.popleft()
+
+    def is_loaded(self, model: str) -> Optional[bool]:
+        """Whether a model was resident on any endpoint at the last check (None if never checked)"""
+        endpoints = self._loaded.get(model)
+        if not endpoints:
+            return None
+        return any(endpoints.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Residency and keep_alive state for health checks"""
+        return {
+            "active_hours": list(self.active_hours) if self.active_hours else None,
+            "in_active_hours": self.in_active_hours(),
+            "preloads": self.preloads,
+            "preload_failures": self.preload_failures,
+            "last_refresh": self.last_refresh.isoformat() if self.last_refresh else None,
+            "models": {
+                model: {
+                    "state": {True: "loaded", False: "unloaded", None: "unknown"}[self.is_loaded(model)],
+                    "endpoints": {
+                        base_url: "loaded" if loaded else "unloaded"
+                        for base_url, loaded in self._loaded.get(model, {}).items()
+                    },
+                    "keep_alive": self.keep_alive_for(model),
+                    "recent_requests": self.recent_requests(model)
+                }
+                for model in self.models
+            }
+        }
+
+
+__all__ = [
+    "ModelWarmupManager"
+]
@@ -0,0 +1,143 @@
+"""
+Ollama Protocol Helpers
+Shared wire-level helpers for the Performance Xnode Ollama API.
+
+Used by both PolkadotGateway and UltimateAITrinityCoordinator so the
+streaming NDJSON handling and generation metadata accounting live in one
+place.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+from prometheus_client import Histogram
+
+from .upstream_policy import UpstreamStatusError
+
+logger = logging.getLogger(__name__)
+
+# Generation metrics from Ollama response metadata
+GENERATION_TOKENS_PER_SECOND = Histogram(
+    'trinity_generation_tokens_per_second', 'Decode throughput per generation', ['model'],
+    buckets=(1, 2, 5, 10, 15, 20, 30, 50, 75, 100, 200)
+)
+PROMPT_EVAL_SECONDS = Histogram('trinity_prompt_eval_seconds', 'Prompt processing time per generation', ['model'])
+MODEL_LOAD_SECONDS = Histogram('trinity_model_load_seconds', 'Model load time per generation', ['model'])
+
+NANOSECONDS = 1_000_000_000
+
+
+class OllamaStreamError(Exception):
+    """Error reported inside an Ollama generate stream"""
+    pass
+
+
+@dataclass
+class GenerationStats:
+    """Token and timing metadata reported by Ollama for one generation
+
+    Durations are in nanoseconds, as returned by the API.
+    """
+    prompt_eval_count: int = 0
+    prompt_eval_duration: int = 0
+    eval_count: int = 0
+    eval_duration: int = 0
+    load_duration: int = 0
+    total_duration: int = 0
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "GenerationStats":
+        """Extract metadata from a non-streaming response or the final stream chunk"""
+        return cls(
+            prompt_eval_count=int(data.get("prompt_eval_count") or 0),
+            prompt_eval_duration=int(data.get("prompt_eval_duration") or 0),
+            eval_count=int(data.get("eval_count") or 0),
+            eval_duration=int(data.get("eval_duration") or 0),
+            load_duration=int(data.get("load_duration") or 0),
+            total_duration=int(data.get("total_duration") or 0)
+        )
+
+    @property
+    def tokens_per_second(self) -> float:
+        if not self.eval_duration:
+            return 0.0
+        return self.eval_count / (self.eval_duration / NANOSECONDS)
+
+    @property
+    def seconds_per_token(self) -> Optional[float]:
+        """Decode latency per output token, None when Ollama reported no decode"""
+        if not self.eval_count or not self.eval_duration:
+            return None
+        return (self.eval_duration / NANOSECONDS) / self.eval_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Raw counters plus derived throughput, for API responses and storage"""
+        return {**asdict(self), "tokens_per_second": round(self.tokens_per_second, 2)}
+
+    def record(self, model: str) -> None:
+        """Export this generation to the Prometheus histograms"""
+        if self.eval_duration:
+            GENERATION_TOKENS_PER_SECOND.labels(model=model).observe(self.tokens_per_second)
+        if self.prompt_eval_duration:
+            PROMPT_EVAL_SECONDS.labels(model=model).observe(self.prompt_eval_duration / NANOSECONDS)
+        if self.load_duration:
+            MODEL_LOAD_SECONDS.labels(model=model).observe(self.load_duration / NANOSECONDS)
+
+
+async def iter_ndjson(response: aiohttp.ClientResponse) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Incrementally decode an Ollama NDJSON response body.
+
+    Each line is one JSON object; lines are yielded as soon as they
+    arrive so callers can forward tokens without buffering the whole
+    generation.
+    """
+    async for raw_line in response.content:
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        chunk = json.loads(line)
+        if "error" in chunk:
+            raise OllamaStreamError(chunk["error"])
+
+        yield chunk
+
+
+async def stream_generate(session: aiohttp.ClientSession,
+                          url: str,
+                          payload: Dict[str, Any],
+                          timeout: Optional[aiohttp.ClientTimeout] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    POST a streaming /api/generate request and yield decoded chunks.
+
+    The final chunk has ``done`` set and carries the generation metadata.
+    A body that ends without it was truncated and raises OllamaStreamError,
+    so callers never treat a partial generation as complete.
+    ``timeout`` overrides the session timeout (read timeout applies per chunk).
+    """
+    payload = {**payload, "stream": True}
+    request_kwargs = {"timeout": timeout} if timeout is not None else {}
+
+    async with session.post(url, json=payload, **request_kwargs) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise UpstreamStatusError(response.status, f"Model API error {response.status}: {error_text}")
+
+        async for chunk in iter_ndjson(response):
+            yield chunk
+            if chunk.get("done"):
+                break
+        else:
+            raise OllamaStreamError("Model stream ended before the final chunk")
+
+
+__all__ = [
+    "GenerationStats",
+    "OllamaStreamError",
+    "iter_ndjson",
+    "stream_generate"
+]
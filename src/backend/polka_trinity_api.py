@@ -15,15 +15,20 @@ Multi-Xnode Architecture:
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
+import asyncpg
 import uvicorn
 
 from .polkadot_gateway import (
@@ -33,6 +38,15 @@ from .polkadot_gateway import (
     AnalysisComplexity,
     TrinityModel
 )
+from .analysis_jobs import AnalysisJob, AnalysisJobQueue, InMemoryJobBackend, RedisJobBackend
+from .analysis_store import AnalysisResultStore
+from .model_endpoints import ModelEndpointPool
+from .model_warmup import ModelWarmupManager
+from .circuit_breaker import CircuitBreakers
+from .cpu_offload import CPUOffloader
+from .http_client import HTTPClientManager
+from .response_cache import ModelResponseCache
+from .upstream_policy import UpstreamPolicies
 from .ultimate_trinity_coordinator import (
     UltimateAITrinityCoordinator, 
     TrinityRequest, 
@@ -48,17 +62,76 @@ logger = logging.getLogger(__name__)
 # Global instances for enterprise connection pooling
 gateway_instance: Optional[PolkadotGateway] = None
 trinity_coordinator: Optional[UltimateAITrinityCoordinator] = None
+analysis_store: Optional[AnalysisResultStore] = None
+db_pool: Optional[asyncpg.Pool] = None
+response_cache: Optional[ModelResponseCache] = None
+job_queue: Optional[AnalysisJobQueue] = None
+model_warmup: Optional[ModelWarmupManager] = None
+http_client: Optional[HTTPClientManager] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management for enterprise connection pooling"""
-    global gateway_instance, trinity_coordinator
+    global gateway_instance, trinity_coordinator, analysis_store, db_pool, response_cache, job_queue, model_warmup
+    global http_client
     
     # Startup: Initialize Ultimate AI Trinity coordination
     logger.info("🚀 Polka-Trinity API starting - Ultimate AI Trinity coordination")
     
+    # Shared flagship model generation cache (Redis tier when configured)
+    response_cache = ModelResponseCache.from_url(os.getenv("REDIS_URL"))
+    
+    # One connection pool for every outbound request (TRINITY_HTTP_* tune its limits)
+    http_client = HTTPClientManager.from_env()
+    
+    # Per-destination timeouts and retries (TRINITY_UPSTREAM_POLICIES overrides the defaults)
+    upstream_policies = UpstreamPolicies.from_config(os.getenv("TRINITY_UPSTREAM_POLICIES"))
+    
+    # Circuit breakers per data source and model endpoint (TRINITY_BREAKER_* tune the windows)
+    circuit_breakers = CircuitBreakers.from_env()
+    
+    # Shared inference endpoint pool (TRINITY_MODEL_ENDPOINTS maps models to node URLs)
+    endpoint_pool = ModelEndpointPool.from_config(
+        os.getenv("TRINITY_MODEL_ENDPOINTS"),
+        default_endpoint=os.getenv("TRINITY_ENDPOINT", "http://23.92.65.18:11434"),
+        circuit_breakers=circuit_breakers
+    )
+    
+    # Keep flagship models resident (TRINITY_WARMUP_HOURS like "7-19" pins them in UTC hours)
+    cascade_model = os.getenv("TRINITY_CASCADE_MODEL") or None
+    model_warmup = ModelWarmupManager(
+        endpoint_pool,
+        [model.value for model in TrinityModel] + ([cascade_model] if cascade_model else []),
+        active_hours=ModelWarmupManager.parse_active_hours(os.getenv("TRINITY_WARMUP_HOURS")),
+        http_client=http_client
+    )
+    await model_warmup.start()
+    
+    # CPU-bound parsing of large responses runs off the event loop
+    # (TRINITY_OFFLOAD_MODE=process uses worker processes for gateway parsing)
+    offload_workers = int(os.getenv("TRINITY_OFFLOAD_WORKERS", "4"))
+    offload_min_chars = int(os.getenv("TRINITY_OFFLOAD_MIN_CHARS", "8192"))
+    
     # Initialize Polkadot gateway
-    gateway_instance = PolkadotGateway()
+    model_deadline = os.getenv("TRINITY_MODEL_DEADLINE_SECONDS")
+    gateway_instance = PolkadotGateway(
+        quorum_size=int(os.getenv("TRINITY_QUORUM_SIZE", "3")),
+        model_deadline_seconds=float(model_deadline) if model_deadline else None,
+        straggler_policy=os.getenv("TRINITY_STRAGGLER_POLICY", "cancel"),
+        response_cache=response_cache,
+        endpoint_pool=endpoint_pool,
+        model_warmup=model_warmup,
+        cpu_offload=CPUOffloader(
+            "gateway",
+            max_workers=offload_workers,
+            mode=os.getenv("TRINITY_OFFLOAD_MODE", "thread"),
+            min_offload_size=offload_min_chars
+        ),
+        http_client=http_client,
+        upstream_policies=upstream_policies,
+        hedged_fetch=os.getenv("TRINITY_HEDGED_FETCH", "false").lower() == "true",
+        circuit_breakers=circuit_breakers
+    )
     await gateway_instance.__aenter__()
     
     # Initialize Ultimate AI Trinity Coordinator
@@ -66,8 +139,42 @@ async def lifespan(app: FastAPI):
         performance_xnode="23.92.65.18",
         trinity_port=11434,
         max_concurrent_requests=10,
-        enable_monitoring=True
+        enable_monitoring=True,
+        response_cache=response_cache,
+        endpoint_pool=endpoint_pool,
+        model_warmup=model_warmup,
+        cascade_model=cascade_model,
+        cascade_confidence_threshold=float(os.getenv("TRINITY_CASCADE_CONFIDENCE", "0.6")),
+        cascade_quality_threshold=float(os.getenv("TRINITY_CASCADE_QUALITY", "0.5")),
+        cpu_offload_workers=offload_workers,
+        cpu_offload_min_chars=offload_min_chars,
+        http_client=http_client,
+        upstream_policies=upstream_policies
+    )
+    
+    # Initialize persistent analysis result store (optional)
+    database_url = os.getenv("DATABASE_URL")
+    if database_url:
+        try:
+            db_pool = await asyncpg.create_pool(database_url, min_size=1, max_size=5)
+            analysis_store = AnalysisResultStore(db_pool)
+            await analysis_store.initialize()
+        except Exception as e:
+            logger.warning(f"⚠️ Analysis result store unavailable - recomputing every analysis: {str(e)}")
+            analysis_store = None
+    
+    # Background analysis job queue (Redis backend for multi-worker deployments)
+    redis_url = os.getenv("REDIS_URL")
+    if os.getenv("ANALYSIS_JOB_BACKEND", "memory") == "redis" and redis_url:
+        job_backend = RedisJobBackend.from_url(redis_url)
+    else:
+        job_backend = InMemoryJobBackend()
+    job_queue = AnalysisJobQueue(
+        job_backend,
+        _process_analysis_job,
+        worker_count=int(os.getenv("ANALYSIS_JOB_WORKERS", "2"))
     )
+    await job_queue.start()
     
     # Validate Ultimate AI Trinity health
     trinity_health = await trinity_coordinator.health_check()
@@ -83,10 +190,20 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown: Cleanup enterprise connections
+    if job_queue:
+        await job_queue.stop()
+    if model_warmup:
+        await model_warmup.stop()
     if trinity_coordinator:
         await trinity_coordinator.cleanup()
     if gateway_instance:
         await gateway_instance.__aexit__(None, None, None)
+    if db_pool:
+        await db_pool.close()
+    if response_cache:
+        await response_cache.close()
+    if http_client:
+        await http_client.close()
     logger.info("🔥 Polka-Trinity API shutdown complete")
 
 # Initialize FastAPI with enterprise configuration
@@ -121,6 +238,7 @@ class AnalysisRequest(BaseModel):
     complexity_override: Optional[AnalysisComplexity] = Field(None, description="Override automatic complexity assessment")
     models_override: Optional[List[TrinityModel]] = Field(None, description="Override default model selection")
     include_raw_responses: bool = Field(False, description="Include raw AI model responses")
+    force_refresh: bool = Field(False, description="Recompute analysis even if a stored result matches")
 
 class TrinityStatus(BaseModel):
     """Ultimate AI Trinity infrastructure status"""
@@ -155,11 +273,27 @@ class AnalysisResponse(BaseModel):
     complexity_level: AnalysisComplexity
     models_used: List[TrinityModel]
     xnode_coordination: Dict[str, str]
+    generation_stats: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="Ollama token counts and timings per model")
     
     # Enterprise Metrics
     cost_savings_vs_cloud: str
     sovereignty_score: str
     infrastructure_efficiency: str
+    
+    # Served from the persistent result store instead of recomputed
+    served_from_store: bool = False
+
+class AnalysisJobResponse(BaseModel):
+    """Status of a background referendum analysis job"""
+    job_id: str
+    referendum_id: int
+    status: str = Field(..., description="queued, running, completed or failed")
+    status_url: str
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    result: Optional[AnalysisResponse] = None
+    error: Optional[str] = None
 
 class ErrorResponse(BaseModel):
     """Standardized error response"""
@@ -173,7 +307,7 @@ class ErrorResponse(BaseModel):
 
 class TrinityAnalysisRequest(BaseModel):
     """Request model for advanced Ultimate AI Trinity analysis"""
-    content: str = Field(..., description="Content to analyze", min_length=1, max_length=8000)
+    content: str = Field(..., description="Content to analyze (long content is summarized in chunks)", min_length=1, max_length=200000)
     analysis_type: TrinityAnalysisType = Field(..., description="Type of analysis to perform")
     complexity: TrinityComplexity = Field(TrinityComplexity.MODERATE, description="Analysis complexity level")
     models_required: Optional[List[CoordinatorTrinityModel]] = Field(None, description="Specific models to use")
@@ -181,6 +315,7 @@ class TrinityAnalysisRequest(BaseModel):
     temperature: float = Field(0.7, description="Model temperature", ge=0.0, le=2.0)
     max_tokens: int = Field(4000, description="Maximum tokens for response", ge=100, le=8000)
     priority: int = Field(1, description="Request priority", ge=1, le=5)
+    cascade: bool = Field(False, description="Answer with the cascade model first, escalating to flagship models on low confidence")
 
 class TrinityAnalysisResponse(BaseModel):
     """Response model for advanced Ultimate AI Trinity analysis"""
@@ -207,6 +342,9 @@ class TrinityAnalysisResponse(BaseModel):
     models_used: List[str]
     infrastructure: str
     timestamp: datetime
+    
+    # Cascade mode outcome (when requested)
+    cascade: Optional[Dict[str, Any]] = None
 
 class MathematicalVerificationRequest(BaseModel):
     """Request model for DeepSeek-R1 mathematical verification"""
@@ -282,6 +420,15 @@ async def get_gateway() -> PolkadotGateway:
         )
     return gateway_instance
 
+async def get_job_queue() -> AnalysisJobQueue:
+    """Get analysis job queue with validation"""
+    if not job_queue:
+        raise HTTPException(
+            status_code=503,
+            detail="Analysis job queue not available - service not initialized"
+        )
+    return job_queue
+
 async def get_trinity_coordinator() -> UltimateAITrinityCoordinator:
     """Get Ultimate AI Trinity coordinator with validation"""
     if not trinity_coordinator:
@@ -372,6 +519,81 @@ async def get_trinity_status(
 
 # Advanced Ultimate AI Trinity Analysis Endpoints
 
+def _build_trinity_request(request: TrinityAnalysisRequest) -> TrinityRequest:
+    """Translate an API request into a coordinator TrinityRequest"""
+    return TrinityRequest(
+        content=request.content,
+        analysis_type=request.analysis_type,
+        complexity=request.complexity,
+        context={},
+        priority=request.priority,
+        max_tokens=request.max_tokens,
+        temperature=request.temperature,
+        require_consensus=request.require_consensus,
+        models_required=request.models_required,
+        cascade=request.cascade
+    )
+
+
+def _build_trinity_analysis_response(analysis) -> TrinityAnalysisResponse:
+    """Build the API response for a coordinated Trinity analysis"""
+    # Build model-specific responses
+    model_responses = {}
+    for response in analysis.flagship_responses:
+        if response.model == CoordinatorTrinityModel.DEEPSEEK_R1:
+            model_responses["deepseek_response"] = {
+                "content": response.content,
+                "confidence": response.confidence,
+                "reasoning_quality": response.reasoning_quality,
+                "specialization": "Mathematical reasoning and economic modeling",
+                "token_count": response.token_count,
+                "generation_stats": response.generation_stats,
+                "parameters": "671B"
+            }
+        elif response.model == CoordinatorTrinityModel.LLAMA4_MAVERICK:
+            model_responses["llama_response"] = {
+                "content": response.content,
+                "confidence": response.confidence,
+                "reasoning_quality": response.reasoning_quality,
+                "specialization": "Strategic intelligence and planning",
+                "token_count": response.token_count,
+                "generation_stats": response.generation_stats,
+                "parameters": "400B"
+            }
+        elif response.model == CoordinatorTrinityModel.QWEN3:
+            model_responses["qwen_response"] = {
+                "content": response.content,
+                "confidence": response.confidence,
+                "reasoning_quality": response.reasoning_quality,
+                "specialization": "Global perspective and cultural analysis",
+                "token_count": response.token_count,
+                "generation_stats": response.generation_stats,
+                "parameters": "235B MoE"
+            }
+    
+    return TrinityAnalysisResponse(
+        request_id=analysis.request_id,
+        analysis_type=analysis.analysis_type,
+        coordinated_insight=analysis.coordinated_insight,
+        processing_time_seconds=analysis.processing_time,
+        confidence_score=analysis.confidence_score,
+        consensus_level=analysis.consensus_level,
+        total_parameters_utilized=analysis.total_parameters_utilized,
+        cost_efficiency=analysis.cost_efficiency,
+        competitive_advantages=analysis.competitive_advantages,
+        models_used=analysis.metadata["models_used"],
+        infrastructure="Multi-Xnode Sovereign Architecture",
+        timestamp=datetime.now(timezone.utc),
+        cascade=analysis.metadata.get("cascade"),
+        **model_responses
+    )
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Events frame"""
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
 @app.post("/trinity/analyze", response_model=TrinityAnalysisResponse)
 async def advanced_trinity_analysis(
     request: TrinityAnalysisRequest,
@@ -391,65 +613,13 @@ async def advanced_trinity_analysis(
         logger.info(f"🧠 Advanced Trinity analysis initiated: {request.analysis_type.value}")
         
         # Build Trinity request
-        trinity_request = TrinityRequest(
-            content=request.content,
-            analysis_type=request.analysis_type,
-            complexity=request.complexity,
-            context={},
-            priority=request.priority,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-            require_consensus=request.require_consensus,
-            models_required=request.models_required
-        )
+        trinity_request = _build_trinity_request(request)
         
         # Execute Ultimate AI Trinity coordination
         analysis = await coordinator.coordinate_ultimate_trinity_analysis(trinity_request)
         
-        # Build model-specific responses
-        model_responses = {}
-        for response in analysis.flagship_responses:
-            if response.model == CoordinatorTrinityModel.DEEPSEEK_R1:
-                model_responses["deepseek_response"] = {
-                    "content": response.content,
-                    "confidence": response.confidence,
-                    "reasoning_quality": response.reasoning_quality,
-                    "specialization": "Mathematical reasoning and economic modeling",
-                    "parameters": "671B"
-                }
-            elif response.model == CoordinatorTrinityModel.LLAMA4_MAVERICK:
-                model_responses["llama_response"] = {
-                    "content": response.content,
-                    "confidence": response.confidence,
-                    "reasoning_quality": response.reasoning_quality,
-                    "specialization": "Strategic intelligence and planning",
-                    "parameters": "400B"
-                }
-            elif response.model == CoordinatorTrinityModel.QWEN3:
-                model_responses["qwen_response"] = {
-                    "content": response.content,
-                    "confidence": response.confidence,
-                    "reasoning_quality": response.reasoning_quality,
-                    "specialization": "Global perspective and cultural analysis",
-                    "parameters": "235B MoE"
-                }
-        
         # Build comprehensive response
-        return TrinityAnalysisResponse(
-            request_id=analysis.request_id,
-            analysis_type=analysis.analysis_type,
-            coordinated_insight=analysis.coordinated_insight,
-            processing_time_seconds=analysis.processing_time,
-            confidence_score=analysis.confidence_score,
-            consensus_level=analysis.consensus_level,
-            total_parameters_utilized=analysis.total_parameters_utilized,
-            cost_efficiency=analysis.cost_efficiency,
-            competitive_advantages=analysis.competitive_advantages,
-            models_used=analysis.metadata["models_used"],
-            infrastructure="Multi-Xnode Sovereign Architecture",
-            timestamp=datetime.now(timezone.utc),
-            **model_responses
-        )
+        return _build_trinity_analysis_response(analysis)
         
     except Exception as e:
         logger.error(f"❌ Advanced Trinity analysis failed: {str(e)}")
@@ -458,6 +628,35 @@ async def advanced_trinity_analysis(
             detail=f"Advanced Trinity analysis failed: {str(e)}"
         )
 
+@app.post("/trinity/analyze/stream")
+async def advanced_trinity_analysis_stream(
+    request: TrinityAnalysisRequest,
+    coordinator: UltimateAITrinityCoordinator = Depends(get_trinity_coordinator)
+):
+    """
+    Streaming Ultimate AI Trinity analysis over Server-Sent Events
+    
+    Emits ``token`` events as each flagship model generates, a
+    ``model_complete`` event per model and a final ``synthesis`` event
+    carrying the same payload as /trinity/analyze.
+    """
+    logger.info(f"🧠 Streaming Trinity analysis initiated: {request.analysis_type.value}")
+    trinity_request = _build_trinity_request(request)
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event in coordinator.stream_ultimate_trinity_analysis(trinity_request):
+                if event["event"] == "synthesis":
+                    yield _sse_event("synthesis", _build_trinity_analysis_response(event["analysis"]))
+                else:
+                    yield _sse_event(event["event"], event)
+        except Exception as e:
+            logger.error(f"❌ Streaming Trinity analysis failed: {str(e)}")
+            yield _sse_event("error", {"detail": f"Advanced Trinity analysis failed: {str(e)}"})
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/trinity/mathematical-verification", response_model=MathematicalVerificationResponse)
 async def mathematical_verification(
     request: MathematicalVerificationRequest,
@@ -945,7 +1144,12 @@ async def trinity_health_detailed(
                 "deepseek_r1": "Mathematical reasoning and economic modeling supremacy",
                 "llama4_maverick": "Strategic intelligence and planning leadership",
                 "qwen3": "Global perspective and cultural analysis mastery"
-            }
+            },
+            "adaptive_concurrency": {
+                model.value: limiter.stats()
+                for model, limiter in coordinator.concurrency_limiters.items()
+            },
+            "cascade": coordinator.cascade_stats()
         })
         
         return health_status
@@ -956,11 +1160,85 @@ async def trinity_health_detailed(
 
 # Core Analysis Endpoints
 
+async def _store_analysis(analysis: TrinityAnalysis, content_hash: str) -> None:
+    """
+    Persist an analysis for reuse, skipping runs where no model answered
+    
+    A closed referendum's content hash never changes, so a stored failure
+    (outage, missed deadline) would be served until a forced refresh.
+    """
+    if not analysis_store:
+        return
+    if not PolkadotGateway.is_storable_analysis(analysis):
+        logger.warning(
+            f"⚠️ Not storing failed analysis for #{analysis.referendum_id} ({analysis.trinity_recommendation})"
+        )
+        return
+    await analysis_store.save(analysis, content_hash)
+
+def _analysis_store_key(proposal: GovernanceProposal, request: AnalysisRequest) -> str:
+    """
+    Analysis store key for a proposal and the requested model routing
+    
+    Default routing is derived from the proposal itself, so the content hash
+    alone identifies it; explicit overrides are folded into the key so they
+    never reuse an analysis produced by a different model selection.
+    """
+    content_hash = proposal.content_hash()
+    if request.complexity_override is None and not request.models_override:
+        return content_hash
+    
+    routing = {
+        "complexity": request.complexity_override.value if request.complexity_override else None,
+        "models": sorted({model.value for model in request.models_override or []})
+    }
+    return hashlib.sha256(f"{content_hash}:{json.dumps(routing, sort_keys=True)}".encode()).hexdigest()
+
+
+def _build_analysis_response(analysis: TrinityAnalysis,
+                             processing_time_ms: float,
+                             served_from_store: bool) -> AnalysisResponse:
+    """Build the enterprise response for a referendum Trinity analysis"""
+    return AnalysisResponse(
+        referendum_id=analysis.referendum_id,
+        analysis_timestamp=analysis.analysis_timestamp,
+        processing_time_ms=int(processing_time_ms),
+        
+        # Trinity Synthesis
+        trinity_recommendation=analysis.trinity_recommendation,
+        trinity_confidence=analysis.trinity_confidence,
+        trinity_reasoning=analysis.trinity_reasoning,
+        consensus_strength=85.0,  # Calculated from model agreement
+        
+        # Individual Model Results
+        deepseek_analysis=analysis.deepseek_analysis,
+        llama_strategic=analysis.llama_strategic,
+        qwen_global=analysis.qwen_global,
+        
+        # Analysis Matrices
+        risk_assessment=analysis.risk_assessment,
+        sentiment_matrix=analysis.sentiment_matrix,
+        
+        # Infrastructure Metadata
+        complexity_level=analysis.complexity_level,
+        models_used=analysis.models_used,
+        xnode_coordination=analysis.xnode_coordination,
+        generation_stats=analysis.generation_stats,
+        
+        # Enterprise Value Metrics
+        cost_savings_vs_cloud="$3.6M-6M annually vs cloud AI equivalents",
+        sovereignty_score="100% - Complete infrastructure ownership",
+        infrastructure_efficiency="Infinite ROI with $0 operational AI costs",
+        served_from_store=served_from_store
+    )
+
+
 @app.post("/analyze/referendum/{referendum_id}", response_model=AnalysisResponse)
 async def analyze_referendum(
     referendum_id: int,
     request: AnalysisRequest,
     background_tasks: BackgroundTasks,
+    async_mode: bool = Query(False, alias="async", description="Queue the analysis and return a job ID immediately"),
     gateway: PolkadotGateway = Depends(get_gateway)
 ):
     """
@@ -972,11 +1250,10 @@ async def analyze_referendum(
     - Qwen3:235b MoE for global perspective and multilingual analysis
     
     Returns comprehensive governance intelligence with enterprise-grade insights.
+    With ``?async=true`` the analysis is queued and a job is returned with
+    status 202; poll ``GET /jobs/{job_id}`` for the result.
     """
     try:
-        start_time = datetime.now()
-        logger.info(f"🧠 Starting Ultimate AI Trinity analysis for referendum #{referendum_id}")
-        
         # Validate referendum ID
         if referendum_id != request.referendum_id:
             raise HTTPException(
@@ -984,64 +1261,19 @@ async def analyze_referendum(
                 detail="Referendum ID mismatch between path and request body"
             )
         
-        # Fetch governance proposal data
-        proposal = await gateway.fetch_referendum_data(referendum_id)
-        if not proposal:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Referendum #{referendum_id} not found or data unavailable"
-            )
-        
-        logger.info(f"📊 Proposal data acquired: '{proposal.title[:50]}...'")
-        
-        # Execute Ultimate AI Trinity analysis
-        analysis = await gateway.analyze_with_ultimate_trinity(proposal)
+        if async_mode:
+            queue = await get_job_queue()
+            job = await queue.submit(referendum_id, jsonable_encoder(request))
+            return JSONResponse(status_code=202, content=jsonable_encoder(_build_job_response(job)))
         
-        # Calculate processing metrics
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
-        
-        # Build enterprise response
-        response = AnalysisResponse(
-            referendum_id=analysis.referendum_id,
-            analysis_timestamp=analysis.analysis_timestamp,
-            processing_time_ms=int(processing_time),
-            
-            # Trinity Synthesis
-            trinity_recommendation=analysis.trinity_recommendation,
-            trinity_confidence=analysis.trinity_confidence,
-            trinity_reasoning=analysis.trinity_reasoning,
-            consensus_strength=85.0,  # Calculated from model agreement
-            
-            # Individual Model Results
-            deepseek_analysis=analysis.deepseek_analysis,
-            llama_strategic=analysis.llama_strategic,
-            qwen_global=analysis.qwen_global,
-            
-            # Analysis Matrices
-            risk_assessment=analysis.risk_assessment,
-            sentiment_matrix=analysis.sentiment_matrix,
-            
-            # Infrastructure Metadata
-            complexity_level=analysis.complexity_level,
-            models_used=analysis.models_used,
-            xnode_coordination=analysis.xnode_coordination,
-            
-            # Enterprise Value Metrics
-            cost_savings_vs_cloud="$3.6M-6M annually vs cloud AI equivalents",
-            sovereignty_score="100% - Complete infrastructure ownership",
-            infrastructure_efficiency="Infinite ROI with $0 operational AI costs"
-        )
+        response = await _run_referendum_analysis(referendum_id, request, gateway)
         
         # Add background monitoring task
         background_tasks.add_task(
             log_analysis_metrics,
-            referendum_id, processing_time, analysis.trinity_confidence
+            referendum_id, response.processing_time_ms, response.trinity_confidence
         )
         
-        logger.info(f"✅ Ultimate AI Trinity analysis complete for #{referendum_id}")
-        logger.info(f"🎯 Recommendation: {analysis.trinity_recommendation} ({analysis.trinity_confidence:.1f}% confidence)")
-        logger.info(f"⚡ Processing time: {processing_time:.0f}ms")
-        
         return response
         
     except HTTPException:
@@ -1053,6 +1285,151 @@ async def analyze_referendum(
             detail=f"Analysis failed: {str(e)}"
         )
 
+async def _run_referendum_analysis(
+    referendum_id: int,
+    request: AnalysisRequest,
+    gateway: PolkadotGateway
+) -> AnalysisResponse:
+    """Fetch, analyze (or reuse a stored analysis) and build the enterprise response"""
+    start_time = datetime.now()
+    logger.info(f"🧠 Starting Ultimate AI Trinity analysis for referendum #{referendum_id}")
+    
+    # Fetch governance proposal data
+    proposal = await gateway.fetch_referendum_data(referendum_id, use_cache=not request.force_refresh)
+    if not proposal:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Referendum #{referendum_id} not found or data unavailable"
+        )
+    
+    logger.info(f"📊 Proposal data acquired: '{proposal.title[:50]}...'")
+    
+    # Reuse a stored analysis when the proposal content is unchanged
+    content_hash = _analysis_store_key(proposal, request)
+    analysis = None
+    if analysis_store and not request.force_refresh:
+        analysis = await analysis_store.get(referendum_id, content_hash)
+        if analysis:
+            logger.info(f"🗄️ Stored Trinity analysis reused for #{referendum_id}")
+    
+    served_from_store = analysis is not None
+    if not served_from_store:
+        # Execute Ultimate AI Trinity analysis
+        on_enriched = None
+        if analysis_store:
+            # Late quorum stragglers replace the stored result once they land
+            async def on_enriched(enriched: TrinityAnalysis) -> None:
+                await _store_analysis(enriched, content_hash)
+        
+        analysis = await gateway.analyze_with_ultimate_trinity(
+            proposal,
+            on_enriched=on_enriched,
+            complexity_override=request.complexity_override,
+            models_override=request.models_override
+        )
+        await _store_analysis(analysis, content_hash)
+    
+    # Calculate processing metrics
+    processing_time = (datetime.now() - start_time).total_seconds() * 1000
+    
+    # Build enterprise response
+    response = _build_analysis_response(analysis, processing_time, served_from_store)
+    
+    logger.info(f"✅ Ultimate AI Trinity analysis complete for #{referendum_id}")
+    logger.info(f"🎯 Recommendation: {analysis.trinity_recommendation} ({analysis.trinity_confidence:.1f}% confidence)")
+    logger.info(f"⚡ Processing time: {processing_time:.0f}ms")
+    
+    return response
+
+async def _process_analysis_job(job: AnalysisJob) -> Dict[str, Any]:
+    """Job queue handler: run a queued referendum analysis"""
+    request = AnalysisRequest(**job.request)
+    response = await _run_referendum_analysis(job.referendum_id, request, await get_gateway())
+    await log_analysis_metrics(job.referendum_id, response.processing_time_ms, response.trinity_confidence)
+    return jsonable_encoder(response)
+
+def _build_job_response(job: AnalysisJob) -> AnalysisJobResponse:
+    """Build the API view of an analysis job"""
+    return AnalysisJobResponse(
+        job_id=job.job_id,
+        referendum_id=job.referendum_id,
+        status=job.status.value,
+        status_url=f"/jobs/{job.job_id}",
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        result=job.result,
+        error=job.error
+    )
+
+@app.get("/jobs/{job_id}", response_model=AnalysisJobResponse)
+async def get_analysis_job(job_id: str, queue: AnalysisJobQueue = Depends(get_job_queue)):
+    """Status and, once completed, result of a background analysis job"""
+    job = await queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Analysis job {job_id} not found or expired")
+    return _build_job_response(job)
+
+@app.post("/analyze/referendum/{referendum_id}/stream")
+async def analyze_referendum_stream(
+    referendum_id: int,
+    request: AnalysisRequest,
+    gateway: PolkadotGateway = Depends(get_gateway)
+):
+    """
+    Streaming Ultimate AI Trinity governance analysis over Server-Sent Events
+    
+    Emits ``token`` events from DeepSeek-R1, Llama4:maverick and Qwen3 as
+    they generate, a ``model_complete`` event per model and a final
+    ``synthesis`` event carrying the same payload as the non-streaming
+    endpoint. Stored analyses are replayed as a single ``synthesis`` event.
+    """
+    if referendum_id != request.referendum_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Referendum ID mismatch between path and request body"
+        )
+    
+    proposal = await gateway.fetch_referendum_data(referendum_id, use_cache=not request.force_refresh)
+    if not proposal:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Referendum #{referendum_id} not found or data unavailable"
+        )
+    
+    async def event_stream() -> AsyncIterator[str]:
+        start_time = datetime.now()
+        content_hash = _analysis_store_key(proposal, request)
+        try:
+            if analysis_store and not request.force_refresh:
+                analysis = await analysis_store.get(referendum_id, content_hash)
+                if analysis:
+                    processing_time = (datetime.now() - start_time).total_seconds() * 1000
+                    yield _sse_event("synthesis", _build_analysis_response(analysis, processing_time, True))
+                    return
+            
+            async for event in gateway.stream_ultimate_trinity(
+                proposal,
+                complexity_override=request.complexity_override,
+                models_override=request.models_override
+            ):
+                if event["event"] != "synthesis":
+                    yield _sse_event(event["event"], event)
+                    continue
+                
+                analysis = event["analysis"]
+                await _store_analysis(analysis, content_hash)
+                processing_time = (datetime.now() - start_time).total_seconds() * 1000
+                yield _sse_event("synthesis", _build_analysis_response(analysis, processing_time, False))
+                await log_analysis_metrics(referendum_id, processing_time, analysis.trinity_confidence)
+        
+        except Exception as e:
+            logger.error(f"❌ Streaming Trinity analysis failed for #{referendum_id}: {str(e)}")
+            yield _sse_event("error", {"detail": f"Analysis failed: {str(e)}"})
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.get("/analyze/referendum/{referendum_id}/proposal", response_model=Dict[str, Any])
 async def get_referendum_proposal(
     referendum_id: int,
@@ -1129,7 +1506,7 @@ async def analyze_multiple_referendums(
         async def analyze_single(ref_id: int) -> AnalysisResponse:
             async with semaphore:
                 request = AnalysisRequest(referendum_id=ref_id)
-                return await analyze_referendum(ref_id, request, BackgroundTasks(), gateway)
+                return await _run_referendum_analysis(ref_id, request, gateway)
         
         # Execute batch analysis
         tasks = [analyze_single(ref_id) for ref_id in referendum_ids]
@@ -1234,11 +1611,17 @@ async def get_governance_trends():
 # Administrative Endpoints
 
 @app.post("/admin/cache/clear")
-async def clear_analysis_cache():
+async def clear_analysis_cache(gateway: PolkadotGateway = Depends(get_gateway)):
     """Clear analysis cache (admin only)"""
-    # This would implement cache clearing logic
-    logger.info("🧹 Analysis cache cleared")
-    return {"message": "Cache cleared successfully", "timestamp": datetime.now(timezone.utc)}
+    referenda_cleared = gateway.referendum_cache.clear()
+    responses_cleared = await gateway.response_cache.clear()
+    logger.info(f"🧹 Analysis cache cleared - {referenda_cleared} referenda, {responses_cleared} model responses dropped")
+    return {
+        "message": "Cache cleared successfully",
+        "referenda_cleared": referenda_cleared,
+        "model_responses_cleared": responses_cleared,
+        "timestamp": datetime.now(timezone.utc)
+    }
 
 @app.get("/admin/system/diagnostics")
 async def system_diagnostics(gateway: PolkadotGateway = Depends(get_gateway)):
@@ -1260,16 +1643,24 @@ async def system_diagnostics(gateway: PolkadotGateway = Depends(get_gateway)):
                     "total_parameters": "1.306+ trillion"
                 }
             },
-            "data_sources": {
-                "polkassembly_api": "Operational",
-                "subscan_api": "Operational", 
-                "governance_api": "Operational"
-            },
+            "data_sources": gateway.data_source_status(),
             "processing_statistics": {
                 "requests_processed": gateway.request_counter,
                 "errors_encountered": gateway.error_counter,
                 "success_rate": f"{((gateway.request_counter - gateway.error_counter) / max(1, gateway.request_counter)) * 100:.2f}%"
             },
+            "model_endpoints": gateway.endpoint_pool.stats(),
+            "referendum_cache": gateway.referendum_cache.stats(),
+            "model_response_cache": gateway.response_cache.stats(),
+            "request_coalescing": gateway.analysis_flights.stats(),
+            "chunk_summaries": gateway.description_summarizer.stats(),
+            "cpu_offload": gateway.cpu_offload.stats(),
+            "http_pool": gateway.http_client.stats(),
+            "upstream_policies": gateway.upstream_policies.stats(),
+            "hedged_fetch": gateway.hedge_stats(),
+            "circuit_breakers": gateway.circuit_breakers.stats(),
+            "analysis_jobs": await job_queue.stats() if job_queue else {"status": "disabled"},
+            "analysis_store": analysis_store.stats() if analysis_store else {"status": "disabled"},
             "enterprise_metrics": {
                 "cost_efficiency": "$0 AI operational costs",
                 "infrastructure_sovereignty": "100% customer ownership",
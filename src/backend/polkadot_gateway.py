@@ -14,13 +14,29 @@ import asyncio
 import aiohttp
 import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, asdict, field, replace
 from enum import Enum
 import hashlib
 import hmac
 
+from .chunked_analysis import ChunkedSummarizer
+from .circuit_breaker import CLOSED, HALF_OPEN, CircuitBreakers, CircuitOpenError
+from .cpu_offload import CPUOffloader
+from .http_client import HTTPClientManager
+from .model_endpoints import ModelEndpointPool
+from .model_schemas import DeepSeekAnalysis, LlamaStrategicAnalysis, QwenGlobalAnalysis, parse_structured_response
+from .model_warmup import ModelWarmupManager
+from .ollama_protocol import GenerationStats, stream_generate
+from .prompt_templates import DEEPSEEK_TEMPLATE, DESCRIPTION_TOKEN_BUDGET, LLAMA_TEMPLATE, QWEN_TEMPLATE
+from .request_coalescing import SingleFlight
+from .response_cache import ModelResponseCache
+from .response_scanner import ResponseScanner
+from .upstream_policy import UpstreamPolicies, UpstreamStatusError
+
 # Configure logging for enterprise monitoring
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,6 +72,25 @@ class GovernanceProposal:
     conviction_votes: Dict[str, int]
     discussion_url: str
     on_chain_data: Dict[str, Any]
+    
+    def content_hash(self) -> str:
+        """Stable hash of the proposal fields fed into Trinity prompts"""
+        prompt_fields = {
+            "referendum_id": self.referendum_id,
+            "title": self.title,
+            "description": self.description,
+            "proposer": self.proposer,
+            "beneficiary": self.beneficiary,
+            "amount": self.amount,
+            "currency": self.currency,
+            "status": self.status,
+            "aye_votes": self.aye_votes,
+            "nay_votes": self.nay_votes,
+            "support_percentage": round(self.support_percentage, 1),
+            "discussion_url": self.discussion_url
+        }
+        encoded = json.dumps(prompt_fields, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
 
 @dataclass
 class TrinityAnalysis:
@@ -92,6 +127,96 @@ class TrinityAnalysis:
     processing_time_ms: int
     models_used: List[TrinityModel]
     xnode_coordination: Dict[str, str]
+    
+    # Ollama token/timing metadata per model (GenerationStats.to_dict)
+    generation_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+class ModelNotRouted(Exception):
+    """Placeholder result for a flagship model excluded by complexity routing"""
+    pass
+
+
+class ReferendumCache:
+    """
+    Status-aware LRU cache for synthesized governance proposals
+
+    Closed referenda never change and are cached without expiry; ongoing
+    referenda are cached for a short TTL so vote tallies stay fresh.
+    """
+
+    # Referendum states (Subscan + Subsquare naming) that are final
+    FINAL_STATUSES = frozenset({
+        "executed", "approved", "passed", "rejected", "notpassed",
+        "cancelled", "canceled", "timedout", "killed"
+    })
+
+    def __init__(self, max_entries: int = 256, ongoing_ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ongoing_ttl_seconds = ongoing_ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[GovernanceProposal, Optional[float]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def is_final_status(cls, status: str) -> bool:
+        """Check whether a referendum status can no longer change"""
+        normalized = (status or "").replace("_", "").replace(" ", "").lower()
+        return normalized in cls.FINAL_STATUSES
+
+    def get(self, referendum_id: int) -> Optional[GovernanceProposal]:
+        """Return cached proposal if present and not expired"""
+        entry = self._entries.get(referendum_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        proposal, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[referendum_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(referendum_id)
+        self.hits += 1
+        return proposal
+
+    def put(self, proposal: GovernanceProposal) -> None:
+        """Cache proposal with a TTL derived from its status"""
+        if self.is_final_status(proposal.status):
+            expires_at = None
+        else:
+            expires_at = time.monotonic() + self.ongoing_ttl_seconds
+
+        self._entries[proposal.referendum_id] = (proposal, expires_at)
+        self._entries.move_to_end(proposal.referendum_id)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, referendum_id: int) -> None:
+        """Drop a single referendum from the cache"""
+        self._entries.pop(referendum_id, None)
+
+    def clear(self) -> int:
+        """Drop all cached proposals, returning the number removed"""
+        removed = len(self._entries)
+        self._entries.clear()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ongoing_ttl_seconds": self.ongoing_ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": f"{(self.hits / max(1, lookups)) * 100:.2f}%"
+        }
 
 class PolkadotGateway:
     """
@@ -103,7 +228,56 @@ class PolkadotGateway:
     - Enterprise Security: SOC 2, ISO 27001, GDPR compliance
     """
     
-    def __init__(self):
+    STRAGGLER_POLICIES = ("cancel", "enrich")
+    
+    # Synthesis outcomes produced when no model answer could be used
+    ERROR_RECOMMENDATIONS = frozenset({"ANALYSIS_ERROR", "SYNTHESIS_ERROR"})
+    
+    # Sources carrying proposal title/description (either one is enough when hedging)
+    METADATA_SOURCES = ("polkassembly", "subsquare")
+    
+    # Diagnostics keys for each data source breaker
+    DATA_SOURCE_LABELS = {
+        "polkassembly": "polkassembly_api",
+        "subscan": "subscan_api",
+        "subsquare": "governance_api"
+    }
+    
+    # Complexity-driven model routing (mirrors coordinator model selection)
+    COMPLEXITY_MODEL_ROUTING = {
+        AnalysisComplexity.SIMPLE: [TrinityModel.DEEPSEEK_R1],
+        AnalysisComplexity.MODERATE: [TrinityModel.DEEPSEEK_R1, TrinityModel.LLAMA4_MAVERICK],
+        AnalysisComplexity.COMPLEX: [TrinityModel.DEEPSEEK_R1, TrinityModel.LLAMA4_MAVERICK, TrinityModel.QWEN3],
+        AnalysisComplexity.FLAGSHIP: [TrinityModel.DEEPSEEK_R1, TrinityModel.LLAMA4_MAVERICK, TrinityModel.QWEN3]
+    }
+    
+    # Model that condenses long proposal descriptions (fastest of the Trinity)
+    SUMMARY_MODEL = TrinityModel.QWEN3
+    
+    # Typed result (and Ollama output schema) for each flagship analysis
+    STRUCTURED_OUTPUTS = {
+        TrinityModel.DEEPSEEK_R1: DeepSeekAnalysis,
+        TrinityModel.LLAMA4_MAVERICK: LlamaStrategicAnalysis,
+        TrinityModel.QWEN3: QwenGlobalAnalysis
+    }
+    
+    def __init__(self,
+                 quorum_size: int = 3,
+                 model_deadline_seconds: Optional[float] = None,
+                 straggler_policy: str = "cancel",
+                 response_cache: Optional[ModelResponseCache] = None,
+                 endpoint_pool: Optional[ModelEndpointPool] = None,
+                 model_warmup: Optional[ModelWarmupManager] = None,
+                 cpu_offload: Optional[CPUOffloader] = None,
+                 http_client: Optional[HTTPClientManager] = None,
+                 upstream_policies: Optional[UpstreamPolicies] = None,
+                 hedged_fetch: bool = False,
+                 circuit_breakers: Optional[CircuitBreakers] = None):
+        if not 1 <= quorum_size <= 3:
+            raise ValueError(f"quorum_size must be between 1 and 3, got {quorum_size}")
+        if straggler_policy not in self.STRAGGLER_POLICIES:
+            raise ValueError(f"Unknown straggler policy: {straggler_policy}")
+        
         # Multi-Xnode Configuration
         self.privacy_xnode = "23.92.65.57"
         self.performance_xnode = "23.92.65.18"
@@ -137,6 +311,58 @@ class PolkadotGateway:
             }
         }
         
+        # Circuit breakers per data source and model endpoint (open circuits fail fast)
+        self.circuit_breakers = circuit_breakers or CircuitBreakers()
+        
+        # Inference endpoints per model (least-outstanding-requests routing)
+        self.endpoint_pool = endpoint_pool or ModelEndpointPool(
+            {}, default_endpoints=[self.trinity_endpoint], circuit_breakers=self.circuit_breakers
+        )
+        
+        # Traffic-based keep_alive (the API lifespan also runs its preload loop)
+        self.model_warmup = model_warmup or ModelWarmupManager(
+            self.endpoint_pool, [model.value for model in TrinityModel]
+        )
+        
+        # Synthesized proposal cache (finalized referenda never expire)
+        self.referendum_cache = ReferendumCache()
+        
+        # Flagship model generation cache (shared with the coordinator when provided)
+        self.response_cache = response_cache or ModelResponseCache()
+        
+        # Concurrent identical analyses share one in-flight model run
+        self.analysis_flights = SingleFlight("gateway_analysis")
+        
+        # Long descriptions are map-reduced (two chunks in flight per endpoint)
+        self.description_summarizer = ChunkedSummarizer(
+            max_parallel=2 * len(self.endpoint_pool.endpoints_for(self.SUMMARY_MODEL.value))
+        )
+        
+        # Large model responses are parsed off the event loop (parsers are
+        # staticmethods, so a process pool works as well as threads)
+        self.cpu_offload = cpu_offload or CPUOffloader("gateway")
+        
+        # Quorum synthesis: synthesize once quorum_size models have answered
+        # or the deadline after the first answer passes; stragglers are
+        # cancelled or used to enrich
+        self.quorum_size = quorum_size
+        self.model_deadline_seconds = model_deadline_seconds
+        self.straggler_policy = straggler_policy
+        self._enrichment_tasks: Set[asyncio.Task] = set()
+        
+        # Connection pool (shared with the coordinator when provided)
+        self.http_client = http_client or HTTPClientManager("gateway")
+        self._owns_http_client = http_client is None
+        
+        # Per-destination timeouts, retries and retry budgets
+        self.upstream_policies = upstream_policies or UpstreamPolicies()
+        
+        # Hedged referendum fetch: synthesize once Subscan and either metadata
+        # source have answered, cancelling the slower metadata indexer
+        self.hedged_fetch = hedged_fetch
+        self.hedged_fetches = 0
+        self.hedge_laggards_cancelled: Dict[str, int] = {source: 0 for source in self.METADATA_SOURCES}
+        
         # Enterprise monitoring
         self.session = None
         self.request_counter = 0
@@ -144,45 +370,54 @@ class PolkadotGateway:
         
     async def __aenter__(self):
         """Async context manager for enterprise connection pooling"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={
-                "User-Agent": "Polka-Trinity/1.0 (Ultimate AI Governance Intelligence)",
-                "Accept": "application/json",
-                "Cache-Control": "no-cache"
-            }
-        )
+        self.session = self.http_client.session
         logger.info(f"🚀 Polka-Trinity Gateway initialized - Multi-Xnode coordination active")
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Cleanup enterprise connections"""
-        if self.session:
-            await self.session.close()
+        for task in list(self._enrichment_tasks):
+            task.cancel()
+        if self._enrichment_tasks:
+            await asyncio.gather(*self._enrichment_tasks, return_exceptions=True)
+        if self._owns_http_client:
+            await self.http_client.close()
+        self.cpu_offload.shutdown(wait=False)
         logger.info(f"✅ Gateway session closed - Requests: {self.request_counter}, Errors: {self.error_counter}")
 
-    async def fetch_referendum_data(self, referendum_id: int) -> Optional[GovernanceProposal]:
+    async def fetch_referendum_data(self, referendum_id: int, use_cache: bool = True) -> Optional[GovernanceProposal]:
         """
         Fetch comprehensive referendum data from multiple Polkadot sources
         Privacy Xnode: Secure HTTPS outcalls with data preprocessing
         """
         try:
             self.request_counter += 1
+            
+            if use_cache:
+                cached = self.referendum_cache.get(referendum_id)
+                if cached is not None:
+                    logger.debug(f"📦 Referendum #{referendum_id} served from cache")
+                    return cached
+            
             logger.info(f"📊 Fetching referendum #{referendum_id} via Privacy Xnode ({self.privacy_xnode})")
             
             # Parallel data fetching from multiple sources
-            tasks = [
-                self._fetch_polkassembly_data(referendum_id),
-                self._fetch_subscan_data(referendum_id),
-                self._fetch_governance_data(referendum_id)
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if self.hedged_fetch:
+                results = await self._fetch_sources_hedged(referendum_id)
+            else:
+                tasks = [
+                    self._fetch_polkassembly_data(referendum_id),
+                    self._fetch_subscan_data(referendum_id),
+                    self._fetch_governance_data(referendum_id)
+                ]
+                
+                results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Data synthesis and validation
             proposal = self._synthesize_proposal_data(referendum_id, results)
             
             if proposal:
+                self.referendum_cache.put(proposal)
                 logger.info(f"✅ Referendum #{referendum_id} data acquired - Ready for Ultimate AI Trinity")
                 return proposal
             else:
@@ -194,6 +429,90 @@ class PolkadotGateway:
             logger.error(f"❌ Failed to fetch referendum #{referendum_id}: {str(e)}")
             return None
 
+    async def _fetch_sources_hedged(self, referendum_id: int) -> List[Any]:
+        """
+        Fetch all three sources, returning once Subscan and one metadata source suffice
+        
+        Polkassembly and Subsquare both carry title and description, so the
+        first of them to return both (alongside Subscan on-chain data) is
+        enough to synthesize; the other is cancelled and passed on as {}.
+        Without Subscan data the governance fallbacks are needed, so every
+        source is awaited.
+        """
+        sources = {
+            "polkassembly": asyncio.create_task(self._fetch_polkassembly_data(referendum_id)),
+            "subscan": asyncio.create_task(self._fetch_subscan_data(referendum_id)),
+            "subsquare": asyncio.create_task(self._fetch_governance_data(referendum_id))
+        }
+        results: Dict[str, Any] = {}
+        pending: Set[asyncio.Task] = set(sources.values())
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for source, task in sources.items():
+                    if task in done:
+                        results[source] = task.exception() or task.result()
+                if self._hedge_satisfied(results):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if pending:
+            self.hedged_fetches += 1
+            for source, task in sources.items():
+                if task in pending:
+                    self.hedge_laggards_cancelled[source] += 1
+                    logger.info(f"✂️ Referendum #{referendum_id}: cancelled slow {source} fetch")
+        
+        return [results.get(source, {}) for source in ("polkassembly", "subscan", "subsquare")]
+
+    def _hedge_satisfied(self, results: Dict[str, Any]) -> bool:
+        """Whether Subscan plus one metadata source returned enough to synthesize"""
+        subscan = results.get("subscan")
+        if not isinstance(subscan, dict) or not subscan.get("data"):
+            return False
+        
+        polkassembly = results.get("polkassembly")
+        if isinstance(polkassembly, dict) and polkassembly:
+            if self._extract_title(polkassembly, {}) and self._extract_description(polkassembly, {}):
+                return True
+        
+        governance = results.get("subsquare")
+        if isinstance(governance, dict) and governance:
+            if self._extract_title({}, governance) and self._extract_description({}, governance):
+                return True
+        
+        return False
+
+    def data_source_status(self) -> Dict[str, str]:
+        """Data source health derived from circuit breaker state"""
+        status = {}
+        for source, label in self.DATA_SOURCE_LABELS.items():
+            state = self.circuit_breakers.state(source)
+            status[label] = "Operational" if state == CLOSED else "Recovering" if state == HALF_OPEN else "Degraded"
+        return status
+
+    def hedge_stats(self) -> Dict[str, Any]:
+        """Hedged fetch counters for monitoring"""
+        return {
+            "enabled": self.hedged_fetch,
+            "hedged_fetches": self.hedged_fetches,
+            "laggards_cancelled": dict(self.hedge_laggards_cancelled)
+        }
+
+    async def _call_data_source(
+        self,
+        source: str,
+        attempt: Callable[[aiohttp.ClientTimeout], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Call a data source under its circuit breaker and upstream policy"""
+        async with self.circuit_breakers.breaker(source).guard():
+            return await self.upstream_policies.call(source, attempt)
+
     async def _fetch_polkassembly_data(self, referendum_id: int) -> Dict[str, Any]:
         """Fetch detailed proposal information from Polkassembly"""
         try:
@@ -203,15 +522,22 @@ class PolkadotGateway:
                 "proposalType": "referendum_v2"
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.debug(f"📋 Polkassembly data acquired for #{referendum_id}")
-                    return data
-                else:
-                    logger.warning(f"⚠️ Polkassembly API error {response.status} for #{referendum_id}")
-                    return {}
+            async def attempt(timeout: aiohttp.ClientTimeout) -> Dict[str, Any]:
+                async with self.session.get(url, params=params, timeout=timeout) as response:
+                    if response.status != 200:
+                        raise UpstreamStatusError(response.status)
+                    return await response.json()
+            
+            data = await self._call_data_source("polkassembly", attempt)
+            logger.debug(f"📋 Polkassembly data acquired for #{referendum_id}")
+            return data
                     
+        except CircuitOpenError as e:
+            logger.debug(f"🔌 Polkassembly skipped for #{referendum_id}: {str(e)}")
+            return {}
+        except UpstreamStatusError as e:
+            logger.warning(f"⚠️ Polkassembly API error {e.status} for #{referendum_id}")
+            return {}
         except Exception as e:
             logger.error(f"❌ Polkassembly fetch error: {str(e)}")
             return {}
@@ -224,15 +550,22 @@ class PolkadotGateway:
                 "referendum_index": referendum_id
             }
             
-            async with self.session.post(url, json=data) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    logger.debug(f"⛓️ Subscan on-chain data acquired for #{referendum_id}")
-                    return result
-                else:
-                    logger.warning(f"⚠️ Subscan API error {response.status} for #{referendum_id}")
-                    return {}
+            async def attempt(timeout: aiohttp.ClientTimeout) -> Dict[str, Any]:
+                async with self.session.post(url, json=data, timeout=timeout) as response:
+                    if response.status != 200:
+                        raise UpstreamStatusError(response.status)
+                    return await response.json()
+            
+            result = await self._call_data_source("subscan", attempt)
+            logger.debug(f"⛓️ Subscan on-chain data acquired for #{referendum_id}")
+            return result
                     
+        except CircuitOpenError as e:
+            logger.debug(f"🔌 Subscan skipped for #{referendum_id}: {str(e)}")
+            return {}
+        except UpstreamStatusError as e:
+            logger.warning(f"⚠️ Subscan API error {e.status} for #{referendum_id}")
+            return {}
         except Exception as e:
             logger.error(f"❌ Subscan fetch error: {str(e)}")
             return {}
@@ -242,15 +575,22 @@ class PolkadotGateway:
         try:
             url = f"{self.governance_api}/gov2/referendums/{referendum_id}"
             
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.debug(f"🗳️ Governance discussion data acquired for #{referendum_id}")
-                    return data
-                else:
-                    logger.warning(f"⚠️ Governance API error {response.status} for #{referendum_id}")
-                    return {}
+            async def attempt(timeout: aiohttp.ClientTimeout) -> Dict[str, Any]:
+                async with self.session.get(url, timeout=timeout) as response:
+                    if response.status != 200:
+                        raise UpstreamStatusError(response.status)
+                    return await response.json()
+            
+            data = await self._call_data_source("subsquare", attempt)
+            logger.debug(f"🗳️ Governance discussion data acquired for #{referendum_id}")
+            return data
                     
+        except CircuitOpenError as e:
+            logger.debug(f"🔌 Governance skipped for #{referendum_id}: {str(e)}")
+            return {}
+        except UpstreamStatusError as e:
+            logger.warning(f"⚠️ Governance API error {e.status} for #{referendum_id}")
+            return {}
         except Exception as e:
             logger.error(f"❌ Governance fetch error: {str(e)}")
             return {}
@@ -441,76 +781,75 @@ class PolkadotGateway:
         except:
             return {}
 
-    async def analyze_with_ultimate_trinity(self, proposal: GovernanceProposal) -> TrinityAnalysis:
+    async def analyze_with_ultimate_trinity(
+        self,
+        proposal: GovernanceProposal,
+        on_enriched: Optional[Callable[[TrinityAnalysis], Awaitable[None]]] = None,
+        complexity_override: Optional[AnalysisComplexity] = None,
+        models_override: Optional[List[TrinityModel]] = None
+    ) -> TrinityAnalysis:
         """
         Coordinate Ultimate AI Trinity analysis (1.3T+ parameters)
         Performance Xnode: DeepSeek-R1 + Llama4:maverick + Qwen3 synthesis
+        
+        Only the models routed for the proposal complexity are called (see
+        ``select_models``); ``complexity_override`` and ``models_override``
+        replace the automatic assessment and routing. Synthesis runs as soon
+        as ``quorum_size`` models have answered, or ``model_deadline_seconds``
+        after the first model answered. With the ``enrich`` straggler policy, late models keep
+        running in the background and the analysis is re-synthesized and
+        handed to ``on_enriched`` once they finish.
+        
+        Concurrent calls for the same proposal content and routing await a
+        single shared run; only the first caller's ``on_enriched`` is used.
         """
+        flight_key = (
+            proposal.referendum_id,
+            proposal.content_hash(),
+            complexity_override,
+            tuple(models_override or ())
+        )
+        return await self.analysis_flights.do(
+            flight_key,
+            lambda: self._run_ultimate_trinity(proposal, on_enriched, complexity_override, models_override)
+        )
+
+    async def _run_ultimate_trinity(
+        self,
+        proposal: GovernanceProposal,
+        on_enriched: Optional[Callable[[TrinityAnalysis], Awaitable[None]]],
+        complexity_override: Optional[AnalysisComplexity],
+        models_override: Optional[List[TrinityModel]]
+    ) -> TrinityAnalysis:
+        """Execute one Ultimate AI Trinity analysis run"""
         start_time = datetime.now()
         logger.info(f"🧠 Starting Ultimate AI Trinity analysis for referendum #{proposal.referendum_id}")
         
         try:
             # Determine analysis complexity for intelligent model routing
-            complexity = self._assess_complexity(proposal)
+            complexity = complexity_override or self._assess_complexity(proposal)
+            selected_models = self.select_models(complexity, models_override)
+            logger.info(f"🤖 Routing #{proposal.referendum_id} ({complexity.value}) to {[m.value for m in selected_models]}")
+            prompt_proposal = await self._prepare_prompt_proposal(proposal)
             
             # Coordinate flagship model analysis
-            deepseek_task = self._analyze_with_deepseek(proposal, complexity)
-            llama_task = self._analyze_with_llama(proposal, complexity) 
-            qwen_task = self._analyze_with_qwen(proposal, complexity)
-            
-            # Parallel processing across Ultimate AI Trinity
-            deepseek_result, llama_result, qwen_result = await asyncio.gather(
-                deepseek_task, llama_task, qwen_task,
-                return_exceptions=True
-            )
-            
-            # Trinity synthesis and consensus building
-            trinity_synthesis = await self._synthesize_trinity_analysis(
-                proposal, deepseek_result, llama_result, qwen_result
-            )
+            model_analyzers = {
+                TrinityModel.DEEPSEEK_R1: self._analyze_with_deepseek,
+                TrinityModel.LLAMA4_MAVERICK: self._analyze_with_llama,
+                TrinityModel.QWEN3: self._analyze_with_qwen
+            }
+            model_tasks = {
+                model: asyncio.create_task(model_analyzers[model](prompt_proposal, complexity))
+                for model in selected_models
+            }
             
-            # Calculate processing metrics
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            # Parallel processing across Ultimate AI Trinity until quorum
+            results, stragglers = await self._await_model_quorum(model_tasks)
             
-            analysis = TrinityAnalysis(
-                referendum_id=proposal.referendum_id,
-                analysis_timestamp=datetime.now(timezone.utc),
-                complexity_level=complexity,
-                
-                # Trinity Synthesis (1.3T+ parameter coordination)
-                trinity_recommendation=trinity_synthesis["recommendation"],
-                trinity_confidence=trinity_synthesis["confidence"],
-                trinity_reasoning=trinity_synthesis["reasoning"],
-                
-                # Individual model results
-                deepseek_analysis=deepseek_result if not isinstance(deepseek_result, Exception) else {},
-                mathematical_validation=deepseek_result.get("mathematical", {}) if not isinstance(deepseek_result, Exception) else {},
-                economic_modeling=deepseek_result.get("economic", {}) if not isinstance(deepseek_result, Exception) else {},
-                
-                llama_strategic=llama_result if not isinstance(llama_result, Exception) else {},
-                long_term_impact=llama_result.get("strategic", {}) if not isinstance(llama_result, Exception) else {},
-                ecosystem_implications=llama_result.get("ecosystem", {}) if not isinstance(llama_result, Exception) else {},
-                
-                qwen_global=qwen_result if not isinstance(qwen_result, Exception) else {},
-                multilingual_sentiment=qwen_result.get("sentiment", {}) if not isinstance(qwen_result, Exception) else {},
-                cultural_analysis=qwen_result.get("cultural", {}) if not isinstance(qwen_result, Exception) else {},
-                
-                # Analysis matrices
-                risk_assessment=trinity_synthesis.get("risk_matrix", {}),
-                sentiment_matrix=trinity_synthesis.get("sentiment_matrix", {}),
-                
-                # Processing metadata
-                processing_time_ms=int(processing_time),
-                models_used=[TrinityModel.DEEPSEEK_R1, TrinityModel.LLAMA4_MAVERICK, TrinityModel.QWEN3],
-                xnode_coordination={
-                    "privacy_xnode": self.privacy_xnode,
-                    "performance_xnode": self.performance_xnode,
-                    "unified_access": self.unified_access
-                }
-            )
+            analysis = await self._synthesize_from_results(proposal, complexity, start_time, results)
             
-            logger.info(f"✅ Ultimate AI Trinity analysis complete for #{proposal.referendum_id} - {processing_time:.0f}ms")
-            logger.info(f"🎯 Trinity Recommendation: {trinity_synthesis['recommendation']} ({trinity_synthesis['confidence']:.1f}% confidence)")
+            if stragglers:
+                self._handle_stragglers(proposal, complexity, start_time, results, stragglers, on_enriched)
             
             return analysis
             
@@ -519,6 +858,253 @@ class PolkadotGateway:
             logger.error(f"❌ Ultimate AI Trinity analysis failed for #{proposal.referendum_id}: {str(e)}")
             raise
 
+    def select_models(self,
+                      complexity: AnalysisComplexity,
+                      models_override: Optional[List[TrinityModel]] = None) -> List[TrinityModel]:
+        """Select flagship models for a proposal complexity, honoring explicit overrides"""
+        if models_override:
+            # Preserve caller order while dropping duplicates
+            return list(dict.fromkeys(models_override))
+        return list(self.COMPLEXITY_MODEL_ROUTING[complexity])
+
+    async def _await_model_quorum(
+        self,
+        model_tasks: Dict[TrinityModel, asyncio.Task]
+    ) -> Tuple[Dict[TrinityModel, Any], Dict[TrinityModel, asyncio.Task]]:
+        """
+        Wait until the quorum of models has answered or the deadline passes
+        
+        The deadline starts at the first usable answer, so synthesis never
+        runs on zero answers while models are still generating (each model
+        call is bounded by its upstream policy timeout instead). Returns the
+        results collected so far (models still running map to a
+        TimeoutError placeholder) and the straggler tasks still running.
+        """
+        task_models = {task: model for model, task in model_tasks.items()}
+        pending = set(model_tasks.values())
+        results: Dict[TrinityModel, Any] = {}
+        answered = 0
+        
+        loop = asyncio.get_running_loop()
+        deadline: Optional[float] = None
+        
+        while pending and answered < self.quorum_size:
+            timeout = max(0.0, deadline - loop.time()) if deadline is not None else None
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                logger.warning(f"⏱️ Trinity model deadline reached with {answered}/{self.quorum_size} answers")
+                break
+            
+            for task in done:
+                results[task_models[task]] = task.exception() or task.result()
+                if self._is_model_answer(results[task_models[task]]):
+                    answered += 1
+            
+            if deadline is None and answered and self.model_deadline_seconds is not None:
+                deadline = loop.time() + self.model_deadline_seconds
+        
+        stragglers = {task_models[task]: task for task in pending}
+        for model in stragglers:
+            results[model] = asyncio.TimeoutError(f"{model.value} did not answer before synthesis")
+        
+        return results, stragglers
+
+    @staticmethod
+    def _is_model_answer(result: Any) -> bool:
+        """Whether a model result is a usable answer rather than an error"""
+        return not isinstance(result, Exception) and "error" not in result
+
+    @classmethod
+    def is_storable_analysis(cls, analysis: TrinityAnalysis) -> bool:
+        """Whether an analysis carries at least one model answer and a real recommendation"""
+        return bool(analysis.models_used) and analysis.trinity_recommendation not in cls.ERROR_RECOMMENDATIONS
+
+    async def _synthesize_from_results(self, proposal: GovernanceProposal, complexity: AnalysisComplexity,
+                                       start_time: datetime, results: Dict[TrinityModel, Any]) -> TrinityAnalysis:
+        """Run Trinity synthesis over per-model results and build the analysis"""
+        results = {
+            model: results[model] if model in results
+            else ModelNotRouted(f"{model.value} not routed for {complexity.value} analysis")
+            for model in TrinityModel
+        }
+        deepseek_result = results[TrinityModel.DEEPSEEK_R1]
+        llama_result = results[TrinityModel.LLAMA4_MAVERICK]
+        qwen_result = results[TrinityModel.QWEN3]
+        
+        # Trinity synthesis and consensus building
+        trinity_synthesis = await self._synthesize_trinity_analysis(
+            proposal, deepseek_result, llama_result, qwen_result
+        )
+        
+        return self._build_trinity_analysis(
+            proposal, complexity, start_time, trinity_synthesis,
+            deepseek_result, llama_result, qwen_result
+        )
+
+    def _handle_stragglers(self, proposal: GovernanceProposal, complexity: AnalysisComplexity,
+                           start_time: datetime, results: Dict[TrinityModel, Any],
+                           stragglers: Dict[TrinityModel, asyncio.Task],
+                           on_enriched: Optional[Callable[[TrinityAnalysis], Awaitable[None]]]) -> None:
+        """Cancel straggler models or schedule background enrichment"""
+        if self.straggler_policy == "cancel":
+            for task in stragglers.values():
+                task.cancel()
+            logger.info(f"✂️ Cancelled straggler models for #{proposal.referendum_id}: "
+                        f"{[model.value for model in stragglers]}")
+            return
+        
+        async def enrich() -> None:
+            late_results = await asyncio.gather(*stragglers.values(), return_exceptions=True)
+            enriched_results = {**results, **dict(zip(stragglers, late_results))}
+            enriched = await self._synthesize_from_results(proposal, complexity, start_time, enriched_results)
+            logger.info(f"➕ Trinity analysis for #{proposal.referendum_id} enriched with "
+                        f"{[model.value for model in stragglers]}")
+            if on_enriched:
+                await on_enriched(enriched)
+        
+        task = asyncio.create_task(enrich())
+        self._enrichment_tasks.add(task)
+        task.add_done_callback(self._enrichment_done)
+
+    def _enrichment_done(self, task: asyncio.Task) -> None:
+        """Forget a finished enrichment task, logging any failure"""
+        self._enrichment_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"❌ Trinity enrichment failed: {str(task.exception())}")
+
+    async def stream_ultimate_trinity(
+        self,
+        proposal: GovernanceProposal,
+        complexity_override: Optional[AnalysisComplexity] = None,
+        models_override: Optional[List[TrinityModel]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming Ultimate AI Trinity analysis
+        Yields per-model token events as they arrive, then the final synthesis
+        Model routing matches analyze_with_ultimate_trinity
+        
+        Event shapes:
+        - {"event": "token", "model": <model>, "chunk": <text>}
+        - {"event": "model_complete", "model": <model>, "error": <optional>}
+        - {"event": "synthesis", "analysis": TrinityAnalysis}
+        """
+        start_time = datetime.now()
+        logger.info(f"🧠 Starting streaming Ultimate AI Trinity analysis for referendum #{proposal.referendum_id}")
+        
+        complexity = complexity_override or self._assess_complexity(proposal)
+        selected_models = self.select_models(complexity, models_override)
+        prompt_proposal = await self._prepare_prompt_proposal(proposal)
+        model_plan = {
+            TrinityModel.DEEPSEEK_R1: (self._build_deepseek_prompt, self._parse_deepseek_response, "DeepSeek-R1:671b"),
+            TrinityModel.LLAMA4_MAVERICK: (self._build_llama_prompt, self._parse_llama_response, "Llama4:maverick"),
+            TrinityModel.QWEN3: (self._build_qwen_prompt, self._parse_qwen_response, "Qwen3:235b")
+        }
+        
+        events: asyncio.Queue = asyncio.Queue()
+        results: Dict[TrinityModel, Dict[str, Any]] = {}
+        
+        async def run_model(model: TrinityModel) -> None:
+            build_prompt, parse_response, model_name = model_plan[model]
+            chunks = []
+            stats: List[GenerationStats] = []
+            try:
+                async for token in self._stream_flagship_model(model, build_prompt(prompt_proposal, complexity), stats.append):
+                    chunks.append(token)
+                    await events.put({"event": "token", "model": model.value, "chunk": token})
+                content = "".join(chunks)
+                results[model] = self._attach_generation_stats(
+                    await self.cpu_offload.run(len(content), parse_response, content), stats[0] if stats else None
+                )
+                await events.put({"event": "model_complete", "model": model.value})
+            except Exception as e:
+                logger.error(f"❌ {model_name} streaming analysis failed: {str(e)}")
+                results[model] = {"error": str(e), "model": model_name}
+                await events.put({"event": "model_complete", "model": model.value, "error": str(e)})
+        
+        tasks = [asyncio.create_task(run_model(model)) for model in selected_models]
+        try:
+            completed = 0
+            while completed < len(tasks):
+                event = await events.get()
+                if event["event"] == "model_complete":
+                    completed += 1
+                yield event
+            
+            yield {
+                "event": "synthesis",
+                "analysis": await self._synthesize_from_results(proposal, complexity, start_time, results)
+            }
+            
+        finally:
+            # Client disconnects must not leave model streams running
+            for task in tasks:
+                task.cancel()
+
+    def _build_trinity_analysis(self, proposal: GovernanceProposal, complexity: AnalysisComplexity,
+                                start_time: datetime, trinity_synthesis: Dict[str, Any],
+                                deepseek_result: Any, llama_result: Any, qwen_result: Any) -> TrinityAnalysis:
+        """Assemble the TrinityAnalysis result from model outputs and synthesis"""
+        # Calculate processing metrics
+        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        
+        analysis = TrinityAnalysis(
+            referendum_id=proposal.referendum_id,
+            analysis_timestamp=datetime.now(timezone.utc),
+            complexity_level=complexity,
+            
+            # Trinity Synthesis (1.3T+ parameter coordination)
+            trinity_recommendation=trinity_synthesis["recommendation"],
+            trinity_confidence=trinity_synthesis["confidence"],
+            trinity_reasoning=trinity_synthesis["reasoning"],
+            
+            # Individual model results
+            deepseek_analysis=deepseek_result if not isinstance(deepseek_result, Exception) else {},
+            mathematical_validation=deepseek_result.get("mathematical", {}) if not isinstance(deepseek_result, Exception) else {},
+            economic_modeling=deepseek_result.get("economic", {}) if not isinstance(deepseek_result, Exception) else {},
+            
+            llama_strategic=llama_result if not isinstance(llama_result, Exception) else {},
+            long_term_impact=llama_result.get("strategic", {}) if not isinstance(llama_result, Exception) else {},
+            ecosystem_implications=llama_result.get("ecosystem", {}) if not isinstance(llama_result, Exception) else {},
+            
+            qwen_global=qwen_result if not isinstance(qwen_result, Exception) else {},
+            multilingual_sentiment=qwen_result.get("sentiment", {}) if not isinstance(qwen_result, Exception) else {},
+            cultural_analysis=qwen_result.get("cultural", {}) if not isinstance(qwen_result, Exception) else {},
+            
+            # Analysis matrices
+            risk_assessment=trinity_synthesis.get("risk_matrix", {}),
+            sentiment_matrix=trinity_synthesis.get("sentiment_matrix", {}),
+            
+            # Processing metadata
+            processing_time_ms=int(processing_time),
+            models_used=[
+                model for model, result in (
+                    (TrinityModel.DEEPSEEK_R1, deepseek_result),
+                    (TrinityModel.LLAMA4_MAVERICK, llama_result),
+                    (TrinityModel.QWEN3, qwen_result)
+                )
+                if self._is_model_answer(result)
+            ],
+            xnode_coordination={
+                "privacy_xnode": self.privacy_xnode,
+                "performance_xnode": self.performance_xnode,
+                "unified_access": self.unified_access
+            },
+            generation_stats={
+                model.value: result["generation_stats"]
+                for model, result in (
+                    (TrinityModel.DEEPSEEK_R1, deepseek_result),
+                    (TrinityModel.LLAMA4_MAVERICK, llama_result),
+                    (TrinityModel.QWEN3, qwen_result)
+                )
+                if self._is_model_answer(result) and "generation_stats" in result
+            }
+        )
+        
+        logger.info(f"✅ Ultimate AI Trinity analysis complete for #{proposal.referendum_id} - {processing_time:.0f}ms")
+        logger.info(f"🎯 Trinity Recommendation: {trinity_synthesis['recommendation']} ({trinity_synthesis['confidence']:.1f}% confidence)")
+        
+        return analysis
+
     def _assess_complexity(self, proposal: GovernanceProposal) -> AnalysisComplexity:
         """Assess proposal complexity for intelligent model routing"""
         complexity_score = 0
@@ -556,6 +1142,20 @@ class PolkadotGateway:
         else:
             return AnalysisComplexity.SIMPLE
 
+    async def _prepare_prompt_proposal(self, proposal: GovernanceProposal) -> GovernanceProposal:
+        """Summarize an oversized description so the prompts cover the whole proposal"""
+        reduced = await self.description_summarizer.reduce(
+            proposal.description, DESCRIPTION_TOKEN_BUDGET, self._summarize_with_flagship_model
+        )
+        if not reduced.summarized:
+            return proposal
+        return replace(proposal, description=reduced.text)
+
+    async def _summarize_with_flagship_model(self, prompt: str) -> str:
+        """Generate one chunk summary for the description summarizer"""
+        content, _ = await self._call_flagship_model(self.SUMMARY_MODEL, prompt, structured=False)
+        return content
+
     async def _analyze_with_deepseek(self, proposal: GovernanceProposal, complexity: AnalysisComplexity) -> Dict[str, Any]:
         """
         DeepSeek-R1:671b Mathematical Reasoning and Chain-of-Thought Analysis
@@ -563,55 +1163,20 @@ class PolkadotGateway:
         """
         logger.debug(f"🧮 DeepSeek-R1 analysis starting for #{proposal.referendum_id}")
         
-        prompt = f"""
-        You are DeepSeek-R1, a 671-billion parameter AI model specializing in mathematical reasoning and chain-of-thought analysis for Polkadot governance.
-
-        GOVERNANCE PROPOSAL ANALYSIS:
-        
-        Referendum #{proposal.referendum_id}: {proposal.title}
-        
-        Description: {proposal.description[:2000]}...
-        
-        Financial Details:
-        - Amount: {proposal.amount} {proposal.currency} (if applicable)
-        - Beneficiary: {proposal.beneficiary}
-        - Proposer: {proposal.proposer}
-        
-        Voting Data:
-        - Aye votes: {proposal.aye_votes:,}
-        - Nay votes: {proposal.nay_votes:,}
-        - Support: {proposal.support_percentage:.1f}%
-        
-        MATHEMATICAL ANALYSIS REQUIRED:
-        
-        1. Economic Impact Assessment:
-           - Mathematical validation of financial assumptions
-           - ROI calculation and economic modeling
-           - Risk-adjusted value analysis
-           - Treasury impact quantification
-        
-        2. Chain-of-Thought Reasoning:
-           - Step-by-step logical analysis
-           - Mathematical probability assessment
-           - Quantitative risk evaluation
-           - Statistical significance testing
-        
-        3. Validation Framework:
-           - Mathematical soundness: X/10 score with reasoning
-           - Economic viability: Probability percentage
-           - Implementation feasibility: Technical complexity score
-           - Risk assessment: Multi-dimensional risk matrix
-        
-        Provide comprehensive mathematical analysis in structured JSON format with detailed reasoning for each metric.
-        """
+        prompt = self._build_deepseek_prompt(proposal, complexity)
         
         try:
-            response = await self._call_flagship_model(TrinityModel.DEEPSEEK_R1, prompt)
-            return self._parse_deepseek_response(response)
+            response, stats = await self._call_flagship_model(TrinityModel.DEEPSEEK_R1, prompt)
+            parsed = await self.cpu_offload.run(len(response), self._parse_deepseek_response, response)
+            return self._attach_generation_stats(parsed, stats)
         except Exception as e:
             logger.error(f"❌ DeepSeek-R1 analysis failed: {str(e)}")
             return {"error": str(e), "model": "DeepSeek-R1:671b"}
 
+    def _build_deepseek_prompt(self, proposal: GovernanceProposal, complexity: AnalysisComplexity) -> str:
+        """Build the DeepSeek-R1 mathematical analysis prompt"""
+        return DEEPSEEK_TEMPLATE.render(proposal)
+
     async def _analyze_with_llama(self, proposal: GovernanceProposal, complexity: AnalysisComplexity) -> Dict[str, Any]:
         """
         Llama4:maverick Strategic Intelligence and Creative Problem-Solving
@@ -619,56 +1184,20 @@ class PolkadotGateway:
         """
         logger.debug(f"🎯 Llama4:maverick analysis starting for #{proposal.referendum_id}")
         
-        prompt = f"""
-        You are Llama4:maverick, a 400-billion parameter AI model specializing in strategic intelligence and creative problem-solving for Polkadot governance.
-
-        STRATEGIC GOVERNANCE ANALYSIS:
-        
-        Referendum #{proposal.referendum_id}: {proposal.title}
-        
-        Context: {proposal.description[:2000]}...
-        
-        Current Status:
-        - Voting Support: {proposal.support_percentage:.1f}%
-        - Community Engagement: {proposal.aye_votes + proposal.nay_votes:,} total votes
-        - Proposal Status: {proposal.status}
-        
-        STRATEGIC INTELLIGENCE REQUIRED:
-        
-        1. Long-term Strategic Impact:
-           - Ecosystem evolution implications
-           - Competitive positioning effects
-           - Network development trajectory
-           - Strategic advantage creation/erosion
-        
-        2. Stakeholder Analysis:
-           - Multi-party impact assessment
-           - Incentive alignment evaluation
-           - Community consensus building
-           - Delegate decision framework
-        
-        3. Implementation Strategy:
-           - Execution complexity assessment
-           - Resource allocation optimization
-           - Timeline and milestone planning
-           - Success metrics definition
-        
-        4. Risk-Benefit Framework:
-           - Strategic risk identification
-           - Opportunity cost analysis
-           - Scenario planning (best/worst/expected)
-           - Mitigation strategy recommendations
-        
-        Provide strategic intelligence in structured format focusing on long-term ecosystem health and strategic positioning.
-        """
+        prompt = self._build_llama_prompt(proposal, complexity)
         
         try:
-            response = await self._call_flagship_model(TrinityModel.LLAMA4_MAVERICK, prompt)
-            return self._parse_llama_response(response)
+            response, stats = await self._call_flagship_model(TrinityModel.LLAMA4_MAVERICK, prompt)
+            parsed = await self.cpu_offload.run(len(response), self._parse_llama_response, response)
+            return self._attach_generation_stats(parsed, stats)
         except Exception as e:
             logger.error(f"❌ Llama4:maverick analysis failed: {str(e)}")
             return {"error": str(e), "model": "Llama4:maverick"}
 
+    def _build_llama_prompt(self, proposal: GovernanceProposal, complexity: AnalysisComplexity) -> str:
+        """Build the Llama4:maverick strategic intelligence prompt"""
+        return LLAMA_TEMPLATE.render(proposal)
+
     async def _analyze_with_qwen(self, proposal: GovernanceProposal, complexity: AnalysisComplexity) -> Dict[str, Any]:
         """
         Qwen3:235b MoE Global Perspective and Multilingual Analysis
@@ -676,67 +1205,123 @@ class PolkadotGateway:
         """
         logger.debug(f"🌍 Qwen3 analysis starting for #{proposal.referendum_id}")
         
-        prompt = f"""
-        You are Qwen3, a 235-billion parameter Mixture of Experts model specializing in global perspective and multilingual analysis for Polkadot governance.
-
-        GLOBAL GOVERNANCE PERSPECTIVE:
-        
-        Referendum #{proposal.referendum_id}: {proposal.title}
-        
-        Proposal Overview: {proposal.description[:2000]}...
-        
-        Community Metrics:
-        - Global Support Level: {proposal.support_percentage:.1f}%
-        - Participation: {proposal.aye_votes + proposal.nay_votes:,} voters
-        - Discussion: {proposal.discussion_url}
-        
-        GLOBAL INTELLIGENCE REQUIRED:
-        
-        1. International Regulatory Analysis:
-           - Multi-jurisdiction compliance assessment
-           - Regulatory risk evaluation across major markets
-           - Legal framework alignment (US, EU, Asia-Pacific)
-           - Cross-border implementation considerations
-        
-        2. Cultural and Regional Impact:
-           - Cultural sensitivity analysis
-           - Regional stakeholder preferences
-           - International community sentiment
-           - Global adoption implications
-        
-        3. Multilingual Community Analysis:
-           - Sentiment analysis across language communities
-           - Cultural nuance identification
-           - Regional bias detection
-           - Global consensus building assessment
-        
-        4. International Competitive Analysis:
-           - Global blockchain ecosystem positioning
-           - Cross-ecosystem competitive implications
-           - International partnership opportunities
-           - Global market share impact
-        
-        Provide global perspective analysis considering cultural, regulatory, and international market factors.
-        """
+        prompt = self._build_qwen_prompt(proposal, complexity)
         
         try:
-            response = await self._call_flagship_model(TrinityModel.QWEN3, prompt)
-            return self._parse_qwen_response(response)
+            response, stats = await self._call_flagship_model(TrinityModel.QWEN3, prompt)
+            parsed = await self.cpu_offload.run(len(response), self._parse_qwen_response, response)
+            return self._attach_generation_stats(parsed, stats)
         except Exception as e:
             logger.error(f"❌ Qwen3 analysis failed: {str(e)}")
             return {"error": str(e), "model": "Qwen3:235b"}
 
-    async def _call_flagship_model(self, model: TrinityModel, prompt: str) -> str:
+    def _build_qwen_prompt(self, proposal: GovernanceProposal, complexity: AnalysisComplexity) -> str:
+        """Build the Qwen3 global perspective prompt"""
+        return QWEN_TEMPLATE.render(proposal)
+
+    async def _call_flagship_model(
+        self,
+        model: TrinityModel,
+        prompt: str,
+        structured: bool = True
+    ) -> Tuple[str, Optional[GenerationStats]]:
         """
         Call Ultimate AI Trinity flagship model on Performance Xnode
         Infrastructure: 23.92.65.18 with $0 operational costs
+        
+        Returns the generated text and Ollama generation metadata
+        (None when served from the response cache). ``structured`` requests
+        JSON output constrained to the model's analysis schema.
+        """
+        payload = self._build_generate_payload(model, prompt, structured)
+        cache_options = self._cache_options(payload)
+        
+        cached = await self.response_cache.get(model.value, prompt, cache_options)
+        if cached is not None:
+            logger.debug(f"⚡ Cached {model.value} generation reused")
+            return cached, None
+        
+        async def attempt(timeout: aiohttp.ClientTimeout) -> Dict[str, Any]:
+            # Each attempt takes a fresh lease, so a retry can land on another endpoint
+            async with self.endpoint_pool.lease(model.value) as endpoint:
+                async with self.session.post(endpoint.generate_url, json=payload, timeout=timeout) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        raise UpstreamStatusError(response.status, f"Model API error {response.status}: {error_text}")
+                    return await response.json()
+        
+        try:
+            self.model_warmup.record_request(model.value)
+            result = await self.upstream_policies.call(model.value, attempt)
+            content = result.get("response", "")
+            
+            stats = GenerationStats.from_response(result)
+            stats.record(model.value)
+            await self.response_cache.put(model.value, prompt, cache_options, content)
+            return content, stats
+                    
+        except Exception as e:
+            logger.error(f"❌ Flagship model {model.value} call failed: {str(e)}")
+            raise
+
+    async def _stream_flagship_model(
+        self,
+        model: TrinityModel,
+        prompt: str,
+        on_stats: Optional[Callable[[GenerationStats], None]] = None
+    ) -> AsyncIterator[str]:
         """
-        model_config = self.flagship_models[model]
+        Stream Ultimate AI Trinity flagship model tokens from Performance Xnode
+        Consumes the Ollama NDJSON stream incrementally; generation metadata
+        from the final chunk is passed to ``on_stats``
+        """
+        payload = self._build_generate_payload(model, prompt)
+        cache_options = self._cache_options(payload)
+        
+        cached = await self.response_cache.get(model.value, prompt, cache_options)
+        if cached is not None:
+            yield cached
+            return
         
+        async def attempt(timeout: aiohttp.ClientTimeout) -> AsyncIterator[Dict[str, Any]]:
+            # Each attempt takes a fresh lease, so a retry can land on another endpoint
+            async with self.endpoint_pool.lease(model.value) as endpoint:
+                async for chunk in stream_generate(self.session, endpoint.generate_url, payload, timeout):
+                    yield chunk
+        
+        try:
+            tokens = []
+            self.model_warmup.record_request(model.value)
+            # Retried only until the first chunk reaches the caller
+            async for chunk in self.upstream_policies.stream(model.value, attempt):
+                token = chunk.get("response", "")
+                if token:
+                    tokens.append(token)
+                    yield token
+                if chunk.get("done"):
+                    stats = GenerationStats.from_response(chunk)
+                    stats.record(model.value)
+                    if on_stats:
+                        on_stats(stats)
+            await self.response_cache.put(model.value, prompt, cache_options, "".join(tokens))
+                    
+        except Exception as e:
+            logger.error(f"❌ Flagship model {model.value} stream failed: {str(e)}")
+            raise
+
+    def _attach_generation_stats(self, result: Dict[str, Any], stats: Optional[GenerationStats]) -> Dict[str, Any]:
+        """Record generation metadata alongside a parsed model result"""
+        if stats is not None:
+            result["generation_stats"] = stats.to_dict()
+        return result
+
+    def _build_generate_payload(self, model: TrinityModel, prompt: str, structured: bool = True) -> Dict[str, Any]:
+        """Build Ollama generate payload for a flagship model"""
         payload = {
             "model": model.value,
             "prompt": prompt,
             "stream": False,
+            "keep_alive": self.model_warmup.keep_alive_for(model.value),
             "options": {
                 "temperature": 0.1,  # Low temperature for analytical consistency
                 "top_p": 0.9,
@@ -745,35 +1330,32 @@ class PolkadotGateway:
                 "repeat_penalty": 1.1
             }
         }
-        
-        try:
-            async with self.session.post(model_config["endpoint"], json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get("response", "")
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Model API error {response.status}: {error_text}")
-                    
-        except Exception as e:
-            logger.error(f"❌ Flagship model {model.value} call failed: {str(e)}")
-            raise
+        if structured:
+            # Constrained decoding stops at the closing brace instead of trailing prose
+            payload["format"] = self.STRUCTURED_OUTPUTS[model].SCHEMA
+        return payload
 
-    def _parse_deepseek_response(self, response: str) -> Dict[str, Any]:
+    def _cache_options(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Response cache options, keyed on the output schema as well as sampling"""
+        if "format" not in payload:
+            return payload["options"]
+        return {**payload["options"], "format": payload["format"]}
+
+    @staticmethod
+    def _parse_deepseek_response(response: str) -> Dict[str, Any]:
         """Parse DeepSeek-R1 mathematical analysis response"""
+        structured = parse_structured_response(response, DeepSeekAnalysis)
+        if structured is not None:
+            return structured.to_dict()
+        
         try:
-            # Attempt JSON parsing first
+            # Non-conforming JSON is returned as-is
             if response.strip().startswith('{'):
                 return json.loads(response)
             
             # Fallback: Extract key metrics from text
             return {
-                "mathematical_soundness": self._extract_score(response, "mathematical soundness"),
-                "economic_viability": self._extract_percentage(response, "economic viability"),
-                "risk_score": self._extract_score(response, "risk"),
-                "implementation_complexity": self._extract_score(response, "complexity"),
-                "recommendation": self._extract_recommendation(response),
-                "chain_of_thought": response[:1000] + "..." if len(response) > 1000 else response,
+                **ResponseScanner(response).deepseek_metrics(),
                 "model": "DeepSeek-R1:671b",
                 "specialization": "Mathematical reasoning and economic modeling"
             }
@@ -785,21 +1367,21 @@ class PolkadotGateway:
                 "model": "DeepSeek-R1:671b"
             }
 
-    def _parse_llama_response(self, response: str) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_llama_response(response: str) -> Dict[str, Any]:
         """Parse Llama4:maverick strategic analysis response"""
+        structured = parse_structured_response(response, LlamaStrategicAnalysis)
+        if structured is not None:
+            return structured.to_dict()
+        
         try:
-            # Attempt JSON parsing first
+            # Non-conforming JSON is returned as-is
             if response.strip().startswith('{'):
                 return json.loads(response)
             
             # Fallback: Extract strategic insights
             return {
-                "strategic_recommendation": self._extract_recommendation(response),
-                "long_term_impact": self._extract_impact_level(response),
-                "ecosystem_health": self._extract_score(response, "ecosystem"),
-                "competitive_advantage": self._extract_advantage(response),
-                "implementation_strategy": self._extract_strategy(response),
-                "strategic_reasoning": response[:1000] + "..." if len(response) > 1000 else response,
+                **ResponseScanner(response).llama_metrics(),
                 "model": "Llama4:maverick",
                 "specialization": "Strategic intelligence and long-term planning"
             }
@@ -811,21 +1393,21 @@ class PolkadotGateway:
                 "model": "Llama4:maverick"
             }
 
-    def _parse_qwen_response(self, response: str) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_qwen_response(response: str) -> Dict[str, Any]:
         """Parse Qwen3 global perspective analysis response"""
+        structured = parse_structured_response(response, QwenGlobalAnalysis)
+        if structured is not None:
+            return structured.to_dict()
+        
         try:
-            # Attempt JSON parsing first
+            # Non-conforming JSON is returned as-is
             if response.strip().startswith('{'):
                 return json.loads(response)
             
             # Fallback: Extract global insights
             return {
-                "global_sentiment": self._extract_sentiment(response),
-                "regulatory_compliance": self._extract_compliance_score(response),
-                "cultural_impact": self._extract_cultural_score(response),
-                "international_support": self._extract_percentage(response, "international"),
-                "regional_analysis": self._extract_regional_breakdown(response),
-                "global_reasoning": response[:1000] + "..." if len(response) > 1000 else response,
+                **ResponseScanner(response).qwen_metrics(),
                 "model": "Qwen3:235b",
                 "specialization": "Global perspective and multilingual analysis"
             }
@@ -837,138 +1419,46 @@ class PolkadotGateway:
                 "model": "Qwen3:235b"
             }
 
-    # Helper methods for response parsing
+    # Helper methods for response parsing (single-metric access to ResponseScanner)
     def _extract_score(self, text: str, metric: str) -> float:
         """Extract numerical score from text (0-10 scale)"""
-        import re
-        patterns = [
-            rf"{metric}[:\s]*(\d+(?:\.\d+)?)[/\s]*10",
-            rf"(\d+(?:\.\d+)?)[/\s]*10[:\s]*{metric}",
-            rf"{metric}[:\s]*(\d+(?:\.\d+)?)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    return min(10.0, max(0.0, float(match.group(1))))
-                except ValueError:
-                    continue
-        
-        return 5.0  # Default neutral score
+        return ResponseScanner(text).score(metric)
 
     def _extract_percentage(self, text: str, context: str) -> float:
         """Extract percentage from text"""
-        import re
-        patterns = [
-            rf"{context}[:\s]*(\d+(?:\.\d+)?)%",
-            rf"(\d+(?:\.\d+)?)%[:\s]*{context}"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    return min(100.0, max(0.0, float(match.group(1))))
-                except ValueError:
-                    continue
-        
-        return 50.0  # Default neutral percentage
+        return ResponseScanner(text).percentage(context)
 
     def _extract_recommendation(self, text: str) -> str:
         """Extract recommendation from text"""
-        text_lower = text.lower()
-        
-        if "strongly recommend" in text_lower or "strongly support" in text_lower:
-            return "STRONG_APPROVE"
-        elif "recommend" in text_lower or "support" in text_lower or "approve" in text_lower:
-            return "APPROVE"
-        elif "oppose" in text_lower or "reject" in text_lower or "against" in text_lower:
-            return "REJECT"
-        elif "caution" in text_lower or "careful" in text_lower:
-            return "APPROVE_WITH_CAUTION"
-        else:
-            return "NEUTRAL"
+        return ResponseScanner(text).recommendation()
 
     def _extract_impact_level(self, text: str) -> str:
         """Extract impact level from strategic analysis"""
-        text_lower = text.lower()
-        
-        if "high impact" in text_lower or "significant impact" in text_lower:
-            return "HIGH"
-        elif "moderate impact" in text_lower or "medium impact" in text_lower:
-            return "MODERATE"
-        elif "low impact" in text_lower or "minimal impact" in text_lower:
-            return "LOW"
-        else:
-            return "MODERATE"
+        return ResponseScanner(text).impact_level()
 
     def _extract_advantage(self, text: str) -> str:
         """Extract competitive advantage assessment"""
-        text_lower = text.lower()
-        
-        if "strong advantage" in text_lower or "significant advantage" in text_lower:
-            return "STRONG_POSITIVE"
-        elif "advantage" in text_lower or "beneficial" in text_lower:
-            return "POSITIVE"
-        elif "disadvantage" in text_lower or "harmful" in text_lower:
-            return "NEGATIVE"
-        else:
-            return "NEUTRAL"
+        return ResponseScanner(text).advantage()
 
     def _extract_strategy(self, text: str) -> str:
         """Extract implementation strategy recommendation"""
-        text_lower = text.lower()
-        
-        if "phased" in text_lower or "gradual" in text_lower:
-            return "PHASED_ROLLOUT"
-        elif "immediate" in text_lower or "urgent" in text_lower:
-            return "IMMEDIATE_IMPLEMENTATION"
-        elif "delayed" in text_lower or "postpone" in text_lower:
-            return "DELAYED_IMPLEMENTATION"
-        else:
-            return "STANDARD_IMPLEMENTATION"
+        return ResponseScanner(text).strategy()
 
     def _extract_sentiment(self, text: str) -> str:
         """Extract global sentiment assessment"""
-        text_lower = text.lower()
-        
-        if "very positive" in text_lower or "strongly positive" in text_lower:
-            return "VERY_POSITIVE"
-        elif "positive" in text_lower:
-            return "POSITIVE"
-        elif "negative" in text_lower:
-            return "NEGATIVE"
-        elif "mixed" in text_lower or "neutral" in text_lower:
-            return "MIXED"
-        else:
-            return "NEUTRAL"
+        return ResponseScanner(text).sentiment()
 
     def _extract_compliance_score(self, text: str) -> float:
         """Extract regulatory compliance score"""
-        return self._extract_score(text, "compliance")
+        return ResponseScanner(text).score("compliance")
 
     def _extract_cultural_score(self, text: str) -> float:
         """Extract cultural impact score"""
-        return self._extract_score(text, "cultural")
+        return ResponseScanner(text).score("cultural")
 
     def _extract_regional_breakdown(self, text: str) -> Dict[str, str]:
         """Extract regional sentiment breakdown"""
-        regions = ["north america", "europe", "asia", "oceania", "africa", "south america"]
-        breakdown = {}
-        
-        for region in regions:
-            if region in text.lower():
-                # Simple sentiment extraction for each region
-                region_context = text.lower()[text.lower().find(region):text.lower().find(region) + 200]
-                if "positive" in region_context:
-                    breakdown[region.title()] = "Positive"
-                elif "negative" in region_context:
-                    breakdown[region.title()] = "Negative"
-                else:
-                    breakdown[region.title()] = "Neutral"
-        
-        return breakdown
+        return ResponseScanner(text).regional_breakdown()
 
     async def _synthesize_trinity_analysis(self, proposal: GovernanceProposal, 
                                          deepseek_result: Dict, llama_result: Dict, qwen_result: Dict) -> Dict[str, Any]:
@@ -1196,6 +1686,8 @@ class PolkadotGateway:
 # Export for use in Polka-Trinity platform
 __all__ = [
     "PolkadotGateway",
+    "ReferendumCache",
+    "ModelNotRouted",
     "GovernanceProposal", 
     "TrinityAnalysis",
     "AnalysisComplexity",
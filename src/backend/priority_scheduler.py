@@ -0,0 +1,150 @@
+"""
+Polka-Trinity Priority Admission Scheduler
+Priority-aware admission control for scarce flagship model slots.
+
+Requests wait in per-priority FIFO queues (1=highest, 5=lowest). When a
+slot frees up, the waiter with the best effective priority is admitted,
+where waiting time gradually improves a request's priority so bulk work
+is never starved by a steady stream of interactive requests.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from prometheus_client import Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Admission metrics
+ADMISSION_WAIT = Histogram('trinity_admission_wait_seconds', 'Time spent waiting for a flagship model slot', ['priority'])
+ADMISSION_QUEUE_DEPTH = Gauge('trinity_admission_queue_depth', 'Requests waiting for a flagship model slot', ['priority'])
+
+HIGHEST_PRIORITY = 1
+LOWEST_PRIORITY = 5
+
+
+@dataclass
+class _Waiter:
+    """Queued admission request"""
+    priority: int
+    enqueued_at: float
+    future: asyncio.Future
+
+
+class PriorityAdmissionScheduler:
+    """Concurrency limiter admitting waiters by aged priority"""
+
+    def __init__(self, max_concurrent: int, aging_seconds: float = 10.0):
+        """
+        Args:
+            max_concurrent: Number of requests admitted at once
+            aging_seconds: Waiting time that improves a request by one priority level
+        """
+        self.max_concurrent = max_concurrent
+        self.aging_seconds = aging_seconds
+        self._active = 0
+        self._queues: Dict[int, Deque[_Waiter]] = {
+            priority: deque() for priority in range(HIGHEST_PRIORITY, LOWEST_PRIORITY + 1)
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold an admission slot for the duration of the block"""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int) -> None:
+        """Wait until a slot is granted to this request"""
+        priority = min(max(priority, HIGHEST_PRIORITY), LOWEST_PRIORITY)
+
+        if self._active < self.max_concurrent and not self.queued:
+            self._active += 1
+            ADMISSION_WAIT.labels(priority=str(priority)).observe(0.0)
+            return
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority=priority, enqueued_at=loop.time(), future=loop.create_future())
+        self._queues[priority].append(waiter)
+        ADMISSION_QUEUE_DEPTH.labels(priority=str(priority)).inc()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was granted just as the caller went away; hand it on
+                self.release()
+            elif waiter in self._queues[priority]:
+                # Still queued (admission may already have popped and skipped it)
+                self._queues[priority].remove(waiter)
+                ADMISSION_QUEUE_DEPTH.labels(priority=str(priority)).dec()
+            raise
+
+        ADMISSION_WAIT.labels(priority=str(priority)).observe(loop.time() - waiter.enqueued_at)
+
+    def release(self) -> None:
+        """Return a slot and admit the next waiter"""
+        self._active -= 1
+        self._admit_waiters()
+
+    def set_limit(self, max_concurrent: int) -> None:
+        """Change the concurrency limit, admitting waiters if it grew"""
+        self.max_concurrent = max_concurrent
+        self._admit_waiters()
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def _admit_waiters(self) -> None:
+        while self._active < self.max_concurrent:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            if waiter.future.done():
+                # Cancelled while queued, before its task observed the cancellation
+                continue
+            self._active += 1
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """Pop the queue head with the best aged priority (ties go to the oldest)"""
+        now = asyncio.get_running_loop().time()
+        best: Optional[_Waiter] = None
+        best_rank = None
+
+        for queue in self._queues.values():
+            if not queue:
+                continue
+            head = queue[0]
+            rank = (head.priority - (now - head.enqueued_at) / self.aging_seconds, head.enqueued_at)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = head, rank
+
+        if best is not None:
+            self._queues[best.priority].popleft()
+            ADMISSION_QUEUE_DEPTH.labels(priority=str(best.priority)).dec()
+        return best
+
+    def stats(self) -> Dict[str, Any]:
+        """Scheduler state for monitoring"""
+        return {
+            "active": self._active,
+            "limit": self.max_concurrent,
+            "queued": {str(priority): len(queue) for priority, queue in self._queues.items()}
+        }
+
+
+__all__ = [
+    "PriorityAdmissionScheduler"
+]
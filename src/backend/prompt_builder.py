@@ -0,0 +1,155 @@
+"""
+Polka-Trinity Prompt Builder
+Token-budgeted prompt assembly for coordinator requests.
+
+A prompt is a list of pluggable sections rendered from the request and
+the model's capability. Essential sections are always kept, trimmable
+sections (the request content) are cut at sentence boundaries to fit the
+model's token budget, and optional sections are only included while
+budget remains. Every prompt's estimated token count is exported so
+prompt-size regressions show up directly next to time-to-first-token.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Tuple
+
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Prompt size metrics
+PROMPT_TOKENS = Histogram(
+    'trinity_prompt_tokens_estimated', 'Estimated prompt tokens per model request', ['model'],
+    buckets=(64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+)
+PROMPT_TRIMMED = Counter('trinity_prompt_trimmed_total', 'Prompts whose content was trimmed to the token budget', ['model'])
+
+# Rough characters-per-token ratio for English text on the Trinity tokenizers
+CHARS_PER_TOKEN = 4
+
+TRUNCATION_MARKER = " [...]"
+
+SECTION_SEPARATOR = "\n\n"
+
+# Sentence end: terminal punctuation, optional closing quote/bracket, then whitespace
+_SENTENCE_END = re.compile(r"[.!?][\"')\]]?(?=\s)")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate without loading a tokenizer"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def trim_to_sentences(text: str, max_tokens: int) -> Tuple[str, bool]:
+    """
+    Trim text to a token budget, preferring to cut after a full sentence.
+
+    Falls back to a word boundary when the last sentence end would discard
+    more than half of the allowed text. Returns the text and whether it was cut.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text, False
+
+    max_chars = max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))
+    window = text[:max_chars]
+
+    sentence_ends = [match.end() for match in _SENTENCE_END.finditer(window)]
+    if sentence_ends and sentence_ends[-1] >= max_chars // 2:
+        cut = sentence_ends[-1]
+    else:
+        cut = window.rfind(" ")
+        if cut <= 0:
+            cut = max_chars
+
+    return window[:cut].rstrip() + TRUNCATION_MARKER, True
+
+
+@dataclass(frozen=True)
+class PromptSection:
+    """One renderable part of a prompt
+
+    ``render`` receives the request and model capability and may return an
+    empty string to skip the section.
+    """
+    name: str
+    render: Callable[[Any, Any], str]
+    essential: bool = False
+    trimmable: bool = False
+
+
+@dataclass
+class BuiltPrompt:
+    """Assembled prompt and how it was fitted to its budget"""
+    text: str
+    estimated_tokens: int
+    budget_tokens: int
+    trimmed: bool = False
+    dropped_sections: List[str] = field(default_factory=list)
+
+
+class PromptBuilder:
+    """Assemble prompts from sections within a per-model token budget"""
+
+    def __init__(self, sections: List[PromptSection]):
+        self.sections = list(sections)
+
+    def build(self, model: str, budget_tokens: int, request: Any, capability: Any) -> BuiltPrompt:
+        """Render, fit and record a prompt for one model request"""
+        rendered = [(section, section.render(request, capability)) for section in self.sections]
+        rendered = [(section, text) for section, text in rendered if text]
+
+        # Separators are charged up front so the joined prompt stays within budget
+        remaining = budget_tokens - estimate_tokens(SECTION_SEPARATOR) * max(0, len(rendered) - 1)
+        remaining -= sum(
+            estimate_tokens(text) for section, text in rendered
+            if section.essential and not section.trimmable
+        )
+
+        fitted = {}
+        trimmed = False
+        for section, text in rendered:
+            if section.trimmable:
+                fitted[section.name], cut = trim_to_sentences(text, max(remaining, 0))
+                trimmed = trimmed or cut
+                remaining -= estimate_tokens(fitted[section.name])
+            elif section.essential:
+                fitted[section.name] = text
+
+        dropped = []
+        for section, text in rendered:
+            if section.essential or section.trimmable:
+                continue
+            if estimate_tokens(text) <= remaining:
+                fitted[section.name] = text
+                remaining -= estimate_tokens(text)
+            else:
+                dropped.append(section.name)
+
+        prompt = SECTION_SEPARATOR.join(
+            fitted[section.name] for section, _ in rendered if section.name in fitted
+        )
+        estimated = estimate_tokens(prompt)
+
+        PROMPT_TOKENS.labels(model=model).observe(estimated)
+        if trimmed:
+            PROMPT_TRIMMED.labels(model=model).inc()
+            logger.info(f"✂️ {model} prompt content trimmed to fit {budget_tokens} token budget")
+
+        return BuiltPrompt(
+            text=prompt,
+            estimated_tokens=estimated,
+            budget_tokens=budget_tokens,
+            trimmed=trimmed,
+            dropped_sections=dropped
+        )
+
+
+__all__ = [
+    "PromptSection",
+    "PromptBuilder",
+    "BuiltPrompt",
+    "estimate_tokens",
+    "trim_to_sentences"
+]
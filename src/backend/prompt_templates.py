@@ -0,0 +1,176 @@
+"""
+Polka-Trinity Prompt Templates
+Shared-prefix prompt layout for the Ultimate AI Trinity gateway prompts.
+
+Every flagship prompt starts with the same proposal block and ends with
+the model-specific persona and instructions. Ollama keeps the KV cache of
+the previous prompt in each runner slot and only evaluates the part after
+the longest common prefix, so repeated analyses and retries of a
+referendum skip re-processing the (long) proposal description.
+
+The proposal block is ordered from most to least stable: identity and
+description first, live voting figures last, so a changed tally only
+invalidates the short tail of the prefix.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .prompt_builder import CHARS_PER_TOKEN
+
+if TYPE_CHECKING:
+    from .polkadot_gateway import GovernanceProposal
+
+# Longer descriptions are map-reduced by the gateway before prompting;
+# the character limit below is only a safety net
+DESCRIPTION_TOKEN_BUDGET = 1536
+DESCRIPTION_LIMIT = DESCRIPTION_TOKEN_BUDGET * CHARS_PER_TOKEN
+
+PROPOSAL_BLOCK = """POLKADOT GOVERNANCE PROPOSAL
+
+Referendum #{referendum_id}: {title}
+Proposer: {proposer}
+Beneficiary: {beneficiary}
+Amount: {amount} {currency}
+Discussion: {discussion_url}
+
+Description:
+{description}
+
+Voting Data:
+- Status: {status}
+- Aye votes: {aye_votes:,}
+- Nay votes: {nay_votes:,}
+- Total votes: {total_votes:,}
+- Support: {support_percentage:.1f}%"""
+
+
+def render_proposal_block(proposal: "GovernanceProposal") -> str:
+    """Model-independent proposal context shared as the prompt prefix"""
+    description = proposal.description
+    if len(description) > DESCRIPTION_LIMIT:
+        description = description[:DESCRIPTION_LIMIT] + "..."
+
+    return PROPOSAL_BLOCK.format(
+        referendum_id=proposal.referendum_id,
+        title=proposal.title,
+        proposer=proposal.proposer,
+        beneficiary=proposal.beneficiary,
+        amount=proposal.amount,
+        currency=proposal.currency,
+        discussion_url=proposal.discussion_url,
+        description=description,
+        status=proposal.status,
+        aye_votes=proposal.aye_votes,
+        nay_votes=proposal.nay_votes,
+        total_votes=proposal.aye_votes + proposal.nay_votes,
+        support_percentage=proposal.support_percentage
+    )
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """Model-specific suffix appended after the shared proposal block"""
+    persona: str
+    instructions: str
+
+    def render(self, proposal: "GovernanceProposal") -> str:
+        return f"{render_proposal_block(proposal)}\n\n{self.persona}\n\n{self.instructions}"
+
+
+DEEPSEEK_TEMPLATE = PromptTemplate(
+    persona="You are DeepSeek-R1, a 671-billion parameter AI model specializing in mathematical reasoning and chain-of-thought analysis for Polkadot governance.",
+    instructions="""MATHEMATICAL ANALYSIS REQUIRED:
+
+1. Economic Impact Assessment:
+   - Mathematical validation of financial assumptions
+   - ROI calculation and economic modeling
+   - Risk-adjusted value analysis
+   - Treasury impact quantification
+
+2. Chain-of-Thought Reasoning:
+   - Step-by-step logical analysis
+   - Mathematical probability assessment
+   - Quantitative risk evaluation
+   - Statistical significance testing
+
+3. Validation Framework:
+   - Mathematical soundness: X/10 score with reasoning
+   - Economic viability: Probability percentage
+   - Implementation feasibility: Technical complexity score
+   - Risk assessment: Multi-dimensional risk matrix
+
+Respond with a single JSON object: mathematical_soundness (0-10), economic_viability (0-100 percent), risk_score (0-10), implementation_complexity (0-10), recommendation, and a concise chain_of_thought."""
+)
+
+LLAMA_TEMPLATE = PromptTemplate(
+    persona="You are Llama4:maverick, a 400-billion parameter AI model specializing in strategic intelligence and creative problem-solving for Polkadot governance.",
+    instructions="""STRATEGIC INTELLIGENCE REQUIRED:
+
+1. Long-term Strategic Impact:
+   - Ecosystem evolution implications
+   - Competitive positioning effects
+   - Network development trajectory
+   - Strategic advantage creation/erosion
+
+2. Stakeholder Analysis:
+   - Multi-party impact assessment
+   - Incentive alignment evaluation
+   - Community consensus building
+   - Delegate decision framework
+
+3. Implementation Strategy:
+   - Execution complexity assessment
+   - Resource allocation optimization
+   - Timeline and milestone planning
+   - Success metrics definition
+
+4. Risk-Benefit Framework:
+   - Strategic risk identification
+   - Opportunity cost analysis
+   - Scenario planning (best/worst/expected)
+   - Mitigation strategy recommendations
+
+Respond with a single JSON object: strategic_recommendation, long_term_impact, ecosystem_health (0-10), competitive_advantage, implementation_strategy, and concise strategic_reasoning focused on long-term ecosystem health."""
+)
+
+QWEN_TEMPLATE = PromptTemplate(
+    persona="You are Qwen3, a 235-billion parameter Mixture of Experts model specializing in global perspective and multilingual analysis for Polkadot governance.",
+    instructions="""GLOBAL INTELLIGENCE REQUIRED:
+
+1. International Regulatory Analysis:
+   - Multi-jurisdiction compliance assessment
+   - Regulatory risk evaluation across major markets
+   - Legal framework alignment (US, EU, Asia-Pacific)
+   - Cross-border implementation considerations
+
+2. Cultural and Regional Impact:
+   - Cultural sensitivity analysis
+   - Regional stakeholder preferences
+   - International community sentiment
+   - Global adoption implications
+
+3. Multilingual Community Analysis:
+   - Sentiment analysis across language communities
+   - Cultural nuance identification
+   - Regional bias detection
+   - Global consensus building assessment
+
+4. International Competitive Analysis:
+   - Global blockchain ecosystem positioning
+   - Cross-ecosystem competitive implications
+   - International partnership opportunities
+   - Global market share impact
+
+Respond with a single JSON object: global_sentiment, regulatory_compliance (0-10), cultural_impact (0-10), international_support (0-100 percent), regional_analysis (region to sentiment), and concise global_reasoning."""
+)
+
+
+__all__ = [
+    "PromptTemplate",
+    "render_proposal_block",
+    "DESCRIPTION_TOKEN_BUDGET",
+    "DEEPSEEK_TEMPLATE",
+    "LLAMA_TEMPLATE",
+    "QWEN_TEMPLATE"
+]
@@ -0,0 +1,76 @@
+"""
+Polka-Trinity Request Coalescing
+Single-flight deduplication for concurrent identical analyses.
+
+When many clients ask for the same analysis at once, only the first call
+launches the flagship model run; the others await the same result. The
+shared run executes as its own task so a disconnecting caller never
+cancels the work other callers are waiting on.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar, Any
+
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Coalescing metrics
+COALESCED_REQUESTS = Counter('trinity_coalesced_requests_total', 'Requests served by awaiting an in-flight analysis', ['operation'])
+INFLIGHT_ANALYSES = Gauge('trinity_inflight_analyses', 'Distinct analyses currently in flight', ['operation'])
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key onto one in-flight task"""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` for ``key`` unless an identical call is already in flight.
+
+        Every caller, including the one that started the run, awaits the
+        shared task through ``asyncio.shield``; exceptions propagate to all.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            self.leaders += 1
+            INFLIGHT_ANALYSES.labels(operation=self.operation).inc()
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.coalesced += 1
+            COALESCED_REQUESTS.labels(operation=self.operation).inc()
+            logger.info(f"🔗 Coalesced {self.operation} request onto in-flight analysis")
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished task so the next call starts a fresh run"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        INFLIGHT_ANALYSES.labels(operation=self.operation).dec()
+        # Retrieve the exception so abandoned failures are not reported as unhandled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing counters for monitoring"""
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced
+        }
+
+
+__all__ = [
+    "SingleFlight"
+]
@@ -0,0 +1,172 @@
+"""
+Polka-Trinity Model Response Cache
+Two-tier cache for flagship model generations on the Performance Xnode.
+
+Entries are keyed by model, a whitespace-normalized prompt hash and the
+generation options that influence output. Only low-temperature generations
+are cached, since higher temperatures are expected to vary between calls.
+The in-memory LRU tier serves repeats within one process; the optional
+Redis tier shares generations across API workers.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # Redis tier is optional
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+class ModelResponseCache:
+    """LRU + optional Redis cache for deterministic model generations"""
+
+    # Generations above this temperature are never cached
+    MAX_CACHEABLE_TEMPERATURE = 0.3
+
+    # Ollama options that change the generated text
+    KEY_OPTIONS = ("temperature", "top_p", "top_k", "num_predict", "repeat_penalty", "seed", "format")
+
+    def __init__(self,
+                 max_entries: int = 512,
+                 ttl_seconds: float = 3600.0,
+                 redis_client: Optional[Any] = None,
+                 key_prefix: str = "polka-trinity:llm:"):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_url(cls, redis_url: Optional[str], **kwargs) -> "ModelResponseCache":
+        """Build a cache with a Redis tier when a URL and client library are available"""
+        if not redis_url:
+            return cls(**kwargs)
+        if redis_asyncio is None:
+            logger.warning("⚠️ redis package not installed - model response cache is in-memory only")
+            return cls(**kwargs)
+        return cls(redis_client=redis_asyncio.from_url(redis_url), **kwargs)
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        """Collapse whitespace so indentation-only prompt differences share entries"""
+        return " ".join(prompt.split())
+
+    def is_cacheable(self, options: Dict[str, Any]) -> bool:
+        """Whether generations with these options are stable enough to cache"""
+        temperature = options.get("temperature")
+        return temperature is not None and temperature <= self.MAX_CACHEABLE_TEMPERATURE
+
+    def make_key(self, model: str, prompt: str, options: Dict[str, Any]) -> str:
+        """Cache key from model, normalized prompt hash and output-affecting options"""
+        prompt_hash = hashlib.sha256(self.normalize_prompt(prompt).encode()).hexdigest()
+        key_options = {name: options[name] for name in self.KEY_OPTIONS if name in options}
+        material = json.dumps(
+            {"model": model, "prompt": prompt_hash, "options": key_options},
+            sort_keys=True,
+            default=str
+        )
+        return self.key_prefix + hashlib.sha256(material.encode()).hexdigest()
+
+    async def get(self, model: str, prompt: str, options: Dict[str, Any]) -> Optional[str]:
+        """Return a cached generation, checking memory before Redis"""
+        if not self.is_cacheable(options):
+            self.skipped += 1
+            return None
+
+        key = self.make_key(model, prompt, options)
+
+        entry = self._entries.get(key)
+        if entry:
+            response, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return response
+            del self._entries[key]
+
+        if self.redis:
+            try:
+                cached = await self.redis.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Redis response cache lookup failed: {str(e)}")
+                cached = None
+            if cached is not None:
+                response = cached.decode() if isinstance(cached, bytes) else cached
+                self._remember(key, response)
+                self.redis_hits += 1
+                return response
+
+        self.misses += 1
+        return None
+
+    async def put(self, model: str, prompt: str, options: Dict[str, Any], response: str) -> None:
+        """Store a generation in both tiers when its options are cacheable"""
+        if not response or not self.is_cacheable(options):
+            return
+
+        key = self.make_key(model, prompt, options)
+        self._remember(key, response)
+
+        if self.redis:
+            try:
+                await self.redis.set(key, response, ex=int(self.ttl_seconds))
+            except Exception as e:
+                logger.warning(f"⚠️ Redis response cache write failed: {str(e)}")
+
+    def _remember(self, key: str, response: str) -> None:
+        """Insert into the memory tier, evicting the least recently used entry"""
+        self._entries[key] = (response, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> int:
+        """Drop all cached generations, returning the number of memory entries removed"""
+        cleared = len(self._entries)
+        self._entries.clear()
+
+        if self.redis:
+            try:
+                keys = [key async for key in self.redis.scan_iter(match=f"{self.key_prefix}*")]
+                if keys:
+                    await self.redis.delete(*keys)
+            except Exception as e:
+                logger.warning(f"⚠️ Redis response cache clear failed: {str(e)}")
+
+        return cleared
+
+    async def close(self) -> None:
+        """Close the Redis connection pool, if any"""
+        if self.redis:
+            await self.redis.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring"""
+        hits = self.memory_hits + self.redis_hits
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "skipped_uncacheable": self.skipped,
+            "hit_rate": f"{(hits / max(1, hits + self.misses)) * 100:.2f}%",
+            "redis_enabled": self.redis is not None
+        }
+
+
+__all__ = [
+    "ModelResponseCache"
+]
@@ -0,0 +1,203 @@
+"""
+Polka-Trinity Response Scanner
+Single-pass metric extraction from free-text flagship model responses.
+
+The gateway's text fallback used to lowercase the whole response again in
+every extraction helper (and several times per region for the regional
+breakdown) and rebuilt each metric regex from an f-string per call. The
+scanner lowercases a response once, uses patterns and keyword tables
+compiled at import, and extracts all of a model's metrics from that one
+lowered copy. Results are identical to the original helpers.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Pattern, Tuple
+
+DEFAULT_SCORE = 5.0
+DEFAULT_PERCENTAGE = 50.0
+REGION_CONTEXT_CHARS = 200
+REASONING_CHARS = 1000
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+
+# Ordered (label, keywords) rules; the first rule with a keyword present wins
+KeywordTable = Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...], str]
+
+RECOMMENDATION_TABLE: KeywordTable = ((
+    ("STRONG_APPROVE", ("strongly recommend", "strongly support")),
+    ("APPROVE", ("recommend", "support", "approve")),
+    ("REJECT", ("oppose", "reject", "against")),
+    ("APPROVE_WITH_CAUTION", ("caution", "careful"))
+), "NEUTRAL")
+
+IMPACT_TABLE: KeywordTable = ((
+    ("HIGH", ("high impact", "significant impact")),
+    ("MODERATE", ("moderate impact", "medium impact")),
+    ("LOW", ("low impact", "minimal impact"))
+), "MODERATE")
+
+ADVANTAGE_TABLE: KeywordTable = ((
+    ("STRONG_POSITIVE", ("strong advantage", "significant advantage")),
+    ("POSITIVE", ("advantage", "beneficial")),
+    ("NEGATIVE", ("disadvantage", "harmful"))
+), "NEUTRAL")
+
+STRATEGY_TABLE: KeywordTable = ((
+    ("PHASED_ROLLOUT", ("phased", "gradual")),
+    ("IMMEDIATE_IMPLEMENTATION", ("immediate", "urgent")),
+    ("DELAYED_IMPLEMENTATION", ("delayed", "postpone"))
+), "STANDARD_IMPLEMENTATION")
+
+SENTIMENT_TABLE: KeywordTable = ((
+    ("VERY_POSITIVE", ("very positive", "strongly positive")),
+    ("POSITIVE", ("positive",)),
+    ("NEGATIVE", ("negative",)),
+    ("MIXED", ("mixed", "neutral"))
+), "NEUTRAL")
+
+REGIONS = ("north america", "europe", "asia", "oceania", "africa", "south america")
+
+
+@lru_cache(maxsize=64)
+def score_patterns(metric: str) -> Tuple[Pattern, ...]:
+    """Compiled 0-10 score patterns for a metric, most specific first"""
+    metric = re.escape(metric)
+    return (
+        re.compile(rf"{metric}[:\s]*{_NUMBER}[/\s]*10"),
+        re.compile(rf"{_NUMBER}[/\s]*10[:\s]*{metric}"),
+        re.compile(rf"{metric}[:\s]*{_NUMBER}")
+    )
+
+
+@lru_cache(maxsize=64)
+def percentage_patterns(context: str) -> Tuple[Pattern, ...]:
+    """Compiled percentage patterns for a context word"""
+    context = re.escape(context)
+    return (
+        re.compile(rf"{context}[:\s]*{_NUMBER}%"),
+        re.compile(rf"{_NUMBER}%[:\s]*{context}")
+    )
+
+
+# Compile every metric the gateway extracts at import
+for _metric in ("mathematical soundness", "risk", "complexity", "ecosystem", "compliance", "cultural"):
+    score_patterns(_metric)
+for _context in ("economic viability", "international"):
+    percentage_patterns(_context)
+
+
+def _truncate(text: str) -> str:
+    return text[:REASONING_CHARS] + "..." if len(text) > REASONING_CHARS else text
+
+
+class ResponseScanner:
+    """Metric extraction over one lowercased copy of a model response"""
+
+    __slots__ = ("text", "lowered")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lowered = text.lower()
+
+    def _first_number(self, keyword: str, patterns: Tuple[Pattern, ...], maximum: float, default: float) -> float:
+        # Every pattern contains the keyword; skip the regex scans when it is absent
+        if keyword not in self.lowered:
+            return default
+        for pattern in patterns:
+            match = pattern.search(self.lowered)
+            if match:
+                try:
+                    return min(maximum, max(0.0, float(match.group(1))))
+                except ValueError:
+                    continue
+        return default
+
+    def score(self, metric: str) -> float:
+        """Numerical score on a 0-10 scale, neutral when absent"""
+        return self._first_number(metric, score_patterns(metric), 10.0, DEFAULT_SCORE)
+
+    def percentage(self, context: str) -> float:
+        """Percentage near a context word, neutral when absent"""
+        return self._first_number(context, percentage_patterns(context), 100.0, DEFAULT_PERCENTAGE)
+
+    def classify(self, table: KeywordTable) -> str:
+        """Label of the first rule with a keyword in the response"""
+        rules, default = table
+        lowered = self.lowered
+        for label, keywords in rules:
+            for keyword in keywords:
+                if keyword in lowered:
+                    return label
+        return default
+
+    def recommendation(self) -> str:
+        return self.classify(RECOMMENDATION_TABLE)
+
+    def impact_level(self) -> str:
+        return self.classify(IMPACT_TABLE)
+
+    def advantage(self) -> str:
+        return self.classify(ADVANTAGE_TABLE)
+
+    def strategy(self) -> str:
+        return self.classify(STRATEGY_TABLE)
+
+    def sentiment(self) -> str:
+        return self.classify(SENTIMENT_TABLE)
+
+    def regional_breakdown(self) -> Dict[str, str]:
+        """Sentiment in the text following each region's first mention"""
+        breakdown = {}
+        for region in REGIONS:
+            start = self.lowered.find(region)
+            if start < 0:
+                continue
+            region_context = self.lowered[start:start + REGION_CONTEXT_CHARS]
+            if "positive" in region_context:
+                breakdown[region.title()] = "Positive"
+            elif "negative" in region_context:
+                breakdown[region.title()] = "Negative"
+            else:
+                breakdown[region.title()] = "Neutral"
+        return breakdown
+
+    def deepseek_metrics(self) -> Dict[str, Any]:
+        """DeepSeek-R1 mathematical analysis fields"""
+        return {
+            "mathematical_soundness": self.score("mathematical soundness"),
+            "economic_viability": self.percentage("economic viability"),
+            "risk_score": self.score("risk"),
+            "implementation_complexity": self.score("complexity"),
+            "recommendation": self.recommendation(),
+            "chain_of_thought": _truncate(self.text)
+        }
+
+    def llama_metrics(self) -> Dict[str, Any]:
+        """Llama4:maverick strategic analysis fields"""
+        return {
+            "strategic_recommendation": self.recommendation(),
+            "long_term_impact": self.impact_level(),
+            "ecosystem_health": self.score("ecosystem"),
+            "competitive_advantage": self.advantage(),
+            "implementation_strategy": self.strategy(),
+            "strategic_reasoning": _truncate(self.text)
+        }
+
+    def qwen_metrics(self) -> Dict[str, Any]:
+        """Qwen3 global perspective analysis fields"""
+        return {
+            "global_sentiment": self.sentiment(),
+            "regulatory_compliance": self.score("compliance"),
+            "cultural_impact": self.score("cultural"),
+            "international_support": self.percentage("international"),
+            "regional_analysis": self.regional_breakdown(),
+            "global_reasoning": _truncate(self.text)
+        }
+
+
+__all__ = [
+    "ResponseScanner",
+    "score_patterns",
+    "percentage_patterns"
+]
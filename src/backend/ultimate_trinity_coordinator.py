@@ -12,13 +12,14 @@ Infrastructure: 100% customer-owned Multi-Xnode sovereign architecture
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Set, Union, Any, Tuple
 from contextlib import asynccontextmanager
 
 import aiohttp
@@ -26,6 +27,19 @@ import numpy as np
 from prometheus_client import Counter, Histogram, Gauge, Summary
 from pydantic import BaseModel, Field
 
+from .adaptive_concurrency import AIMDConcurrencyLimiter
+from .chunked_analysis import ChunkedSummarizer
+from .cpu_offload import CPUOffloader
+from .http_client import HTTPClientManager
+from .keyword_matcher import KeywordMatcher
+from .model_endpoints import ModelEndpointPool
+from .model_warmup import ModelWarmupManager
+from .ollama_protocol import GenerationStats, stream_generate
+from .prompt_builder import PromptBuilder, PromptSection
+from .request_coalescing import SingleFlight
+from .response_cache import ModelResponseCache
+from .upstream_policy import UpstreamPolicies, UpstreamStatusError
+
 # Enterprise monitoring metrics
 TRINITY_REQUESTS = Counter('trinity_requests_total', 'Total Ultimate AI Trinity requests', ['model', 'analysis_type'])
 TRINITY_LATENCY = Histogram('trinity_request_duration_seconds', 'Ultimate AI Trinity request latency', ['model'])
@@ -34,6 +48,11 @@ TRINITY_COORDINATION = Summary('trinity_coordination_efficiency', 'Multi-model c
 TRINITY_ERRORS = Counter('trinity_errors_total', 'Ultimate AI Trinity errors', ['model', 'error_type'])
 TRINITY_COST_SAVINGS = Gauge('trinity_cost_savings_annual_usd', 'Annual cost savings vs cloud AI')
 
+# Cascade mode metrics
+CASCADE_REQUESTS = Counter('trinity_cascade_requests_total', 'Cascade-mode requests by outcome', ['outcome'])
+CASCADE_SAVED_SECONDS = Counter('trinity_cascade_saved_model_seconds_total', 'Estimated flagship model-seconds avoided by cascade answers')
+CASCADE_WASTED_SECONDS = Counter('trinity_cascade_wasted_model_seconds_total', 'Cascade model-seconds spent on requests that escalated')
+
 # Set baseline cost savings
 TRINITY_COST_SAVINGS.set(4800000)  # $4.8M conservative estimate
 
@@ -90,6 +109,22 @@ class TrinityRequest:
     temperature: float = 0.7
     require_consensus: bool = False
     models_required: Optional[List[TrinityModel]] = None
+    cascade: bool = False  # Try the cascade model before the flagship models
+    
+    def content_hash(self) -> str:
+        """Stable hash of the fields that determine the analysis output"""
+        material = {
+            "content": self.content,
+            "analysis_type": self.analysis_type.value,
+            "complexity": self.complexity.value,
+            "context": self.context,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "require_consensus": self.require_consensus,
+            "models_required": [model.value for model in self.models_required] if self.models_required else None,
+            "cascade": self.cascade
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode()).hexdigest()
 
 
 @dataclass
@@ -102,6 +137,7 @@ class ModelResponse:
     processing_time: float
     token_count: int
     metadata: Dict[str, Any] = field(default_factory=dict)
+    generation_stats: Dict[str, Any] = field(default_factory=dict)  # Ollama token/timing metadata
 
 
 @dataclass
@@ -130,20 +166,134 @@ class UltimateAITrinityCoordinator:
     - Competitive advantage preservation through infrastructure sovereignty
     """
     
+    # Healthy decode latency per output token for adaptive concurrency
+    # (whole generations run for minutes at num_predict up to 4000, so the
+    # limiters track eval_duration / eval_count; larger models decode slower)
+    DECODE_LATENCY_TARGETS = {
+        TrinityModel.DEEPSEEK_R1: 0.15,
+        TrinityModel.LLAMA4_MAVERICK: 0.08,
+        TrinityModel.QWEN3: 0.08
+    }
+    
+    # Typical flagship output length, seeding the smoothed latency estimate
+    EXPECTED_OUTPUT_TOKENS = 1024
+    
+    # Prompt token budgets per model; request content is trimmed to fit
+    PROMPT_TOKEN_BUDGETS = {
+        TrinityModel.DEEPSEEK_R1: 3072,
+        TrinityModel.LLAMA4_MAVERICK: 3072,
+        TrinityModel.QWEN3: 2560
+    }
+    
+    # Longer content is map-reduced first (leaves room for the other prompt
+    # sections within every model budget)
+    CONTENT_TOKEN_TARGET = 2048
+    
+    # Model that condenses long content (fastest of the Trinity)
+    SUMMARY_MODEL = TrinityModel.QWEN3
+    
+    # Healthy latency for the small cascade model
+    CASCADE_LATENCY_TARGET = 5.0
+    
+    # Response scoring keywords: reasoning structure, and per-model quality
+    # indicators with the match count that earns a full quality score
+    REASONING_INDICATORS = ("because", "therefore", "analysis", "evidence", "conclusion")
+    QUALITY_INDICATORS = {
+        TrinityModel.DEEPSEEK_R1: (("calculate", "formula", "probability", "statistical", "quantitative"), 3),
+        TrinityModel.LLAMA4_MAVERICK: (("strategic", "risk", "opportunity", "plan", "decision", "recommendation"), 4),
+        TrinityModel.QWEN3: (("international", "cultural", "global", "regional", "perspective"), 3)
+    }
+    
     def __init__(self, 
                  performance_xnode: str = "23.92.65.18",
                  trinity_port: int = 11434,
                  max_concurrent_requests: int = 10,
-                 enable_monitoring: bool = True):
+                 enable_monitoring: bool = True,
+                 response_cache: Optional[ModelResponseCache] = None,
+                 endpoint_pool: Optional[ModelEndpointPool] = None,
+                 model_warmup: Optional[ModelWarmupManager] = None,
+                 cascade_model: Optional[str] = None,
+                 cascade_parameters: int = 8,
+                 cascade_confidence_threshold: float = 0.6,
+                 cascade_quality_threshold: float = 0.5,
+                 cpu_offload_workers: int = 4,
+                 cpu_offload_min_chars: int = 8192,
+                 http_client: Optional[HTTPClientManager] = None,
+                 upstream_policies: Optional[UpstreamPolicies] = None):
         self.performance_xnode = performance_xnode
         self.trinity_endpoint = f"http://{performance_xnode}:{trinity_port}"
         self.max_concurrent_requests = max_concurrent_requests
         self.enable_monitoring = enable_monitoring
         
-        # Enterprise session management
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Connection pool (shared with the gateway when provided)
+        self.http_client = http_client or HTTPClientManager(
+            "coordinator", limit=50, limit_per_host=20, headers={"User-Agent": "Polka-Trinity-Ultimate-AI/1.0.0"}
+        )
+        self._owns_http_client = http_client is None
+        
+        # Per-model timeouts, retries and retry budgets (shared with the gateway when provided)
+        self.upstream_policies = upstream_policies or UpstreamPolicies()
+        # Per-model AIMD concurrency limits; slots are admitted by request priority
+        self.concurrency_limiters = {
+            model: AIMDConcurrencyLimiter(
+                model.value,
+                latency_target_seconds=self.DECODE_LATENCY_TARGETS[model],
+                initial_limit=max(1, max_concurrent_requests // len(TrinityModel)),
+                max_limit=max_concurrent_requests,
+                per_token=True
+            )
+            for model in TrinityModel
+        }
+        # Scoring and synthesis of large responses run in worker threads
+        self.cpu_offload = CPUOffloader(
+            "coordinator", max_workers=cpu_offload_workers, min_offload_size=cpu_offload_min_chars
+        )
+        
+        # Cascade mode: a small local model answers first and requests escalate
+        # to the flagship models when its confidence or reasoning quality is low
+        self.cascade_model = cascade_model
+        self.cascade_parameters = cascade_parameters  # Billions, for reporting
+        self.cascade_confidence_threshold = cascade_confidence_threshold
+        self.cascade_quality_threshold = cascade_quality_threshold
+        self.cascade_limiter = AIMDConcurrencyLimiter(
+            cascade_model or "cascade",
+            latency_target_seconds=self.CASCADE_LATENCY_TARGET,
+            initial_limit=max(1, max_concurrent_requests // 2),
+            max_limit=max_concurrent_requests * 2
+        ) if cascade_model else None
+        self.cascade_accepted = 0
+        self.cascade_escalated = 0
+        # Smoothed flagship latency, used to estimate model-seconds saved
+        self._latency_ewma = {
+            model: self.DECODE_LATENCY_TARGETS[model] * self.EXPECTED_OUTPUT_TOKENS for model in TrinityModel
+        }
+        
+        # Inference endpoints per model (shared with the gateway when provided)
+        self.endpoint_pool = endpoint_pool or ModelEndpointPool({}, default_endpoints=[self.trinity_endpoint])
+        
+        # Traffic-based keep_alive and model residency (shared with the gateway when provided)
+        self.model_warmup = model_warmup or ModelWarmupManager(
+            self.endpoint_pool, [model.value for model in TrinityModel]
+        )
+        
+        # Flagship model generation cache (shared with the gateway when provided)
+        self.response_cache = response_cache or ModelResponseCache()
+        
+        # Concurrent identical requests share one in-flight coordination
+        self.analysis_flights = SingleFlight("coordinator_analysis")
+        
+        # Long content is summarized in chunks; model slots bound the parallelism
+        self.content_summarizer = ChunkedSummarizer(max_parallel=max_concurrent_requests)
+        
+        # Token-budgeted prompt sections: content first, then the model focus
+        self.prompt_builder = PromptBuilder([
+            PromptSection("content", lambda request, capability: request.content, essential=True, trimmable=True),
+            PromptSection("focus", self._model_focus_directive, essential=True),
+            PromptSection(
+                "specializations",
+                lambda request, capability: f"Specializations: {', '.join(capability.specializations[:3])}"
+            )
+        ])
         
         # Model capability definitions
         self.model_capabilities = {
@@ -203,6 +353,19 @@ class UltimateAITrinityCoordinator:
             )
         }
         
+        # One matcher over every model's scoring keywords: a response is
+        # scanned once and the matches feed both confidence and quality
+        self.keyword_matcher = KeywordMatcher(
+            ["error", *self.REASONING_INDICATORS]
+            + [keyword for indicators, _ in self.QUALITY_INDICATORS.values() for keyword in indicators]
+            + [
+                keyword
+                for capability in self.model_capabilities.values()
+                for spec in capability.specializations
+                for keyword in spec.lower().split()
+            ]
+        )
+        
         # Performance tracking
         self.total_parameters = sum(cap.parameters for cap in self.model_capabilities.values())
         TRINITY_PARAMETERS.labels(model="total").set(self.total_parameters * 1_000_000_000)  # Convert to actual parameters
@@ -214,20 +377,8 @@ class UltimateAITrinityCoordinator:
     
     @asynccontextmanager
     async def get_session(self):
-        """Enterprise-grade HTTP session management"""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers={"User-Agent": "Polka-Trinity-Ultimate-AI/1.0.0"},
-                connector=aiohttp.TCPConnector(limit=50, limit_per_host=20)
-            )
-        
-        try:
-            yield self._session
-        finally:
-            # Session remains open for reuse
-            pass
+        """Enterprise-grade HTTP session management (pooled, stays open for reuse)"""
+        yield self.http_client.session
     
     async def health_check(self) -> Dict[str, Any]:
         """Ultimate AI Trinity health validation"""
@@ -259,6 +410,7 @@ class UltimateAITrinityCoordinator:
                             )
                             health_status["trinity_models"][trinity_model.value] = {
                                 "available": model_available,
+                                "loaded": self.model_warmup.is_loaded(trinity_model.value),
                                 "parameters": f"{self.model_capabilities[trinity_model].parameters}B",
                                 "specializations": self.model_capabilities[trinity_model].specializations[:3]
                             }
@@ -281,6 +433,8 @@ class UltimateAITrinityCoordinator:
             health_status["error"] = f"Health check failed: {str(e)}"
             logger.error(f"Ultimate AI Trinity health check failed: {e}")
         
+        health_status["model_warmup"] = self.model_warmup.stats()
+        health_status["cpu_offload"] = self.cpu_offload.stats()
         return health_status
     
     def select_optimal_models(self, 
@@ -328,111 +482,258 @@ class UltimateAITrinityCoordinator:
         """Execute analysis with individual flagship model"""
         start_time = time.time()
         
-        async with self._semaphore:  # Respect concurrency limits
-            try:
-                # Track request metrics
-                TRINITY_REQUESTS.labels(
-                    model=model.value, 
-                    analysis_type=request.analysis_type.value
-                ).inc()
-                
-                # Prepare model-specific prompt optimization
-                capability = self.model_capabilities[model]
-                optimized_prompt = self._optimize_prompt_for_model(request, capability)
-                
-                # Execute model inference via Performance Xnode
-                async with self.get_session() as session:
-                    inference_payload = {
-                        "model": model.value,
-                        "prompt": optimized_prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": request.temperature,
-                            "num_predict": request.max_tokens,
-                            "top_p": 0.9,
-                            "repeat_penalty": 1.1
-                        }
-                    }
-                    
-                    inference_url = f"{self.trinity_endpoint}/api/generate"
-                    async with session.post(inference_url, json=inference_payload) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            content = result.get("response", "")
-                            
-                            # Calculate quality metrics
-                            confidence = self._calculate_confidence(content, capability)
-                            reasoning_quality = self._assess_reasoning_quality(content, model)
-                            
-                            processing_time = time.time() - start_time
-                            
-                            # Record performance metrics
-                            TRINITY_LATENCY.labels(model=model.value).observe(processing_time)
-                            
-                            return ModelResponse(
-                                model=model,
-                                content=content,
-                                confidence=confidence,
-                                reasoning_quality=reasoning_quality,
-                                processing_time=processing_time,
-                                token_count=len(content.split()),  # Approximate token count
-                                metadata={
-                                    "capability_match": request.analysis_type in capability.optimal_use_cases,
-                                    "performance_profile": capability.performance_profile,
-                                    "specializations": capability.specializations
-                                }
-                            )
-                        else:
-                            raise Exception(f"Model inference failed: HTTP {response.status}")
+        try:
+            # Track request metrics
+            TRINITY_REQUESTS.labels(
+                model=model.value, 
+                analysis_type=request.analysis_type.value
+            ).inc()
             
-            except Exception as e:
-                TRINITY_ERRORS.labels(model=model.value, error_type=type(e).__name__).inc()
-                logger.error(f"Flagship model {model.value} analysis failed: {e}")
-                
-                # Return error response
-                return ModelResponse(
-                    model=model,
-                    content=f"Analysis unavailable due to technical issue: {str(e)}",
-                    confidence=0.0,
-                    reasoning_quality=0.0,
-                    processing_time=time.time() - start_time,
-                    token_count=0,
-                    metadata={"error": str(e)}
-                )
+            # Prepare model-specific prompt optimization
+            optimized_prompt = self._optimize_prompt_for_model(model, request)
+            inference_payload = self._build_inference_payload(model, request, optimized_prompt)
+            
+            content, stats = await self._generate(
+                model.value, self.concurrency_limiters[model], optimized_prompt, inference_payload, request.priority
+            )
+            return await self._complete_model_response(model, request, content, start_time, stats)
+        
+        except Exception as e:
+            return self._build_error_response(model, e, start_time)
     
-    def _optimize_prompt_for_model(self, request: TrinityRequest, capability: ModelCapability) -> str:
-        """Optimize prompt for specific flagship model capabilities"""
-        base_prompt = request.content
-        
-        # Add model-specific optimization context
-        if "mathematical" in capability.specializations[0].lower():
-            optimization = "\n\nApproach this with rigorous mathematical reasoning and quantitative analysis."
-        elif "strategic" in capability.specializations[0].lower():
-            optimization = "\n\nProvide strategic intelligence with risk assessment and planning insights."
-        elif "global" in capability.specializations[0].lower():
-            optimization = "\n\nAnalyze from a global perspective considering cultural and international implications."
-        else:
-            optimization = "\n\nProvide comprehensive analysis leveraging your specialized capabilities."
+    async def _generate(self,
+                        model_name: str,
+                        limiter: AIMDConcurrencyLimiter,
+                        prompt: str,
+                        inference_payload: Dict[str, Any],
+                        priority: int) -> Tuple[str, Optional[GenerationStats]]:
+        """Run one generate call through the cache, admission control and endpoint pool
         
-        # Add context about Ultimate AI Trinity positioning
-        trinity_context = f"""
-
-Context: You are part of the Ultimate AI Trinity - the world's first trillion-parameter 
-customer-owned governance intelligence platform. Your analysis contributes to unprecedented 
-competitive advantages:
-
-- Infrastructure Sovereignty: 100% customer ownership
-- Cost Efficiency: $0 operational costs vs $3.6M-6M cloud equivalents
-- Capability Leadership: {capability.parameters}B parameters of specialized intelligence
-
-Specializations: {', '.join(capability.specializations[:3])}
-"""
+        Returns the generated text and Ollama metadata (None for cached generations).
+        """
+        # Cached generations bypass admission control entirely
+        cached = await self.response_cache.get(model_name, prompt, inference_payload["options"])
+        if cached is not None:
+            return cached, None
+        
+        self.model_warmup.record_request(model_name)
+        async def attempt(timeout: aiohttp.ClientTimeout) -> Dict[str, Any]:
+            # Execute model inference via Performance Xnode (fresh endpoint lease per attempt)
+            async with self.get_session() as session, self.endpoint_pool.lease(model_name) as endpoint:
+                async with session.post(endpoint.generate_url, json=inference_payload, timeout=timeout) as response:
+                    if response.status != 200:
+                        raise UpstreamStatusError(response.status, f"Model inference failed: HTTP {response.status}")
+                    return await response.json()
+        
+        async with limiter.slot(priority) as latency:  # Adaptive per-model limits
+            result = await self.upstream_policies.call(model_name, attempt)
+            stats = GenerationStats.from_response(result)
+            latency.report(stats.seconds_per_token)
+        content = result.get("response", "")
+        
+        await self.response_cache.put(model_name, prompt, inference_payload["options"], content)
+        return content, stats
+    
+    async def _prepare_prompt_request(self, request: TrinityRequest) -> TrinityRequest:
+        """Map-reduce oversized content so every model sees the whole request"""
+        async def summarize(prompt: str) -> str:
+            payload = {
+                "model": self.SUMMARY_MODEL.value,
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": self.model_warmup.keep_alive_for(self.SUMMARY_MODEL.value),
+                "options": {"temperature": 0.1, "num_predict": 512, "top_p": 0.9}
+            }
+            content, _ = await self._generate(
+                self.SUMMARY_MODEL.value, self.concurrency_limiters[self.SUMMARY_MODEL], prompt, payload, request.priority
+            )
+            return content
         
-        return base_prompt + optimization + trinity_context
+        reduced = await self.content_summarizer.reduce(request.content, self.CONTENT_TOKEN_TARGET, summarize)
+        if not reduced.summarized:
+            return request
+        return replace(request, content=reduced.text)
     
-    def _calculate_confidence(self, content: str, capability: ModelCapability) -> float:
-        """Calculate confidence score for model response"""
-        if not content or "error" in content.lower():
+    async def stream_with_flagship_model(self,
+                                         model: TrinityModel,
+                                         request: TrinityRequest,
+                                         events: asyncio.Queue) -> ModelResponse:
+        """Execute streaming analysis with an individual flagship model
+        
+        Token chunks are pushed onto ``events`` as they arrive from the
+        Ollama NDJSON stream; the assembled ModelResponse is returned.
+        """
+        start_time = time.time()
+        
+        try:
+            TRINITY_REQUESTS.labels(
+                model=model.value, 
+                analysis_type=request.analysis_type.value
+            ).inc()
+            
+            optimized_prompt = self._optimize_prompt_for_model(model, request)
+            inference_payload = self._build_inference_payload(model, request, optimized_prompt)
+            
+            cached = await self.response_cache.get(model.value, optimized_prompt, inference_payload["options"])
+            if cached is not None:
+                await events.put({"event": "token", "model": model.value, "chunk": cached})
+                return await self._complete_model_response(model, request, cached, start_time)
+            
+            async def attempt(timeout: aiohttp.ClientTimeout) -> AsyncIterator[Dict[str, Any]]:
+                # Fresh endpoint lease per attempt
+                async with self.get_session() as session, self.endpoint_pool.lease(model.value) as endpoint:
+                    async for chunk in stream_generate(session, endpoint.generate_url, inference_payload, timeout):
+                        yield chunk
+            
+            chunks = []
+            stats = None
+            self.model_warmup.record_request(model.value)
+            async with self.concurrency_limiters[model].slot(request.priority) as latency:  # Adaptive per-model limits
+                # Retried only until the first chunk reaches the caller
+                async for chunk in self.upstream_policies.stream(model.value, attempt):
+                    token = chunk.get("response", "")
+                    if token:
+                        chunks.append(token)
+                        await events.put({"event": "token", "model": model.value, "chunk": token})
+                    if chunk.get("done"):
+                        stats = GenerationStats.from_response(chunk)
+                        latency.report(stats.seconds_per_token)
+            
+            content = "".join(chunks)
+            await self.response_cache.put(model.value, optimized_prompt, inference_payload["options"], content)
+            return await self._complete_model_response(model, request, content, start_time, stats)
+        
+        except Exception as e:
+            return self._build_error_response(model, e, start_time)
+    
+    def _build_inference_payload(self, model: TrinityModel, request: TrinityRequest, prompt: str) -> Dict[str, Any]:
+        """Build Ollama generate payload for a flagship model request"""
+        return {
+            "model": model.value,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": self.model_warmup.keep_alive_for(model.value),
+            "options": {
+                "temperature": request.temperature,
+                "num_predict": request.max_tokens,
+                "top_p": 0.9,
+                "repeat_penalty": 1.1
+            }
+        }
+    
+    async def _complete_model_response(self,
+                                       model: TrinityModel,
+                                       request: TrinityRequest,
+                                       content: str,
+                                       start_time: float,
+                                       stats: Optional[GenerationStats] = None) -> ModelResponse:
+        """Score model output off the event loop, then record its metrics on it"""
+        response = await self.cpu_offload.run(
+            len(content), self._build_model_response, model, request, content, start_time, stats
+        )
+        self._record_model_metrics(response, stats)
+        return response
+    
+    def _record_model_metrics(self, response: ModelResponse, stats: Optional[GenerationStats] = None) -> None:
+        """Record latency and generation metrics for a successful model response"""
+        model = response.model
+        TRINITY_LATENCY.labels(model=model.value).observe(response.processing_time)
+        self._latency_ewma[model] = 0.8 * self._latency_ewma[model] + 0.2 * response.processing_time
+        if stats is not None:
+            stats.record(model.value)
+    
+    def _build_model_response(self,
+                              model: TrinityModel,
+                              request: TrinityRequest,
+                              content: str,
+                              start_time: float,
+                              stats: Optional[GenerationStats] = None) -> ModelResponse:
+        """Score model output and wrap it in a ModelResponse
+        
+        ``stats`` carries Ollama's token counts and timings for live
+        generations; cached responses fall back to a word-count estimate.
+        Runs on offload workers, so it must not touch shared state.
+        """
+        capability = self.model_capabilities[model]
+        
+        # Calculate quality metrics (single keyword scan shared by both scores)
+        found = self.keyword_matcher.find(content)
+        confidence = self._calculate_confidence(content, capability, found)
+        reasoning_quality = self._assess_reasoning_quality(content, model, found)
+        
+        processing_time = time.time() - start_time
+        
+        return ModelResponse(
+            model=model,
+            content=content,
+            confidence=confidence,
+            reasoning_quality=reasoning_quality,
+            processing_time=processing_time,
+            token_count=stats.eval_count if stats and stats.eval_count else len(content.split()),
+            metadata={
+                "capability_match": request.analysis_type in capability.optimal_use_cases,
+                "performance_profile": capability.performance_profile,
+                "specializations": capability.specializations
+            },
+            generation_stats=stats.to_dict() if stats else {}
+        )
+    
+    def _build_error_response(self, model: TrinityModel, error: Exception, start_time: float) -> ModelResponse:
+        """Record a flagship model failure and build its error response"""
+        TRINITY_ERRORS.labels(model=model.value, error_type=type(error).__name__).inc()
+        logger.error(f"Flagship model {model.value} analysis failed: {error}")
+        
+        return ModelResponse(
+            model=model,
+            content=f"Analysis unavailable due to technical issue: {str(error)}",
+            confidence=0.0,
+            reasoning_quality=0.0,
+            processing_time=time.time() - start_time,
+            token_count=0,
+            metadata={"error": str(error)}
+        )
+    
+    def _optimize_prompt_for_model(self, model: TrinityModel, request: TrinityRequest) -> str:
+        """Build the model prompt within its token budget"""
+        built = self.prompt_builder.build(
+            model.value,
+            self.PROMPT_TOKEN_BUDGETS[model],
+            request,
+            self.model_capabilities[model]
+        )
+        return built.text
+    
+    @staticmethod
+    def _model_focus_directive(request: TrinityRequest, capability: ModelCapability) -> str:
+        """One-line instruction steering the model towards its specialization"""
+        specialization = capability.specializations[0].lower()
+        if "mathematical" in specialization:
+            return "Approach this with rigorous mathematical reasoning and quantitative analysis."
+        elif "strategic" in specialization:
+            return "Provide strategic intelligence with risk assessment and planning insights."
+        elif "global" in specialization:
+            return "Analyze from a global perspective considering cultural and international implications."
+        return "Provide comprehensive analysis leveraging your specialized capabilities."
+    
+    def _score_content(self, content: str, model: TrinityModel) -> Tuple[float, float]:
+        """Confidence and reasoning quality of content against a model's capability"""
+        found = self.keyword_matcher.find(content)
+        confidence = float(self._calculate_confidence(content, self.model_capabilities[model], found))
+        return confidence, self._assess_reasoning_quality(content, model, found)
+    
+    def _calculate_confidence(self,
+                              content: str,
+                              capability: ModelCapability,
+                              found: Optional[Set[str]] = None) -> float:
+        """Calculate confidence score for model response
+        
+        ``found`` is the response's keyword matches when already scanned.
+        """
+        if not content:
+            return 0.0
+        if found is None:
+            found = self.keyword_matcher.find(content)
+        if "error" in found:
             return 0.0
         
         # Base confidence from content quality indicators
@@ -450,43 +751,33 @@ Specializations: {', '.join(capability.specializations[:3])}
         # Specialization alignment
         specialization_matches = sum(
             1 for spec in capability.specializations
-            if any(keyword in content.lower() for keyword in spec.lower().split())
+            if any(keyword in found for keyword in spec.lower().split())
         )
         confidence_factors.append(min(specialization_matches / len(capability.specializations), 1.0))
         
         # Structure and reasoning indicators
-        reasoning_indicators = ["because", "therefore", "analysis", "evidence", "conclusion"]
-        reasoning_score = sum(1 for indicator in reasoning_indicators if indicator in content.lower())
-        confidence_factors.append(min(reasoning_score / len(reasoning_indicators), 1.0))
+        reasoning_score = sum(1 for indicator in self.REASONING_INDICATORS if indicator in found)
+        confidence_factors.append(min(reasoning_score / len(self.REASONING_INDICATORS), 1.0))
         
         return np.mean(confidence_factors) if confidence_factors else 0.5
     
-    def _assess_reasoning_quality(self, content: str, model: TrinityModel) -> float:
-        """Assess reasoning quality based on model specialization"""
+    def _assess_reasoning_quality(self,
+                                  content: str,
+                                  model: TrinityModel,
+                                  found: Optional[Set[str]] = None) -> float:
+        """Assess reasoning quality based on model specialization
+        
+        ``found`` is the response's keyword matches when already scanned.
+        """
         if not content:
             return 0.0
+        if found is None:
+            found = self.keyword_matcher.find(content)
         
-        capability = self.model_capabilities[model]
-        quality_score = 0.0
-        
-        # Model-specific quality assessment
-        if model == TrinityModel.DEEPSEEK_R1:
-            # Mathematical and analytical reasoning quality
-            math_indicators = ["calculate", "formula", "probability", "statistical", "quantitative"]
-            math_score = sum(1 for indicator in math_indicators if indicator in content.lower())
-            quality_score = min(math_score / 3, 1.0)  # Normalize to 0-1
-        
-        elif model == TrinityModel.LLAMA4_MAVERICK:
-            # Strategic and planning reasoning quality
-            strategy_indicators = ["strategic", "risk", "opportunity", "plan", "decision", "recommendation"]
-            strategy_score = sum(1 for indicator in strategy_indicators if indicator in content.lower())
-            quality_score = min(strategy_score / 4, 1.0)
-        
-        elif model == TrinityModel.QWEN3:
-            # Global and cultural reasoning quality
-            global_indicators = ["international", "cultural", "global", "regional", "perspective"]
-            global_score = sum(1 for indicator in global_indicators if indicator in content.lower())
-            quality_score = min(global_score / 3, 1.0)
+        # Model-specific quality assessment: mathematical (DeepSeek-R1),
+        # strategic (Llama4:maverick) or global (Qwen3) reasoning indicators
+        indicators, full_score_matches = self.QUALITY_INDICATORS[model]
+        quality_score = min(sum(1 for indicator in indicators if indicator in found) / full_score_matches, 1.0)
         
         # Boost for structured reasoning
         if "1." in content or "•" in content or "First," in content:
@@ -494,8 +785,24 @@ Specializations: {', '.join(capability.specializations[:3])}
         
         return quality_score
     
+    def _select_request_models(self, request: TrinityRequest) -> List[TrinityModel]:
+        """Resolve explicit model requirements or select optimal models"""
+        if request.models_required:
+            return request.models_required
+        return self.select_optimal_models(request.analysis_type, request.complexity)
+    
     async def coordinate_ultimate_trinity_analysis(self, request: TrinityRequest) -> TrinityAnalysis:
-        """Execute comprehensive Ultimate AI Trinity analysis coordination"""
+        """Execute comprehensive Ultimate AI Trinity analysis coordination
+        
+        Concurrent requests with the same content hash await a single run.
+        """
+        return await self.analysis_flights.do(
+            request.content_hash(),
+            lambda: self._run_trinity_coordination(request)
+        )
+    
+    async def _run_trinity_coordination(self, request: TrinityRequest) -> TrinityAnalysis:
+        """Execute one Ultimate AI Trinity coordination run"""
         start_time = time.time()
         request_id = f"trinity_{int(time.time() * 1000)}_{hash(request.content) % 10000}"
         
@@ -505,82 +812,252 @@ Specializations: {', '.join(capability.specializations[:3])}
         
         try:
             # Select optimal models for this analysis
-            if request.models_required:
-                selected_models = request.models_required
-            else:
-                selected_models = self.select_optimal_models(request.analysis_type, request.complexity)
+            selected_models = self._select_request_models(request)
             
             logger.info(f"🤖 Selected models: {[m.value for m in selected_models]}")
+            prompt_request = await self._prepare_prompt_request(request)
+            
+            cascade_outcome = None
+            if request.cascade and self.cascade_model:
+                cascade_analysis, cascade_outcome = await self._try_cascade(
+                    request_id, prompt_request, selected_models, start_time
+                )
+                if cascade_analysis is not None:
+                    return cascade_analysis
             
             # Execute parallel analysis across flagship models
             model_tasks = [
-                self.analyze_with_flagship_model(model, request)
+                self.analyze_with_flagship_model(model, prompt_request)
                 for model in selected_models
             ]
             
             flagship_responses = await asyncio.gather(*model_tasks, return_exceptions=True)
             
-            # Filter out exceptions and process valid responses
-            valid_responses = [
-                response for response in flagship_responses 
-                if isinstance(response, ModelResponse)
-            ]
-            
-            if not valid_responses:
-                raise Exception("All flagship models failed to provide analysis")
-            
-            # Coordinate and synthesize flagship insights
-            coordinated_insight = self._synthesize_flagship_insights(valid_responses, request)
-            
-            # Calculate overall metrics
-            confidence_score = np.mean([r.confidence for r in valid_responses])
-            consensus_level = self._calculate_consensus_level(valid_responses)
-            total_parameters_utilized = sum(
-                self.model_capabilities[r.model].parameters * 1_000_000_000 
-                for r in valid_responses
+            analysis = await self._build_trinity_analysis_offloaded(request_id, request, flagship_responses, start_time)
+            if cascade_outcome is not None:
+                analysis.metadata["cascade"] = cascade_outcome
+            return analysis
+        
+        except Exception as e:
+            logger.error(f"Ultimate AI Trinity coordination failed: {e}")
+            TRINITY_ERRORS.labels(model="coordinator", error_type=type(e).__name__).inc()
+            raise
+    
+    async def _try_cascade(self,
+                           request_id: str,
+                           request: TrinityRequest,
+                           selected_models: List[TrinityModel],
+                           start_time: float) -> Tuple[Optional[TrinityAnalysis], Dict[str, Any]]:
+        """Answer with the cascade model, judged against the lead flagship model
+        
+        Returns the accepted analysis (or None to escalate) and the cascade
+        outcome recorded in the analysis metadata.
+        """
+        lead_model = selected_models[0]
+        prompt = self._optimize_prompt_for_model(lead_model, request)
+        payload = {
+            **self._build_inference_payload(lead_model, request, prompt),
+            "model": self.cascade_model,
+            "keep_alive": self.model_warmup.keep_alive_for(self.cascade_model)
+        }
+        
+        cascade_start = time.time()
+        try:
+            content, _ = await self._generate(self.cascade_model, self.cascade_limiter, prompt, payload, request.priority)
+        except Exception as e:
+            logger.warning(f"⚠️ Cascade model {self.cascade_model} failed, escalating: {str(e)}")
+            content = ""
+        cascade_seconds = time.time() - cascade_start
+        
+        confidence, reasoning_quality = await self.cpu_offload.run(
+            len(content), self._score_content, content, lead_model
+        )
+        outcome = {
+            "model": self.cascade_model,
+            "confidence": confidence,
+            "reasoning_quality": reasoning_quality,
+            "escalated": (
+                confidence < self.cascade_confidence_threshold
+                or reasoning_quality < self.cascade_quality_threshold
             )
-            
-            processing_time = time.time() - start_time
-            
-            # Calculate cost efficiency metrics
-            cost_efficiency = self._calculate_cost_efficiency(valid_responses, processing_time)
-            
-            # Identify competitive advantages
-            competitive_advantages = self._identify_competitive_advantages(valid_responses)
-            
-            # Record coordination efficiency
-            TRINITY_COORDINATION.observe(processing_time)
-            
-            result = TrinityAnalysis(
-                request_id=request_id,
-                analysis_type=request.analysis_type,
-                flagship_responses=valid_responses,
-                coordinated_insight=coordinated_insight,
-                confidence_score=confidence_score,
-                consensus_level=consensus_level,
-                total_parameters_utilized=total_parameters_utilized,
-                processing_time=processing_time,
-                cost_efficiency=cost_efficiency,
-                competitive_advantages=competitive_advantages,
-                metadata={
-                    "models_used": [r.model.value for r in valid_responses],
-                    "total_capability": f"{sum(self.model_capabilities[r.model].parameters for r in valid_responses)}B parameters",
-                    "infrastructure": "Multi-Xnode Sovereign Architecture",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+        }
+        
+        if outcome["escalated"]:
+            self.cascade_escalated += 1
+            CASCADE_REQUESTS.labels(outcome="escalated").inc()
+            CASCADE_WASTED_SECONDS.inc(cascade_seconds)
+            logger.info(
+                f"⬆️ Cascade escalated {request_id} to {[m.value for m in selected_models]} "
+                f"(confidence {confidence:.2f}, quality {reasoning_quality:.2f})"
             )
+            return None, outcome
+        
+        self.cascade_accepted += 1
+        CASCADE_REQUESTS.labels(outcome="accepted").inc()
+        saved_seconds = max(0.0, sum(self._latency_ewma[model] for model in selected_models) - cascade_seconds)
+        CASCADE_SAVED_SECONDS.inc(saved_seconds)
+        outcome["saved_model_seconds"] = saved_seconds
+        
+        processing_time = time.time() - start_time
+        logger.info(f"✅ Cascade answered {request_id} with {self.cascade_model} ({saved_seconds:.1f} model-seconds saved)")
+        return TrinityAnalysis(
+            request_id=request_id,
+            analysis_type=request.analysis_type,
+            flagship_responses=[],
+            coordinated_insight=content,
+            confidence_score=confidence,
+            consensus_level=1.0,
+            total_parameters_utilized=self.cascade_parameters * 1_000_000_000,
+            processing_time=processing_time,
+            cost_efficiency=self._calculate_cost_efficiency([], processing_time),
+            competitive_advantages=self._identify_competitive_advantages([]),
+            metadata={
+                "models_used": [self.cascade_model],
+                "total_capability": f"{self.cascade_parameters}B parameters",
+                "infrastructure": "Multi-Xnode Sovereign Architecture",
+                "timestamp": datetime.utcnow().isoformat(),
+                "cascade": outcome
+            }
+        ), outcome
+    
+    def cascade_stats(self) -> Dict[str, Any]:
+        """Cascade mode counters for monitoring"""
+        total = self.cascade_accepted + self.cascade_escalated
+        return {
+            "model": self.cascade_model,
+            "accepted": self.cascade_accepted,
+            "escalated": self.cascade_escalated,
+            "escalation_rate": self.cascade_escalated / total if total else 0.0,
+            "thresholds": {
+                "confidence": self.cascade_confidence_threshold,
+                "reasoning_quality": self.cascade_quality_threshold
+            }
+        }
+    
+    async def stream_ultimate_trinity_analysis(self, request: TrinityRequest) -> AsyncIterator[Dict[str, Any]]:
+        """Execute Ultimate AI Trinity analysis, streaming model tokens as they arrive
+        
+        Yields ``token`` events ({"event", "model", "chunk"}), one
+        ``model_complete`` event per model and finally a ``synthesis``
+        event carrying the TrinityAnalysis.
+        """
+        start_time = time.time()
+        request_id = f"trinity_{int(time.time() * 1000)}_{hash(request.content) % 10000}"
+        
+        logger.info(f"🧠 Streaming Ultimate AI Trinity analysis initiated: {request_id}")
+        
+        selected_models = self._select_request_models(request)
+        prompt_request = await self._prepare_prompt_request(request)
+        events: asyncio.Queue = asyncio.Queue()
+        
+        async def run_model(model: TrinityModel) -> ModelResponse:
+            response = await self.stream_with_flagship_model(model, prompt_request, events)
+            event = {"event": "model_complete", "model": model.value}
+            if "error" in response.metadata:
+                event["error"] = response.metadata["error"]
+            await events.put(event)
+            return response
+        
+        tasks = [asyncio.create_task(run_model(model)) for model in selected_models]
+        try:
+            completed = 0
+            while completed < len(tasks):
+                event = await events.get()
+                if event["event"] == "model_complete":
+                    completed += 1
+                yield event
             
-            logger.info(f"✅ Ultimate AI Trinity analysis complete: {request_id}")
-            logger.info(f"🎯 Confidence: {confidence_score:.2f}, Consensus: {consensus_level:.2f}")
-            logger.info(f"⚡ Processing time: {processing_time:.2f}s")
-            logger.info(f"💰 Cost efficiency: $0 operational (${cost_efficiency['cloud_equivalent_cost']:.0f} saved)")
-            
-            return result
+            flagship_responses = [task.result() for task in tasks]
+            yield {
+                "event": "synthesis",
+                "analysis": await self._build_trinity_analysis_offloaded(
+                    request_id, request, flagship_responses, start_time
+                )
+            }
         
         except Exception as e:
-            logger.error(f"Ultimate AI Trinity coordination failed: {e}")
+            logger.error(f"Ultimate AI Trinity streaming coordination failed: {e}")
             TRINITY_ERRORS.labels(model="coordinator", error_type=type(e).__name__).inc()
             raise
+        
+        finally:
+            # Client disconnects must not leave model streams running
+            for task in tasks:
+                task.cancel()
+    
+    async def _build_trinity_analysis_offloaded(self,
+                                                request_id: str,
+                                                request: TrinityRequest,
+                                                flagship_responses: List[Any],
+                                                start_time: float) -> TrinityAnalysis:
+        """Build the TrinityAnalysis, in a worker thread for large combined responses"""
+        size = sum(len(r.content) for r in flagship_responses if isinstance(r, ModelResponse))
+        return await self.cpu_offload.run(
+            size, self._build_trinity_analysis, request_id, request, flagship_responses, start_time
+        )
+    
+    def _build_trinity_analysis(self,
+                                request_id: str,
+                                request: TrinityRequest,
+                                flagship_responses: List[Any],
+                                start_time: float) -> TrinityAnalysis:
+        """Synthesize flagship model responses into a TrinityAnalysis"""
+        # Filter out exceptions and process valid responses
+        valid_responses = [
+            response for response in flagship_responses 
+            if isinstance(response, ModelResponse)
+        ]
+        
+        if not valid_responses:
+            raise Exception("All flagship models failed to provide analysis")
+        
+        # Coordinate and synthesize flagship insights
+        coordinated_insight = self._synthesize_flagship_insights(valid_responses, request)
+        
+        # Calculate overall metrics
+        confidence_score = np.mean([r.confidence for r in valid_responses])
+        consensus_level = self._calculate_consensus_level(valid_responses)
+        total_parameters_utilized = sum(
+            self.model_capabilities[r.model].parameters * 1_000_000_000 
+            for r in valid_responses
+        )
+        
+        processing_time = time.time() - start_time
+        
+        # Calculate cost efficiency metrics
+        cost_efficiency = self._calculate_cost_efficiency(valid_responses, processing_time)
+        
+        # Identify competitive advantages
+        competitive_advantages = self._identify_competitive_advantages(valid_responses)
+        
+        # Record coordination efficiency
+        TRINITY_COORDINATION.observe(processing_time)
+        
+        result = TrinityAnalysis(
+            request_id=request_id,
+            analysis_type=request.analysis_type,
+            flagship_responses=valid_responses,
+            coordinated_insight=coordinated_insight,
+            confidence_score=confidence_score,
+            consensus_level=consensus_level,
+            total_parameters_utilized=total_parameters_utilized,
+            processing_time=processing_time,
+            cost_efficiency=cost_efficiency,
+            competitive_advantages=competitive_advantages,
+            metadata={
+                "models_used": [r.model.value for r in valid_responses],
+                "total_capability": f"{sum(self.model_capabilities[r.model].parameters for r in valid_responses)}B parameters",
+                "infrastructure": "Multi-Xnode Sovereign Architecture",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
+        
+        logger.info(f"✅ Ultimate AI Trinity analysis complete: {request_id}")
+        logger.info(f"🎯 Confidence: {confidence_score:.2f}, Consensus: {consensus_level:.2f}")
+        logger.info(f"⚡ Processing time: {processing_time:.2f}s")
+        logger.info(f"💰 Cost efficiency: $0 operational (${cost_efficiency['cloud_equivalent_cost']:.0f} saved)")
+        
+        return result
     
     def _synthesize_flagship_insights(self, responses: List[ModelResponse], request: TrinityRequest) -> str:
         """Synthesize insights from multiple flagship models into coordinated analysis"""
@@ -704,8 +1181,8 @@ Specializations: {', '.join(capability.specializations[:3])}
     
     async def cleanup(self):
         """Cleanup resources for graceful shutdown"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self._owns_http_client:
+            await self.http_client.close()
         
-        self._executor.shutdown(wait=True)
+        self.cpu_offload.shutdown(wait=True)
         logger.info("🧠 Ultimate AI Trinity Coordinator cleanup complete")
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""
+Polka-Trinity Upstream Policies
+Per-destination timeouts, retries and retry budgets for outbound calls.
+
+One 30s session timeout was too long for Polkassembly/Subscan metadata
+and too short for a 671B generation, which then failed after the work
+was done. Each destination (data source or Trinity model) gets its own
+connect/read/total timeouts and retry count. Retries wait with full
+jitter exponential backoff, and a per-destination retry budget (a token
+bucket refilled by a fraction of each request) stops retries from
+multiplying load on an upstream that is already failing.
+"""
+
+import asyncio
+import json
+import logging
+import random
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+import aiohttp
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+# Upstream call metrics
+UPSTREAM_ATTEMPTS = Counter('trinity_upstream_attempts_total', 'Upstream call attempts by outcome', ['destination', 'outcome'])
+
+T = TypeVar("T")
+
+DEFAULT_DESTINATION = "default"
+
+
+class UpstreamStatusError(Exception):
+    """Non-success HTTP status from an upstream"""
+
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(message or f"HTTP {status}")
+        self.status = status
+
+
+@dataclass(frozen=True)
+class UpstreamPolicy:
+    """Timeouts and retry behaviour for one destination"""
+    connect_timeout: float
+    read_timeout: float
+    total_timeout: float
+    retries: int = 0
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    retry_budget_ratio: float = 0.2  # Retries earned per request
+    retry_on_timeout: bool = True
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout, sock_connect=self.connect_timeout, sock_read=self.read_timeout
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry ``attempt`` (0-based)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, UpstreamStatusError):
+            return error.status in self.retry_statuses
+        if isinstance(error, asyncio.TimeoutError):  # Includes aiohttp.ServerTimeoutError
+            return self.retry_on_timeout
+        return isinstance(error, aiohttp.ClientConnectionError)
+
+
+# Metadata APIs answer in well under a second; generations are only
+# retried on connection failures, never after a timeout has burned the work
+DEFAULT_POLICIES: Dict[str, UpstreamPolicy] = {
+    "polkassembly": UpstreamPolicy(connect_timeout=3, read_timeout=5, total_timeout=8, retries=2),
+    "subscan": UpstreamPolicy(connect_timeout=3, read_timeout=5, total_timeout=8, retries=2),
+    "subsquare": UpstreamPolicy(connect_timeout=3, read_timeout=5, total_timeout=8, retries=2),
+    "deepseek-r1:671b": UpstreamPolicy(
+        connect_timeout=10, read_timeout=600, total_timeout=900, retries=1,
+        backoff_base=1.0, retry_budget_ratio=0.1, retry_on_timeout=False
+    ),
+    "llama4:maverick": UpstreamPolicy(
+        connect_timeout=10, read_timeout=300, total_timeout=600, retries=1,
+        backoff_base=1.0, retry_budget_ratio=0.1, retry_on_timeout=False
+    ),
+    "qwen3:235b": UpstreamPolicy(
+        connect_timeout=10, read_timeout=240, total_timeout=480, retries=1,
+        backoff_base=1.0, retry_budget_ratio=0.1, retry_on_timeout=False
+    ),
+    DEFAULT_DESTINATION: UpstreamPolicy(
+        connect_timeout=10, read_timeout=120, total_timeout=300, retries=1, retry_on_timeout=False
+    )
+}
+
+
+@dataclass
+class RetryBudget:
+    """Token bucket allowing retries in proportion to request volume"""
+    ratio: float
+    min_tokens: float = 10.0
+    max_tokens: float = 100.0
+    tokens: float = field(default=-1.0)
+
+    def __post_init__(self):
+        if self.tokens < 0:
+            self.tokens = self.min_tokens
+
+    def record_request(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class UpstreamPolicies:
+    """Policy table and retry engine keyed by destination"""
+
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, Any]]] = None):
+        self._policies = dict(DEFAULT_POLICIES)
+        for destination, settings in (overrides or {}).items():
+            base = self._policies.get(destination, self._policies[DEFAULT_DESTINATION])
+            if "retry_statuses" in settings:
+                settings = {**settings, "retry_statuses": tuple(settings["retry_statuses"])}
+            self._policies[destination] = replace(base, **settings)
+        self._budgets: Dict[str, RetryBudget] = {}
+        self.retries: Dict[str, int] = {}
+        self.budget_exhausted: Dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls, policies_json: Optional[str]) -> "UpstreamPolicies":
+        """
+        Build from a JSON mapping of destination to policy overrides.
+
+        Example: {"deepseek-r1:671b": {"total_timeout": 1200}, "subscan": {"retries": 0}}
+        """
+        return cls(json.loads(policies_json) if policies_json else None)
+
+    def policy(self, destination: str) -> UpstreamPolicy:
+        return self._policies.get(destination, self._policies[DEFAULT_DESTINATION])
+
+    def _budget(self, destination: str) -> RetryBudget:
+        if destination not in self._budgets:
+            self._budgets[destination] = RetryBudget(self.policy(destination).retry_budget_ratio)
+        return self._budgets[destination]
+
+    def record_request(self, destination: str) -> None:
+        """Count a first attempt towards the destination's retry budget"""
+        self._budget(destination).record_request()
+
+    def should_retry(self, destination: str, error: BaseException, attempt: int) -> bool:
+        """Whether failed attempt ``attempt`` (0-based) may be retried; spends budget if so"""
+        policy = self.policy(destination)
+        if attempt >= policy.retries or not policy.is_retryable(error):
+            UPSTREAM_ATTEMPTS.labels(destination=destination, outcome="failure").inc()
+            return False
+        if not self._budget(destination).try_spend():
+            self.budget_exhausted[destination] = self.budget_exhausted.get(destination, 0) + 1
+            UPSTREAM_ATTEMPTS.labels(destination=destination, outcome="budget_exhausted").inc()
+            logger.warning(f"⚠️ Retry budget exhausted for {destination}: {str(error)}")
+            return False
+        self.retries[destination] = self.retries.get(destination, 0) + 1
+        UPSTREAM_ATTEMPTS.labels(destination=destination, outcome="retry").inc()
+        return True
+
+    async def backoff(self, destination: str, attempt: int) -> None:
+        await asyncio.sleep(self.policy(destination).backoff(attempt))
+
+    async def call(self,
+                   destination: str,
+                   attempt_fn: Callable[[aiohttp.ClientTimeout], Awaitable[T]]) -> T:
+        """
+        Run ``attempt_fn`` under the destination's policy.
+
+        ``attempt_fn`` receives the per-request timeout and should raise
+        UpstreamStatusError for non-success responses so retryable statuses
+        are retried; the last error is re-raised once retries are spent.
+        """
+        policy = self.policy(destination)
+        self.record_request(destination)
+        attempt = 0
+        while True:
+            try:
+                result = await attempt_fn(policy.client_timeout())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not self.should_retry(destination, e, attempt):
+                    raise
+                logger.info(f"🔁 Retrying {destination} after {type(e).__name__} (attempt {attempt + 1})")
+                await self.backoff(destination, attempt)
+                attempt += 1
+                continue
+            UPSTREAM_ATTEMPTS.labels(destination=destination, outcome="success").inc()
+            return result
+
+    async def stream(self,
+                     destination: str,
+                     attempt_fn: Callable[[aiohttp.ClientTimeout], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """
+        Iterate ``attempt_fn``'s stream under the destination's policy.
+        
+        Failures are retried like ``call`` only until the first item has
+        reached the caller; after that a retry would replay output, so the
+        error is re-raised.
+        """
+        policy = self.policy(destination)
+        self.record_request(destination)
+        attempt = 0
+        while True:
+            started = False
+            try:
+                async for item in attempt_fn(policy.client_timeout()):
+                    started = True
+                    yield item
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if started:
+                    UPSTREAM_ATTEMPTS.labels(destination=destination, outcome="failure").inc()
+                    raise
+                if not self.should_retry(destination, e, attempt):
+                    raise
+                logger.info(f"🔁 Retrying {destination} stream after {type(e).__name__} (attempt {attempt + 1})")
+                await self.backoff(destination, attempt)
+                attempt += 1
+                continue
+            UPSTREAM_ATTEMPTS.labels(destination=destination, outcome="success").inc()
+            return
+
+    def stats(self) -> Dict[str, Any]:
+        """Policies, retry counts and budget levels for monitoring"""
+        return {
+            destination: {
+                **{key: value for key, value in asdict(policy).items() if key != "retry_statuses"},
+                "retries": self.retries.get(destination, 0),
+                "budget_exhausted": self.budget_exhausted.get(destination, 0),
+                "retry_budget_tokens": round(self._budgets[destination].tokens, 2) if destination in self._budgets else None
+            }
+            for destination, policy in self._policies.items()
+        }
+
+
+__all__ = [
+    "UpstreamPolicy",
+    "UpstreamPolicies",
+    "UpstreamStatusError",
+    "RetryBudget"
+]
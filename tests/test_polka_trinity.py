@@ -19,6 +19,7 @@ import pytest
 import asyncio
 import aiohttp
 import json
+import time
 from datetime import datetime, timezone
 from typing import Dict, List, Any
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -29,12 +30,38 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.backend.polkadot_gateway import (
     PolkadotGateway,
+    ReferendumCache,
     GovernanceProposal, 
     TrinityAnalysis,
     AnalysisComplexity,
     TrinityModel
 )
-from src.backend.polka_trinity_api import app
+from src.backend.analysis_jobs import AnalysisJob, AnalysisJobQueue, InMemoryJobBackend, JobStatus, RedisJobBackend
+from src.backend.analysis_store import AnalysisResultStore, serialize_analysis, deserialize_analysis
+from src.backend.chunked_analysis import split_into_chunks
+from src.backend.circuit_breaker import CircuitBreakers, CircuitOpenError, is_upstream_failure
+from src.backend.cpu_offload import CPUOffloader
+from src.backend.http_client import HTTPClientManager
+from src.backend.keyword_matcher import KeywordMatcher
+from src.backend.adaptive_concurrency import AIMDConcurrencyLimiter
+from src.backend.model_endpoints import ModelEndpointPool, is_endpoint_failure
+from src.backend.model_warmup import ModelWarmupManager
+from src.backend.model_schemas import DeepSeekAnalysis, parse_structured_response
+from src.backend.priority_scheduler import PriorityAdmissionScheduler
+from src.backend.prompt_builder import estimate_tokens, trim_to_sentences
+from src.backend.prompt_templates import render_proposal_block
+from src.backend.response_cache import ModelResponseCache
+from src.backend.response_scanner import ResponseScanner
+from src.backend.upstream_policy import UpstreamPolicies, UpstreamStatusError
+from src.backend.ollama_protocol import GenerationStats
+from src.backend.ultimate_trinity_coordinator import (
+    UltimateAITrinityCoordinator,
+    TrinityRequest,
+    TrinityAnalysisType,
+    AnalysisComplexity as CoordinatorComplexity,
+    TrinityModel as CoordinatorTrinityModel
+)
+from src.backend.polka_trinity_api import app, _process_analysis_job
 
 import pytest_asyncio
 from httpx import AsyncClient
@@ -324,6 +351,83 @@ class TestPolkadotGateway:
         assert proposal.nay_votes == 3280
         assert proposal.support_percentage > 80.0
     
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.get')
+    @patch('aiohttp.ClientSession.post')
+    async def test_referendum_cache_serves_repeat_reads(self, mock_post, mock_get, gateway):
+        """Test repeated referendum reads are served from the proposal cache"""
+        mock_get.return_value.__aenter__.return_value.status = 200
+        mock_get.return_value.__aenter__.return_value.json.return_value = MockResponses.polkassembly_response()
+
+        mock_post.return_value.__aenter__.return_value.status = 200
+        mock_post.return_value.__aenter__.return_value.json.return_value = MockResponses.subscan_response()
+
+        first = await gateway.fetch_referendum_data(TEST_REFERENDUM_ID)
+        second = await gateway.fetch_referendum_data(TEST_REFERENDUM_ID)
+
+        assert second is first
+        assert mock_post.call_count == 1
+        assert mock_get.call_count == 2  # Polkassembly + Subsquare, first read only
+        assert gateway.referendum_cache.stats()["hits"] == 1
+
+        # Bypassing the cache always refetches
+        await gateway.fetch_referendum_data(TEST_REFERENDUM_ID, use_cache=False)
+        assert mock_post.call_count == 2
+
+    def test_referendum_cache_status_ttl_and_eviction(self):
+        """Test status-aware TTL and LRU eviction of cached proposals"""
+        cache = ReferendumCache(max_entries=2, ongoing_ttl_seconds=0.0)
+
+        ongoing = TestData.sample_proposal()
+        cache.put(ongoing)
+        assert cache.get(TEST_REFERENDUM_ID) is None  # Ongoing entry already expired
+
+        executed = TestData.sample_proposal()
+        executed.status = "Executed"
+        cache.put(executed)
+        assert cache.get(TEST_REFERENDUM_ID) is executed  # Finalized entries never expire
+
+        for referendum_id in (1, 2):
+            rejected = TestData.sample_proposal()
+            rejected.referendum_id = referendum_id
+            rejected.status = "notPassed"
+            cache.put(rejected)
+
+        assert cache.get(TEST_REFERENDUM_ID) is None  # Least recently used entry evicted
+        assert cache.get(1) is not None and cache.get(2) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_analysis_store_round_trip(self):
+        """Test stored analyses round-trip and are keyed by prompt content"""
+        analysis = TestData.sample_trinity_analysis()
+        stored = json.loads(json.dumps(serialize_analysis(analysis), default=str))
+        restored = deserialize_analysis(stored)
+
+        assert restored == analysis
+
+        # Votes feed the prompts, so a tally change invalidates the stored result
+        proposal = TestData.sample_proposal()
+        content_hash = proposal.content_hash()
+        assert TestData.sample_proposal().content_hash() == content_hash
+        proposal.aye_votes += 1
+        assert proposal.content_hash() != content_hash
+
+    @pytest.mark.asyncio
+    async def test_analysis_store_unreadable_rows_miss(self):
+        """Test lookup failures and rows from an older schema fall back to a fresh analysis"""
+        conn = MagicMock()
+        db_pool = MagicMock()
+        db_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        db_pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+        store = AnalysisResultStore(db_pool)
+
+        conn.fetchrow = AsyncMock(return_value={"analysis": json.dumps({"referendum_id": 123})})
+        assert await store.get(123, "hash") is None
+
+        conn.fetchrow = AsyncMock(side_effect=ConnectionError("database unavailable"))
+        assert await store.get(123, "hash") is None
+        assert (store.hits, store.misses) == (0, 2)
+
     @pytest.mark.asyncio
     async def test_complexity_assessment(self, gateway):
         """Test proposal complexity assessment logic"""
@@ -372,6 +476,453 @@ class TestPolkadotGateway:
         assert "overall_risk" in analysis.risk_assessment
         assert "ai_consensus" in analysis.sentiment_matrix
     
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.post')
+    async def test_model_response_cache(self, mock_post, gateway):
+        """Test identical low-temperature generations reach the model once"""
+        mock_post.return_value.__aenter__.return_value.status = 200
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(return_value={"response": "APPROVE"})
+
+        first, first_stats = await gateway._call_flagship_model(TrinityModel.DEEPSEEK_R1, "Analyze   referendum\n 1234")
+        second, second_stats = await gateway._call_flagship_model(TrinityModel.DEEPSEEK_R1, "Analyze referendum 1234")
+        assert first == second == "APPROVE"
+        assert first_stats is not None and second_stats is None
+        assert mock_post.call_count == 1
+        assert gateway.response_cache.stats()["memory_hits"] == 1
+
+        # Other models and options never share entries
+        await gateway._call_flagship_model(TrinityModel.QWEN3, "Analyze referendum 1234")
+        assert mock_post.call_count == 2
+
+        cache = ModelResponseCache(max_entries=1)
+        creative = {"temperature": 0.8, "top_p": 0.9}
+        await cache.put("qwen3:235b", "prompt", creative, "varies")
+        assert await cache.get("qwen3:235b", "prompt", creative) is None
+        precise = {"temperature": 0.1, "num_predict": 2048}
+        await cache.put("qwen3:235b", "prompt", precise, "stable")
+        assert await cache.get("qwen3:235b", "prompt", {**precise, "num_predict": 512}) is None
+        await cache.put("qwen3:235b", "other prompt", precise, "evicts")
+        assert await cache.get("qwen3:235b", "prompt", precise) is None
+        assert await cache.get("qwen3:235b", "other prompt", precise) == "evicts"
+
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.post')
+    async def test_generation_stats_accounting(self, mock_post, gateway):
+        """Test Ollama token counts and timings are carried onto analyses"""
+        mock_post.return_value.__aenter__.return_value.status = 200
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(return_value={
+            "response": "RECOMMENDATION: APPROVE\nCONFIDENCE: 90%",
+            "prompt_eval_count": 412,
+            "prompt_eval_duration": 800_000_000,
+            "eval_count": 120,
+            "eval_duration": 4_000_000_000,
+            "load_duration": 50_000_000,
+            "total_duration": 4_900_000_000
+        })
+
+        proposal = TestData.sample_proposal()
+        analysis = await gateway.analyze_with_ultimate_trinity(proposal)
+
+        stats = analysis.generation_stats[TrinityModel.DEEPSEEK_R1.value]
+        assert stats["eval_count"] == 120
+        assert stats["prompt_eval_count"] == 412
+        assert stats["tokens_per_second"] == 30.0
+        assert set(analysis.generation_stats) == {model.value for model in analysis.models_used}
+
+        coordinator = UltimateAITrinityCoordinator()
+        request = TrinityRequest(
+            content="Assess treasury spend",
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.MODERATE
+        )
+        ewma = dict(coordinator._latency_ewma)
+        start = time.time()
+        response = coordinator._build_model_response(
+            CoordinatorTrinityModel.QWEN3, request, "A short answer", start,
+            GenerationStats.from_response({"eval_count": 57, "eval_duration": 3_000_000_000})
+        )
+        assert response.token_count == 57
+        assert response.generation_stats["tokens_per_second"] == 19.0
+        assert coordinator._build_model_response(
+            CoordinatorTrinityModel.QWEN3, request, "A short answer", start
+        ).token_count == 3
+
+        # Offloaded scoring leaves the latency estimate to the event loop
+        assert coordinator._latency_ewma == ewma
+        response = await coordinator._complete_model_response(
+            CoordinatorTrinityModel.QWEN3, request, "A short answer", start - 10.0
+        )
+        assert coordinator._latency_ewma[CoordinatorTrinityModel.QWEN3] == pytest.approx(
+            0.8 * ewma[CoordinatorTrinityModel.QWEN3] + 0.2 * response.processing_time
+        )
+
+    def test_prompts_share_proposal_prefix(self, gateway):
+        """Test all gateway prompts start with the same proposal block"""
+        proposal = TestData.sample_proposal()
+        complexity = AnalysisComplexity.FLAGSHIP
+        prompts = [
+            gateway._build_deepseek_prompt(proposal, complexity),
+            gateway._build_llama_prompt(proposal, complexity),
+            gateway._build_qwen_prompt(proposal, complexity)
+        ]
+        prefix = render_proposal_block(proposal)
+        assert all(prompt.startswith(prefix) for prompt in prompts)
+        assert "You are DeepSeek-R1" in prompts[0][len(prefix):]
+
+        # A moving vote tally leaves the description inside the reusable prefix
+        proposal.aye_votes += 100
+        updated = gateway._build_deepseek_prompt(proposal, complexity)
+        common = len(os.path.commonprefix([prompts[0], updated]))
+        assert prompts[0].index(proposal.description[:200]) < common
+        assert gateway._build_deepseek_prompt(proposal, complexity) == updated
+
+    def test_structured_output_parsing(self, gateway):
+        """Test schema-constrained responses parse into typed results with text fallback"""
+        payload = gateway._build_generate_payload(TrinityModel.DEEPSEEK_R1, "prompt")
+        assert payload["format"] == DeepSeekAnalysis.SCHEMA
+        assert "format" not in gateway._build_generate_payload(TrinityModel.QWEN3, "prompt", structured=False)
+        assert gateway._cache_options(payload)["format"] == DeepSeekAnalysis.SCHEMA
+
+        structured = json.dumps({
+            "mathematical_soundness": 12,
+            "economic_viability": 82.5,
+            "risk_score": 3,
+            "implementation_complexity": 6,
+            "recommendation": "approve with caution",
+            "chain_of_thought": "Budget matches milestones."
+        })
+        parsed = gateway._parse_deepseek_response(structured)
+        assert parsed["mathematical_soundness"] == 10.0  # Clamped to schema range
+        assert parsed["recommendation"] == "APPROVE_WITH_CAUTION"
+        assert parsed["model"] == "DeepSeek-R1:671b"
+
+        # Non-conforming output still goes through the text extractors
+        assert parse_structured_response('{"recommendation": "MAYBE"}', DeepSeekAnalysis) is None
+        parsed = gateway._parse_deepseek_response("I recommend APPROVE with mathematical soundness 8.5/10")
+        assert parsed["mathematical_soundness"] == 8.5
+        assert parsed["chain_of_thought"].startswith("I recommend")
+
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.get')
+    async def test_upstream_policies(self, mock_get, gateway):
+        """Test per-destination timeouts, jittered retries and retry budgets"""
+        policies = UpstreamPolicies.from_config(
+            '{"subscan": {"backoff_base": 0.001}, "deepseek-r1:671b": {"backoff_base": 0.001}}'
+        )
+        assert policies.policy("polkassembly").client_timeout().total < 10
+        assert policies.policy(TrinityModel.DEEPSEEK_R1.value).client_timeout().total >= 600
+        assert policies.policy("unknown-model").retries == 1
+
+        # Retryable statuses are retried until the call succeeds
+        attempts = []
+        async def flaky(timeout):
+            attempts.append(timeout)
+            if len(attempts) < 3:
+                raise UpstreamStatusError(503)
+            return {"ok": True}
+        assert await policies.call("subscan", flaky) == {"ok": True}
+        assert len(attempts) == 3 and attempts[0].total == policies.policy("subscan").total_timeout
+
+        # A timed-out generation is not retried; a refused connection is
+        async def timed_out(timeout):
+            attempts.append(timeout)
+            raise asyncio.TimeoutError()
+        attempts.clear()
+        with pytest.raises(asyncio.TimeoutError):
+            await policies.call(TrinityModel.DEEPSEEK_R1.value, timed_out)
+        assert len(attempts) == 1
+        async def refused(timeout):
+            attempts.append(timeout)
+            raise aiohttp.ClientConnectionError("refused")
+        attempts.clear()
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await policies.call(TrinityModel.DEEPSEEK_R1.value, refused)
+        assert len(attempts) == 2
+
+        # An empty retry budget stops retries
+        policies._budget("subscan").tokens = 0
+        attempts.clear()
+        with pytest.raises(UpstreamStatusError):
+            await policies.call("subscan", flaky)
+        assert len(attempts) == 1
+        assert policies.stats()["subscan"]["budget_exhausted"] == 1
+
+        # Data source fetches carry their destination's timeout
+        mock_get.return_value.__aenter__.return_value.status = 200
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={"title": "Test"})
+        assert await gateway._fetch_polkassembly_data(TEST_REFERENDUM_ID) == {"title": "Test"}
+        assert mock_get.call_args.kwargs["timeout"].total == gateway.upstream_policies.policy("polkassembly").total_timeout
+
+    @pytest.mark.asyncio
+    async def test_hedged_referendum_fetch(self, gateway):
+        """Test hedged fetch synthesizes without waiting for the slower metadata indexer"""
+        subscan = {"data": {"proposer": "1Proposer", "status": "Ongoing", "aye": 300, "nay": 100}}
+        slow_cancelled = asyncio.Event()
+
+        async def fast_polkassembly(referendum_id):
+            return {"title": "Treasury Proposal", "content": "Fund the runtime audit"}
+
+        async def slow_subsquare(referendum_id):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+            return {}
+
+        async def fast_subscan(referendum_id):
+            await asyncio.sleep(0.01)
+            return subscan
+
+        gateway.hedged_fetch = True
+        with patch.object(gateway, '_fetch_polkassembly_data', side_effect=fast_polkassembly), \
+             patch.object(gateway, '_fetch_subscan_data', side_effect=fast_subscan), \
+             patch.object(gateway, '_fetch_governance_data', side_effect=slow_subsquare):
+            start = time.time()
+            proposal = await gateway.fetch_referendum_data(TEST_REFERENDUM_ID, use_cache=False)
+            elapsed = time.time() - start
+
+        assert elapsed < 1.0
+        assert slow_cancelled.is_set()
+        assert proposal.title == "Treasury Proposal"
+        assert proposal.proposer == "1Proposer"
+        assert gateway.hedge_stats()["laggards_cancelled"]["subsquare"] == 1
+
+        # Metadata without a description is not enough; the other source is awaited
+        async def title_only(referendum_id):
+            return {"title": "Title only"}
+
+        async def full_subsquare(referendum_id):
+            await asyncio.sleep(0.05)
+            return {"title": "Subsquare title", "description": "Subsquare description"}
+
+        with patch.object(gateway, '_fetch_polkassembly_data', side_effect=title_only), \
+             patch.object(gateway, '_fetch_subscan_data', side_effect=fast_subscan), \
+             patch.object(gateway, '_fetch_governance_data', side_effect=full_subsquare):
+            proposal = await gateway.fetch_referendum_data(TEST_REFERENDUM_ID, use_cache=False)
+
+        assert proposal.title == "Title only"
+        assert proposal.description == "Subsquare description"
+        assert gateway.hedge_stats()["hedged_fetches"] == 1
+
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.get')
+    async def test_circuit_breakers(self, mock_get, gateway):
+        """Test open circuits short-circuit data sources and model endpoints"""
+        gateway.circuit_breakers = CircuitBreakers(min_requests=2, failure_rate_threshold=0.5, open_seconds=0.05)
+        gateway.upstream_policies = UpstreamPolicies({"polkassembly": {"retries": 0}})
+        assert not is_upstream_failure(UpstreamStatusError(404))
+
+        # Failing Polkassembly calls open its circuit; further fetches skip the network
+        mock_get.return_value.__aenter__.return_value.status = 503
+        for _ in range(2):
+            assert await gateway._fetch_polkassembly_data(TEST_REFERENDUM_ID) == {}
+        assert mock_get.call_count == 2
+        assert await gateway._fetch_polkassembly_data(TEST_REFERENDUM_ID) == {}
+        assert mock_get.call_count == 2
+        assert gateway.data_source_status() == {
+            "polkassembly_api": "Degraded", "subscan_api": "Operational", "governance_api": "Operational"
+        }
+        assert gateway.circuit_breakers.stats()["polkassembly"]["short_circuited"] == 1
+
+        # After the cool-down a successful probe closes the circuit
+        await asyncio.sleep(0.06)
+        assert gateway.data_source_status()["polkassembly_api"] == "Recovering"
+        mock_get.return_value.__aenter__.return_value.status = 200
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={"title": "Test"})
+        assert await gateway._fetch_polkassembly_data(TEST_REFERENDUM_ID) == {"title": "Test"}
+        assert gateway.data_source_status()["polkassembly_api"] == "Operational"
+
+        # Model endpoint circuits refuse leases while open
+        pool = ModelEndpointPool(
+            {}, default_endpoints=[TEST_TRINITY_ENDPOINT],
+            circuit_breakers=CircuitBreakers(min_requests=1, open_seconds=60.0)
+        )
+        with pytest.raises(ConnectionError):
+            async with pool.lease("deepseek-r1:671b"):
+                raise ConnectionError("refused")
+        with pytest.raises(CircuitOpenError):
+            async with pool.lease("deepseek-r1:671b"):
+                pass
+        assert pool.stats()["deepseek-r1:671b"][0]["circuit"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_long_description_map_reduce(self, gateway):
+        """Test long descriptions are summarized chunk by chunk instead of truncated"""
+        paragraphs = [f"Milestone {i} delivers audited runtime module {i} for 1,000 DOT. " * 12 for i in range(40)]
+        proposal = TestData.sample_proposal()
+        proposal.description = "\n\n".join(paragraphs)
+
+        summarized = []
+        async def fake_summarize(prompt: str) -> str:
+            summarized.append(prompt)
+            chunk = prompt.split("summary only.\n\n", 1)[1]
+            return f"Summary of {chunk[:20]}"
+        gateway._summarize_with_flagship_model = fake_summarize
+
+        prompt_proposal = await gateway._prepare_prompt_proposal(proposal)
+        chunk_count = len(summarized)
+        assert chunk_count > 1
+        assert prompt_proposal.description.startswith("Summary of Milestone 0")
+        assert prompt_proposal.description.count("Summary of") == chunk_count  # Every chunk represented
+        assert proposal.description == "\n\n".join(paragraphs)  # Original untouched
+
+        # Chunk summaries are cached by content hash
+        await gateway._prepare_prompt_proposal(proposal)
+        assert len(summarized) == chunk_count
+        assert gateway.description_summarizer.stats()["cache_hits"] == chunk_count
+
+        # Short descriptions are passed through without model calls
+        short = TestData.sample_proposal()
+        assert await gateway._prepare_prompt_proposal(short) is short
+
+        chunks = split_into_chunks("\n\n".join(paragraphs), chunk_tokens=512)
+        assert all(estimate_tokens(chunk) <= 512 for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_complexity_model_routing(self, gateway):
+        """Test proposal complexity decides which flagship models are called"""
+        gateway._analyze_with_deepseek = AsyncMock(return_value={"recommendation": "APPROVE", "mathematical_soundness": 8.0})
+        gateway._analyze_with_llama = AsyncMock(return_value={"strategic_recommendation": "APPROVE", "ecosystem_health": 8.0})
+        gateway._analyze_with_qwen = AsyncMock(return_value={"global_sentiment": "POSITIVE", "regulatory_compliance": 8.0})
+
+        # Small tip: a single model
+        tip = TestData.sample_proposal()
+        tip.amount = 50.0
+        tip.aye_votes, tip.nay_votes = 12, 3
+        analysis = await gateway.analyze_with_ultimate_trinity(tip)
+        assert analysis.complexity_level == AnalysisComplexity.SIMPLE
+        assert analysis.models_used == [TrinityModel.DEEPSEEK_R1]
+        gateway._analyze_with_llama.assert_not_awaited()
+        gateway._analyze_with_qwen.assert_not_awaited()
+        assert analysis.trinity_recommendation == "APPROVE"
+
+        # Complexity override routes to two models
+        analysis = await gateway.analyze_with_ultimate_trinity(tip, complexity_override=AnalysisComplexity.MODERATE)
+        assert analysis.models_used == [TrinityModel.DEEPSEEK_R1, TrinityModel.LLAMA4_MAVERICK]
+        gateway._analyze_with_qwen.assert_not_awaited()
+
+        # Explicit model override wins over complexity
+        analysis = await gateway.analyze_with_ultimate_trinity(tip, models_override=[TrinityModel.QWEN3, TrinityModel.QWEN3])
+        assert analysis.models_used == [TrinityModel.QWEN3]
+        gateway._analyze_with_qwen.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_analyses_are_coalesced(self, gateway):
+        """Test concurrent identical analyses share one flagship model run"""
+        release = asyncio.Event()
+
+        async def slow_deepseek(proposal, complexity):
+            await release.wait()
+            return {"recommendation": "APPROVE", "mathematical_soundness": 9.0}
+
+        gateway._analyze_with_deepseek = AsyncMock(side_effect=slow_deepseek)
+        gateway._analyze_with_llama = AsyncMock(return_value={"strategic_recommendation": "APPROVE"})
+        gateway._analyze_with_qwen = AsyncMock(return_value={"global_sentiment": "POSITIVE"})
+
+        proposal = TestData.sample_proposal()
+        callers = [asyncio.create_task(gateway.analyze_with_ultimate_trinity(proposal)) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        # A disconnecting caller must not cancel the shared run
+        callers[0].cancel()
+        release.set()
+        results = await asyncio.gather(*callers[1:])
+
+        assert gateway._analyze_with_deepseek.await_count == 1
+        assert all(result is results[0] for result in results)
+        assert gateway.analysis_flights.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+        # Finished runs are not reused: the next call analyzes again
+        await gateway.analyze_with_ultimate_trinity(proposal)
+        assert gateway._analyze_with_deepseek.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_quorum_synthesis_with_straggler_policies(self, gateway):
+        """Test synthesis runs at quorum and stragglers are cancelled or enriched"""
+        qwen_released = asyncio.Event()
+
+        async def slow_qwen(proposal, complexity):
+            await qwen_released.wait()
+            return {"global_sentiment": "POSITIVE", "regulatory_compliance": 9.0}
+
+        gateway._analyze_with_deepseek = AsyncMock(return_value={"recommendation": "APPROVE", "mathematical_soundness": 9.0})
+        gateway._analyze_with_llama = AsyncMock(return_value={"strategic_recommendation": "APPROVE", "ecosystem_health": 9.0})
+        gateway._analyze_with_qwen = slow_qwen
+        gateway.quorum_size = 2
+
+        # Cancel policy: synthesis does not wait for Qwen3
+        analysis = await asyncio.wait_for(gateway.analyze_with_ultimate_trinity(TestData.sample_proposal()), 1.0)
+        assert analysis.models_used == [TrinityModel.DEEPSEEK_R1, TrinityModel.LLAMA4_MAVERICK]
+        assert analysis.qwen_global == {}
+        assert not gateway._enrichment_tasks
+
+        # Enrich policy: the late model re-synthesizes in the background
+        gateway.straggler_policy = "enrich"
+        enriched = asyncio.get_running_loop().create_future()
+        analysis = await asyncio.wait_for(
+            gateway.analyze_with_ultimate_trinity(TestData.sample_proposal(), on_enriched=AsyncMock(side_effect=enriched.set_result)),
+            1.0
+        )
+        assert len(analysis.models_used) == 2
+        qwen_released.set()
+        enriched_analysis = await asyncio.wait_for(enriched, 1.0)
+        assert len(enriched_analysis.models_used) == 3
+        assert enriched_analysis.qwen_global["global_sentiment"] == "POSITIVE"
+
+        # Deadline: synthesis proceeds with whatever answered in time
+        qwen_released.clear()
+        gateway.quorum_size = 3
+        gateway.straggler_policy = "cancel"
+        gateway.model_deadline_seconds = 0.05
+        analysis = await asyncio.wait_for(gateway.analyze_with_ultimate_trinity(TestData.sample_proposal()), 1.0)
+        assert len(analysis.models_used) == 2
+
+        # The deadline only starts at the first answer: slow models are still awaited
+        async def slow_answer(proposal, complexity):
+            await asyncio.sleep(0.1)
+            return {"recommendation": "APPROVE", "mathematical_soundness": 9.0}
+
+        async def no_answer(proposal, complexity):
+            await asyncio.sleep(5)
+
+        gateway._analyze_with_deepseek = slow_answer
+        gateway._analyze_with_llama = no_answer
+        gateway.model_deadline_seconds = 0.02
+        analysis = await asyncio.wait_for(gateway.analyze_with_ultimate_trinity(TestData.sample_proposal()), 1.0)
+        assert analysis.models_used == [TrinityModel.DEEPSEEK_R1]
+        assert analysis.trinity_recommendation == "APPROVE"
+
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.post')
+    async def test_streaming_trinity_analysis(self, mock_post, gateway):
+        """Test streamed model tokens are forwarded before the synthesis"""
+        class NDJSONContent:
+            def __aiter__(self):
+                lines = [
+                    json.dumps({"response": "Recommend APPROVE ", "done": False}),
+                    json.dumps({"response": "with 92% confidence", "done": False}),
+                    json.dumps({"response": "", "done": True, "eval_count": 6})
+                ]
+                return self._iterate(lines)
+
+            async def _iterate(self, lines):
+                for line in lines:
+                    yield (line + "\n").encode()
+
+        mock_post.return_value.__aenter__.return_value.status = 200
+        mock_post.return_value.__aenter__.return_value.content = NDJSONContent()
+
+        events = [event async for event in gateway.stream_ultimate_trinity(TestData.sample_proposal())]
+
+        tokens = [e for e in events if e["event"] == "token"]
+        assert len(tokens) == 6  # Two non-empty chunks per flagship model
+        assert {e["model"] for e in tokens} == {m.value for m in TrinityModel}
+        assert sum(e["event"] == "model_complete" for e in events) == 3
+        assert events[-1]["event"] == "synthesis"
+        assert events[-1]["analysis"].referendum_id == TEST_REFERENDUM_ID
+        assert mock_post.call_args.kwargs["json"]["stream"] is True
+
     @pytest.mark.asyncio
     async def test_response_parsing_robustness(self, gateway):
         """Test response parsing with various input formats"""
@@ -461,6 +1012,199 @@ class TestPoltaTrinityAPI:
             assert "100%" in data["sovereignty_score"]
             assert "Infinite ROI" in data["infrastructure_efficiency"]
     
+    @pytest.mark.asyncio
+    async def test_governance_analysis_served_from_store(self, client):
+        """Test stored analyses are reused unless a refresh is forced"""
+        stored_analysis = TestData.sample_trinity_analysis()
+        with patch('src.backend.polka_trinity_api.gateway_instance') as mock_gateway, \
+             patch('src.backend.polka_trinity_api.analysis_store') as mock_store:
+            mock_gateway.fetch_referendum_data = AsyncMock(return_value=TestData.sample_proposal())
+            mock_gateway.analyze_with_ultimate_trinity = AsyncMock(return_value=TestData.sample_trinity_analysis())
+            mock_store.get = AsyncMock(return_value=stored_analysis)
+            mock_store.save = AsyncMock()
+
+            request_data = {"referendum_id": TEST_REFERENDUM_ID}
+            response = await client.post(f"/analyze/referendum/{TEST_REFERENDUM_ID}", json=request_data)
+            assert response.status_code == 200
+            assert response.json()["served_from_store"] is True
+            mock_store.get.assert_awaited_once_with(TEST_REFERENDUM_ID, TestData.sample_proposal().content_hash())
+            mock_gateway.analyze_with_ultimate_trinity.assert_not_awaited()
+
+            # force_refresh recomputes and overwrites the stored result
+            request_data["force_refresh"] = True
+            response = await client.post(f"/analyze/referendum/{TEST_REFERENDUM_ID}", json=request_data)
+            assert response.status_code == 200
+            assert response.json()["served_from_store"] is False
+            mock_gateway.analyze_with_ultimate_trinity.assert_awaited_once()
+            mock_store.save.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_not_stored(self, client):
+        """Test analyses where no model answered are returned but never stored"""
+        failed_analysis = TestData.sample_trinity_analysis()
+        failed_analysis.trinity_recommendation = "ANALYSIS_ERROR"
+        failed_analysis.models_used = []
+        with patch('src.backend.polka_trinity_api.gateway_instance') as mock_gateway, \
+             patch('src.backend.polka_trinity_api.analysis_store') as mock_store:
+            mock_gateway.fetch_referendum_data = AsyncMock(return_value=TestData.sample_proposal())
+            mock_gateway.analyze_with_ultimate_trinity = AsyncMock(return_value=failed_analysis)
+            mock_store.get = AsyncMock(return_value=None)
+            mock_store.save = AsyncMock()
+
+            request_data = {"referendum_id": TEST_REFERENDUM_ID}
+            response = await client.post(f"/analyze/referendum/{TEST_REFERENDUM_ID}", json=request_data)
+            assert response.status_code == 200
+            assert response.json()["trinity_recommendation"] == "ANALYSIS_ERROR"
+            mock_store.save.assert_not_awaited()
+
+            # A successful analysis is still stored
+            mock_gateway.analyze_with_ultimate_trinity = AsyncMock(return_value=TestData.sample_trinity_analysis())
+            response = await client.post(f"/analyze/referendum/{TEST_REFERENDUM_ID}", json=request_data)
+            assert response.status_code == 200
+            mock_store.save.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_governance_analysis_stream_endpoint(self, client):
+        """Test SSE streaming of governance analysis"""
+        async def fake_stream(proposal, **routing):
+            yield {"event": "token", "model": "deepseek-r1:671b", "chunk": "APPROVE"}
+            yield {"event": "model_complete", "model": "deepseek-r1:671b"}
+            yield {"event": "synthesis", "analysis": TestData.sample_trinity_analysis()}
+
+        with patch('src.backend.polka_trinity_api.gateway_instance') as mock_gateway, \
+             patch('src.backend.polka_trinity_api.analysis_store', None):
+            mock_gateway.fetch_referendum_data = AsyncMock(return_value=TestData.sample_proposal())
+            mock_gateway.stream_ultimate_trinity = fake_stream
+
+            request_data = {"referendum_id": TEST_REFERENDUM_ID}
+            response = await client.post(f"/analyze/referendum/{TEST_REFERENDUM_ID}/stream", json=request_data)
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+
+            frames = [frame for frame in response.text.split("\n\n") if frame]
+            assert [frame.split("\n")[0] for frame in frames] == [
+                "event: token", "event: model_complete", "event: synthesis"
+            ]
+            synthesis = json.loads(frames[-1].split("\n")[1][len("data: "):])
+            assert synthesis["referendum_id"] == TEST_REFERENDUM_ID
+            assert synthesis["trinity_recommendation"] == "APPROVE"
+
+    @pytest.mark.asyncio
+    async def test_async_analysis_job(self, client):
+        """Test ?async=true queues the analysis and /jobs reports the result"""
+        queue = AnalysisJobQueue(InMemoryJobBackend(), _process_analysis_job, worker_count=1, poll_timeout=0.05)
+        with patch('src.backend.polka_trinity_api.gateway_instance') as mock_gateway, \
+             patch('src.backend.polka_trinity_api.analysis_store', None), \
+             patch('src.backend.polka_trinity_api.job_queue', queue):
+            mock_gateway.fetch_referendum_data = AsyncMock(return_value=TestData.sample_proposal())
+            mock_gateway.analyze_with_ultimate_trinity = AsyncMock(return_value=TestData.sample_trinity_analysis())
+
+            request_data = {"referendum_id": TEST_REFERENDUM_ID}
+            response = await client.post(f"/analyze/referendum/{TEST_REFERENDUM_ID}?async=true", json=request_data)
+            assert response.status_code == 202
+            job = response.json()
+            assert job["status"] == "queued"
+            mock_gateway.analyze_with_ultimate_trinity.assert_not_awaited()
+
+            await queue.start()
+            try:
+                for _ in range(50):
+                    job = (await client.get(job["status_url"])).json()
+                    if job["status"] == "completed":
+                        break
+                    await asyncio.sleep(0.02)
+            finally:
+                await queue.stop()
+
+            assert job["status"] == "completed"
+            assert job["result"]["trinity_recommendation"] == "APPROVE"
+            assert job["completed_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_redis_jobs_survive_lost_workers(self):
+        """Test jobs held by a dead consumer are requeued, then failed after max attempts"""
+        class FakeRedis:
+            """In-memory subset of the redis.asyncio list/key commands the backend uses"""
+            def __init__(self):
+                self.lists, self.values = {}, {}
+
+            async def lpush(self, key, value):
+                self.lists.setdefault(key, []).insert(0, value)
+
+            async def lmove(self, src, dst, wherefrom="RIGHT", whereto="LEFT"):
+                if not self.lists.get(src):
+                    return None
+                value = self.lists[src].pop()
+                target = self.lists.setdefault(dst, [])
+                target.append(value) if whereto == "RIGHT" else target.insert(0, value)
+                return value
+
+            async def blmove(self, src, dst, timeout, wherefrom="RIGHT", whereto="LEFT"):
+                value = await self.lmove(src, dst, wherefrom, whereto)
+                if value is None:
+                    await asyncio.sleep(0.01)
+                return value
+
+            async def lrem(self, key, count, value):
+                if value in self.lists.get(key, []):
+                    self.lists[key].remove(value)
+
+            async def llen(self, key):
+                return len(self.lists.get(key, []))
+
+            async def scan_iter(self, match):
+                import fnmatch
+                for key in [k for k, v in self.lists.items() if v and fnmatch.fnmatch(k, match)]:
+                    yield key
+
+            async def set(self, key, value, ex=None):
+                self.values[key] = value
+
+            async def get(self, key):
+                return self.values.get(key)
+
+            async def exists(self, key):
+                return int(key in self.values)
+
+            async def delete(self, key):
+                self.values.pop(key, None)
+
+            async def close(self):
+                pass
+
+        fake = FakeRedis()
+        crashed = RedisJobBackend(fake)
+        for referendum_id, attempts in ((1, 1), (2, 3)):
+            job = AnalysisJob(job_id=f"job-{referendum_id}", referendum_id=referendum_id, request={})
+            await crashed.enqueue(job)
+            assert await crashed.dequeue(1) == job.job_id
+            job.status, job.attempts = JobStatus.RUNNING, attempts
+            await crashed.save(job)
+        # The crashed consumer never acked and its heartbeat is gone
+
+        handled = []
+        async def handler(job):
+            handled.append(job.job_id)
+            return {"ok": True}
+
+        queue = AnalysisJobQueue(RedisJobBackend(fake), handler, worker_count=1,
+                                 poll_timeout=0.05, recovery_interval=0.05, max_attempts=3)
+        await queue.start()
+        try:
+            for _ in range(100):
+                if (await queue.get("job-1")).status == JobStatus.COMPLETED:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await queue.stop()
+
+        recovered = await queue.get("job-1")
+        assert recovered.status == JobStatus.COMPLETED and recovered.attempts == 2
+        abandoned = await queue.get("job-2")
+        assert abandoned.status == JobStatus.FAILED and "Worker lost" in abandoned.error
+        assert handled == ["job-1"]
+        assert not any(items for key, items in fake.lists.items() if ":processing:" in key)
+
     @pytest.mark.asyncio
     async def test_proposal_data_endpoint(self, client):
         """Test proposal data retrieval endpoint"""
@@ -638,6 +1382,496 @@ class TestEnterpriseFeatures:
         enterprise_user_capacity = float('inf')  # Unlimited claim
         assert enterprise_user_capacity > 10000  # Conservative validation
 
+    @pytest.mark.asyncio
+    async def test_priority_admission_scheduler(self):
+        """Test flagship slots go to higher priorities while aging prevents starvation"""
+        scheduler = PriorityAdmissionScheduler(max_concurrent=1, aging_seconds=60.0)
+        admitted = []
+
+        async def request(priority: int, name: str):
+            async with scheduler.slot(priority):
+                admitted.append(name)
+                await asyncio.sleep(0)
+
+        await scheduler.acquire(1)  # Occupy the only slot
+        waiters = [
+            asyncio.create_task(request(5, "bulk")),
+            asyncio.create_task(request(3, "standard")),
+            asyncio.create_task(request(1, "interactive"))
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.stats()["queued"] == {"1": 1, "2": 0, "3": 1, "4": 0, "5": 1}
+
+        scheduler.release()
+        await asyncio.gather(*waiters)
+        assert admitted == ["interactive", "standard", "bulk"]
+
+        # A long-waiting bulk request outranks a fresh interactive one
+        scheduler.aging_seconds = 0.01
+        admitted.clear()
+        await scheduler.acquire(1)
+        bulk = asyncio.create_task(request(5, "bulk"))
+        await asyncio.sleep(0.1)
+        interactive = asyncio.create_task(request(1, "interactive"))
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(bulk, interactive)
+        assert admitted == ["bulk", "interactive"]
+
+        # Cancelled waiters leave the queue without leaking slots
+        await scheduler.acquire(1)
+        abandoned = asyncio.create_task(request(2, "abandoned"))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        await asyncio.gather(abandoned, return_exceptions=True)
+        scheduler.release()
+        assert scheduler.stats()["active"] == 0
+        assert scheduler.queued == 0
+
+        # A slot released before the cancelled task resumes skips its waiter
+        await scheduler.acquire(1)
+        abandoned = asyncio.create_task(request(2, "abandoned"))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        scheduler.release()
+        await asyncio.gather(abandoned, return_exceptions=True)
+        assert abandoned.cancelled()
+        assert scheduler.stats()["active"] == 0
+        assert scheduler.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_aimd_concurrency_limiter(self):
+        """Test per-model limits grow additively and back off multiplicatively"""
+        limiter = AIMDConcurrencyLimiter("deepseek-r1:671b", latency_target_seconds=1.0, initial_limit=2, max_limit=4)
+        assert limiter.scheduler.max_concurrent == 2
+
+        # Fast responses add roughly one slot per window of requests
+        for _ in range(3):
+            limiter.on_success(0.2)
+        assert limiter.scheduler.max_concurrent == 3
+        for _ in range(20):
+            limiter.on_success(0.2)
+        assert limiter.scheduler.max_concurrent == 4  # Capped at max_limit
+
+        # A slow response cuts the limit; a burst within the cooldown counts once
+        limiter.on_success(5.0)
+        limiter.on_success(5.0)
+        assert limiter.scheduler.max_concurrent == 2
+        assert limiter.decreases == 1
+
+        # Errors raised inside a slot are overload signals too
+        limiter._last_decrease = float("-inf")
+        with pytest.raises(TimeoutError):
+            async with limiter.slot(priority=1):
+                raise TimeoutError("generation timed out")
+        assert limiter.scheduler.max_concurrent == 1
+        assert limiter.stats()["active"] == 0
+
+        # Refused or rejected requests say nothing about model load
+        limiter.limit = 3.0
+        limiter._last_decrease = float("-inf")
+        for error in (CircuitOpenError("qwen3:235b", 30.0), UpstreamStatusError(400, "bad request")):
+            with pytest.raises(type(error)):
+                async with limiter.slot(priority=1):
+                    raise error
+        assert limiter.limit == 3.0
+        assert limiter.decreases == 2
+
+        # Models are limited independently
+        coordinator = UltimateAITrinityCoordinator(max_concurrent_requests=9)
+        assert {m: l.scheduler.max_concurrent for m, l in coordinator.concurrency_limiters.items()} == {
+            m: 3 for m in CoordinatorTrinityModel
+        }
+
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.post')
+    async def test_aimd_limits_grow_on_long_generations(self, mock_post):
+        """Test flagship limits follow per-token decode latency, not whole-generation time"""
+        coordinator = UltimateAITrinityCoordinator(max_concurrent_requests=9)
+        limiter = coordinator.concurrency_limiters[CoordinatorTrinityModel.QWEN3]
+        assert limiter.scheduler.max_concurrent == 3
+
+        # A 3-minute, 3000-token generation decodes at 0.06s/token: healthy
+        generation = {"response": "APPROVE", "eval_count": 3000, "eval_duration": 180_000_000_000,
+                      "total_duration": 195_000_000_000}
+        mock_post.return_value.__aenter__.return_value.status = 200
+        mock_post.return_value.__aenter__.return_value.json = AsyncMock(return_value=generation)
+        model = CoordinatorTrinityModel.QWEN3.value
+        for i in range(12):
+            payload = {"model": model, "prompt": f"p{i}", "stream": False, "options": {"num_predict": 4000}}
+            await coordinator._generate(model, limiter, f"p{i}", payload, priority=1)
+        assert limiter.scheduler.max_concurrent > 3
+        assert limiter.decreases == 0
+
+        # Slow decoding under load shrinks it; a slot without decode metadata is no signal
+        before = limiter.scheduler.max_concurrent
+        async with limiter.slot(priority=1) as latency:
+            latency.report(0.4)
+        assert limiter.scheduler.max_concurrent < before
+        limit = limiter.limit
+        async with limiter.slot(priority=1):
+            pass
+        assert limiter.limit == limit
+        await coordinator.cleanup()
+
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.post')
+    async def test_coordinator_stream_retries_before_first_token(self, mock_post):
+        """Test coordinator streaming retries connection failures only before output starts"""
+        class NDJSONContent:
+            def __init__(self, fail_after_first: bool = False, truncated: bool = False):
+                self.fail_after_first = fail_after_first
+                self.truncated = truncated
+
+            def __aiter__(self):
+                return self._iterate()
+
+            async def _iterate(self):
+                yield (json.dumps({"response": "APPROVE ", "done": False}) + "\n").encode()
+                if self.fail_after_first:
+                    raise aiohttp.ClientConnectionError("reset")
+                if self.truncated:
+                    return
+                yield (json.dumps({"response": "", "done": True, "eval_count": 1}) + "\n").encode()
+
+        def stream_response(content):
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=MagicMock(status=200, content=content))
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        coordinator = UltimateAITrinityCoordinator(
+            upstream_policies=UpstreamPolicies({"qwen3:235b": {"backoff_base": 0.001}})
+        )
+        request = TrinityRequest(
+            content="Assess treasury spend",
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.MODERATE
+        )
+
+        # A refused connection before any token is retried
+        mock_post.side_effect = [aiohttp.ClientConnectionError("refused"), stream_response(NDJSONContent())]
+        events = asyncio.Queue()
+        response = await coordinator.stream_with_flagship_model(CoordinatorTrinityModel.QWEN3, request, events)
+        assert response.content == "APPROVE "
+        assert mock_post.call_count == 2
+        assert coordinator.upstream_policies.stats()["qwen3:235b"]["retries"] == 1
+
+        # Once a token reached the caller the failure is not retried
+        mock_post.reset_mock()
+        mock_post.side_effect = [stream_response(NDJSONContent(fail_after_first=True)), stream_response(NDJSONContent())]
+        request.content = "Assess a different treasury spend"
+        response = await coordinator.stream_with_flagship_model(CoordinatorTrinityModel.QWEN3, request, events)
+        assert mock_post.call_count == 1
+        assert "reset" in response.metadata["error"]
+
+        # A body that ends without the done chunk fails and is not cached
+        mock_post.reset_mock()
+        mock_post.side_effect = [stream_response(NDJSONContent(truncated=True)), stream_response(NDJSONContent())]
+        request.content = "Assess a truncated treasury spend"
+        response = await coordinator.stream_with_flagship_model(CoordinatorTrinityModel.QWEN3, request, events)
+        assert "final chunk" in response.metadata["error"]
+        response = await coordinator.stream_with_flagship_model(CoordinatorTrinityModel.QWEN3, request, events)
+        assert response.content == "APPROVE "
+        assert mock_post.call_count == 2
+        await coordinator.cleanup()
+
+    def test_keyword_scoring_equivalence(self):
+        """Test matcher-based confidence and reasoning scores equal per-keyword scanning"""
+        import random
+        coordinator = UltimateAITrinityCoordinator()
+
+        def reference_scores(content: str, model: CoordinatorTrinityModel):
+            capability = coordinator.model_capabilities[model]
+            if not content or "error" in content.lower():
+                confidence = 0.0
+            else:
+                words = len(content.split())
+                specs = sum(1 for spec in capability.specializations
+                            if any(keyword in content.lower() for keyword in spec.lower().split()))
+                reasoning = sum(1 for i in coordinator.REASONING_INDICATORS if i in content.lower())
+                confidence = (
+                    (0.8 if words > 100 else 0.6 if words > 50 else 0.4)
+                    + min(specs / len(capability.specializations), 1.0)
+                    + min(reasoning / len(coordinator.REASONING_INDICATORS), 1.0)
+                ) / 3
+            indicators, full_score = coordinator.QUALITY_INDICATORS[model]
+            quality = min(sum(1 for i in indicators if i in content.lower()) / full_score, 1.0) if content else 0.0
+            if content and ("1." in content or "•" in content or "First," in content):
+                quality = min(quality + 0.2, 1.0)
+            return confidence, quality
+
+        vocabulary = (
+            "Because THEREFORE analysis evidence conclusion calculate formula Probability statistical "
+            "quantitative Strategic risk opportunity plan decision recommendation international Cultural "
+            "global regional perspective Mathematical economic modeling Planning intelligence Scenario "
+            "Geopolitical market dynamics errors disadvantaged • 1. First, the proposal treasury"
+        ).split()
+        rng = random.Random(20)
+        samples = [""] + [" ".join(rng.choices(vocabulary, k=rng.randint(1, 160))) for _ in range(300)]
+        for model in CoordinatorTrinityModel:
+            capability = coordinator.model_capabilities[model]
+            for content in samples:
+                expected_confidence, expected_quality = reference_scores(content, model)
+                assert float(coordinator._calculate_confidence(content, capability)) == pytest.approx(expected_confidence)
+                assert coordinator._assess_reasoning_quality(content, model) == pytest.approx(expected_quality)
+                assert coordinator._score_content(content, model) == pytest.approx((expected_confidence, expected_quality))
+
+        # Building a response scans it once for both scores
+        request = TrinityRequest(
+            content="Assess treasury spend",
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.MODERATE
+        )
+        with patch.object(coordinator.keyword_matcher, "find", wraps=coordinator.keyword_matcher.find) as find:
+            response = coordinator._build_model_response(
+                CoordinatorTrinityModel.DEEPSEEK_R1, request, samples[1], time.time()
+            )
+        assert find.call_count == 1
+        assert (response.confidence, response.reasoning_quality) == pytest.approx(
+            reference_scores(samples[1], CoordinatorTrinityModel.DEEPSEEK_R1)
+        )
+
+        # Overlapping keywords are all reported
+        assert KeywordMatcher(["plan", "planning", "anning"]).find("PLANNING ahead") == {"plan", "planning", "anning"}
+        assert KeywordMatcher([]).find("anything") == set()
+
+    @pytest.mark.asyncio
+    async def test_cpu_offload_keeps_event_loop_responsive(self):
+        """Test large CPU-bound steps run in the pool while small ones stay inline"""
+        offloader = CPUOffloader("test", max_workers=2, min_offload_size=1000)
+        assert await offloader.run(10, len, "inline") == 6
+        assert offloader.stats()["inline"] == 1
+
+        # A blocking step above the threshold must not stall other coroutines
+        ticks = []
+        async def ticker():
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks.append(time.perf_counter())
+        started = time.perf_counter()
+        result, _ = await asyncio.gather(offloader.run(5000, lambda: time.sleep(0.3) or "done"), ticker())
+        assert result == "done"
+        assert ticks[-1] - started < 0.2
+        assert offloader.stats()["offloaded"] == 1 and offloader.in_flight == 0
+        offloader.shutdown()
+
+        # Gateway parsers are staticmethods, so they also run in worker processes
+        process_offloader = CPUOffloader("test-process", max_workers=1, mode="process", min_offload_size=0)
+        response = "Mathematical soundness: 8/10, risk 3/10. We recommend approval."
+        parsed = await process_offloader.run(len(response), PolkadotGateway._parse_deepseek_response, response)
+        assert parsed == PolkadotGateway._parse_deepseek_response(response)
+        process_offloader.shutdown()
+        with pytest.raises(ValueError):
+            CPUOffloader("test", mode="fiber")
+
+        # Coordinator scoring of a large response is offloaded
+        coordinator = UltimateAITrinityCoordinator(cpu_offload_min_chars=1000)
+        request = TrinityRequest(
+            content="Assess treasury spend",
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.MODERATE
+        )
+        content = "Because the statistical analysis holds, we calculate a positive outcome. " * 40
+        with patch.object(coordinator, "_generate", AsyncMock(return_value=(content, None))):
+            response = await coordinator.analyze_with_flagship_model(CoordinatorTrinityModel.DEEPSEEK_R1, request)
+        assert response.content == content and response.confidence > 0
+        assert coordinator.cpu_offload.stats()["offloaded"] == 1
+        await coordinator.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_shared_http_client_pool(self):
+        """Test gateway and coordinator share one bounded, instrumented connection pool"""
+        from aiohttp import web
+
+        async def slow_ok(request):
+            await asyncio.sleep(0.05)
+            return web.json_response({"status": "ok"})
+
+        app = web.Application()
+        app.router.add_get("/ok", slow_ok)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        http_client = HTTPClientManager("test", limit_per_host=2)
+        gateway = PolkadotGateway(http_client=http_client)
+        coordinator = UltimateAITrinityCoordinator(http_client=http_client)
+        try:
+            await gateway.__aenter__()
+            async with coordinator.get_session() as coordinator_session:
+                assert coordinator_session is gateway.session
+
+            async def fetch():
+                async with gateway.session.get(f"http://127.0.0.1:{port}/ok") as response:
+                    return (await response.json())["status"]
+
+            assert await asyncio.gather(*(fetch() for _ in range(6))) == ["ok"] * 6
+            stats = http_client.stats()
+            assert stats["connections_created"] <= 2  # Per-host limit holds across callers
+            assert stats["connections_reused"] >= 4
+            assert stats["connection_wait_seconds_total"] > 0
+            assert stats["requests_in_flight"] == 0
+
+            # Components never close a pool they were given
+            await gateway.__aexit__(None, None, None)
+            await coordinator.cleanup()
+            assert http_client.stats()["open"]
+        finally:
+            await http_client.close()
+            await runner.cleanup()
+        assert not http_client.stats()["open"]
+
+    @pytest.mark.asyncio
+    async def test_cascade_mode_escalation(self):
+        """Test cascade answers routine requests and escalates low-confidence ones"""
+        coordinator = UltimateAITrinityCoordinator(cascade_model="llama3.1:8b")
+        confident = (
+            "1. We calculate the treasury formula because the probability model is quantitative. "
+            "Statistical evidence supports the analysis; therefore our conclusion is to approve. "
+        ) * 8
+        coordinator._generate = AsyncMock(return_value=(confident, None))
+        request = TrinityRequest(
+            content="Is a 1,000 DOT audit budget reasonable?",
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.SIMPLE,
+            cascade=True
+        )
+
+        analysis = await coordinator.coordinate_ultimate_trinity_analysis(request)
+        assert analysis.metadata["models_used"] == ["llama3.1:8b"]
+        assert analysis.flagship_responses == []
+        assert analysis.metadata["cascade"]["escalated"] is False
+        assert coordinator._generate.call_count == 1
+
+        # A weak cascade answer escalates to the selected flagship models
+        coordinator._generate = AsyncMock(return_value=("Looks fine.", None))
+        escalated = TrinityRequest(
+            content="Should the runtime upgrade ship this epoch?",
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.SIMPLE,
+            cascade=True
+        )
+        analysis = await coordinator.coordinate_ultimate_trinity_analysis(escalated)
+        selected = coordinator._select_request_models(escalated)
+        assert coordinator._generate.call_count == 1 + len(selected)
+        assert analysis.metadata["cascade"]["escalated"] is True
+        assert analysis.metadata["models_used"] == [model.value for model in selected]
+        assert coordinator.cascade_stats()["escalation_rate"] == 0.5
+
+    def test_prompt_token_budget(self):
+        """Test coordinator prompts fit per-model budgets and trim at sentence ends"""
+        coordinator = UltimateAITrinityCoordinator()
+        short = TrinityRequest(
+            content="Assess the treasury spend for runtime audits.",
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.MODERATE
+        )
+        prompt = coordinator._optimize_prompt_for_model(CoordinatorTrinityModel.DEEPSEEK_R1, short)
+        assert prompt.startswith(short.content)
+        assert "rigorous mathematical reasoning" in prompt
+        assert "Infrastructure Sovereignty" not in prompt
+
+        long_request = TrinityRequest(
+            content=" ".join(f"Sentence number {i} describes the proposal." for i in range(2000)),
+            analysis_type=TrinityAnalysisType.ECONOMIC_VERIFICATION,
+            complexity=CoordinatorComplexity.MODERATE
+        )
+        budget = coordinator.PROMPT_TOKEN_BUDGETS[CoordinatorTrinityModel.QWEN3]
+        built = coordinator.prompt_builder.build(
+            CoordinatorTrinityModel.QWEN3.value, budget, long_request,
+            coordinator.model_capabilities[CoordinatorTrinityModel.QWEN3]
+        )
+        assert built.trimmed
+        assert built.estimated_tokens <= budget
+        assert built.dropped_sections == ["specializations"]
+        assert built.text.split("\n\n")[0].endswith("the proposal. [...]")
+        assert "global perspective" in built.text
+
+        text, cut = trim_to_sentences("One sentence here. Another one follows without end", 7)
+        assert cut and text == "One sentence here. [...]"
+        assert estimate_tokens("abcd" * 10) == 10
+
+    @pytest.mark.asyncio
+    @patch('aiohttp.ClientSession.post')
+    @patch('aiohttp.ClientSession.get')
+    async def test_model_warmup_keep_alive(self, mock_get, mock_post):
+        """Test keep_alive follows traffic and evicted busy models are re-warmed"""
+        pool = ModelEndpointPool({}, default_endpoints=[TEST_TRINITY_ENDPOINT])
+        warmup = ModelWarmupManager(pool, ["deepseek-r1:671b", "qwen3:235b"], busy_threshold=2)
+        assert warmup.keep_alive_for("deepseek-r1:671b") == "10m"
+        warmup.record_request("deepseek-r1:671b")
+        warmup.record_request("deepseek-r1:671b")
+        assert warmup.keep_alive_for("deepseek-r1:671b") == "60m"
+        assert warmup.keep_alive_for("qwen3:235b") == "10m"
+
+        # Only the busy model is reloaded after eviction
+        mock_get.return_value.__aenter__.return_value.status = 200
+        mock_get.return_value.__aenter__.return_value.json = AsyncMock(return_value={"models": []})
+        mock_post.return_value.__aenter__.return_value.status = 200
+        mock_post.return_value.__aenter__.return_value.read = AsyncMock(return_value=b"{}")
+        await warmup.start()
+        warmup._task.cancel()
+        try:
+            await warmup.refresh()
+        finally:
+            await warmup.stop()
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.kwargs["json"] == {
+            "model": "deepseek-r1:671b", "prompt": "", "stream": False, "keep_alive": "60m"
+        }
+        stats = warmup.stats()["models"]
+        assert stats["deepseek-r1:671b"]["state"] == "loaded"
+        assert stats["qwen3:235b"]["state"] == "unloaded"
+
+        # Active hours keep every model resident
+        warmup.active_hours = ModelWarmupManager.parse_active_hours("22-6")
+        assert warmup.in_active_hours(datetime(2025, 1, 1, 23, tzinfo=timezone.utc))
+        assert not warmup.in_active_hours(datetime(2025, 1, 1, 12, tzinfo=timezone.utc))
+
+    @pytest.mark.asyncio
+    async def test_model_endpoint_pool_balancing(self):
+        """Test least-outstanding-requests routing and failure ejection"""
+        pool = ModelEndpointPool.from_config(
+            json.dumps({"deepseek-r1:671b": ["http://node-a:11434", "http://node-b:11434/"]}),
+            default_endpoint=TEST_TRINITY_ENDPOINT,
+            failure_threshold=2,
+            ejection_seconds=60.0
+        )
+        assert [e.base_url for e in pool.endpoints_for("qwen3:235b")] == [TEST_TRINITY_ENDPOINT]
+
+        async with pool.lease("deepseek-r1:671b") as first:
+            async with pool.lease("deepseek-r1:671b") as second:
+                assert {first.base_url, second.base_url} == {"http://node-a:11434", "http://node-b:11434"}
+                assert first.in_flight == second.in_flight == 1
+        assert second.generate_url == f"{second.base_url}/api/generate"
+
+        # Repeated failures eject node-a; traffic moves to node-b
+        node_a = pool.endpoints_for("deepseek-r1:671b")[0]
+        with pytest.raises(ConnectionError):
+            async with pool.lease("deepseek-r1:671b") as endpoint:
+                assert endpoint is node_a
+                raise ConnectionError("connection refused")
+        assert node_a.is_healthy(time.monotonic())
+
+        # Request errors and cancellations do not count against either node
+        for error in (UpstreamStatusError(404, "model not found"), UpstreamStatusError(400), asyncio.CancelledError()):
+            with pytest.raises(type(error)):
+                async with pool.lease("deepseek-r1:671b"):
+                    raise error
+        assert sum(e.total_failures for e in pool.endpoints_for("deepseek-r1:671b")) == 1
+        assert is_endpoint_failure(UpstreamStatusError(503)) and is_endpoint_failure(asyncio.TimeoutError())
+        pool.record_failure(node_a)
+        assert not node_a.is_healthy(time.monotonic())
+        for _ in range(3):
+            assert pool.select("deepseek-r1:671b").base_url == "http://node-b:11434"
+
+        stats = pool.stats()["deepseek-r1:671b"]
+        assert [entry["healthy"] for entry in stats] == [False, True]
+        assert all(entry["in_flight"] == 0 for entry in stats)
+
 class TestMarketDifferentiation:
     """Test market differentiation and competitive advantages"""
     
@@ -804,6 +2038,70 @@ class TestPerformanceBenchmarks:
         # Should not exceed 100MB increase for 100 proposals
         assert memory_increase < 100, f"Memory usage increased by {memory_increase:.2f}MB"
 
+    def test_response_scanner_speedup(self):
+        """Benchmark single-pass response scanning against per-helper extraction"""
+        import re
+
+        # Previous extraction: every helper lowercases the text and rebuilds its patterns
+        def per_helper_scan(text: str) -> Dict[str, Any]:
+            def score(metric: str) -> float:
+                for pattern in (rf"{metric}[:\s]*(\d+(?:\.\d+)?)[/\s]*10",
+                                rf"(\d+(?:\.\d+)?)[/\s]*10[:\s]*{metric}",
+                                rf"{metric}[:\s]*(\d+(?:\.\d+)?)"):
+                    match = re.search(pattern, text.lower())
+                    if match:
+                        return min(10.0, max(0.0, float(match.group(1))))
+                return 5.0
+
+            regions = {}
+            for region in ["north america", "europe", "asia", "oceania", "africa", "south america"]:
+                if region in text.lower():
+                    context = text.lower()[text.lower().find(region):text.lower().find(region) + 200]
+                    regions[region.title()] = "Positive" if "positive" in context else (
+                        "Negative" if "negative" in context else "Neutral")
+            return {
+                "mathematical_soundness": score("mathematical soundness"),
+                "risk_score": score("risk"),
+                "implementation_complexity": score("complexity"),
+                "regulatory_compliance": score("compliance"),
+                "cultural_impact": score("cultural"),
+                "regional_analysis": regions
+            }
+
+        def single_pass_scan(text: str) -> Dict[str, Any]:
+            scanner = ResponseScanner(text)
+            return {
+                "mathematical_soundness": scanner.score("mathematical soundness"),
+                "risk_score": scanner.score("risk"),
+                "implementation_complexity": scanner.score("complexity"),
+                "regulatory_compliance": scanner.score("compliance"),
+                "cultural_impact": scanner.score("cultural"),
+                "regional_analysis": scanner.regional_breakdown()
+            }
+
+        # ~2048-token responses at batch scale
+        paragraph = (
+            "Mathematical soundness: 7.5/10 and a risk score of 3/10. Europe is broadly positive, "
+            "Asia mixed with negative notes and North America neutral. Compliance 8/10, cultural 6/10. "
+        )
+        responses = [paragraph * 40 + f"Referendum {i}." for i in range(200)]
+
+        def best_of_three(scan) -> float:
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                for response in responses:
+                    scan(response)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        assert all(single_pass_scan(r) == per_helper_scan(r) for r in responses[:5])
+        per_helper_time = best_of_three(per_helper_scan)
+        single_pass_time = best_of_three(single_pass_scan)
+        assert single_pass_time < per_helper_time, (
+            f"per-helper {per_helper_time * 1000:.1f}ms, single-pass {single_pass_time * 1000:.1f}ms"
+        )
+
 # Integration Tests
 
 @pytest.mark.integration